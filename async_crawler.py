@@ -0,0 +1,156 @@
+"""
+asyncio 기반 대량 URL 가져오기 엔진
+aiohttp로 전체/호스트별 동시 연결 수를 제한하며 많은 URL을 동시에 가져오고,
+가져온 문서는 프로세스 풀(ParsePool)에서 파싱
+(선택 의존성: pip install aiohttp)
+"""
+
+import time
+import asyncio
+from http_fetcher import (check_content_type, check_body_size, DEFAULT_HEADERS, DEFAULT_MAX_BODY_BYTES,
+                          DEFAULT_ALLOWED_CONTENT_TYPES, DEFAULT_CHUNK_SIZE)
+from html_extraction import extract_elements, DEFAULT_PARSER
+from encoding_detection import EncodingResolver
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+DEFAULT_MAX_CONNECTIONS = 200
+DEFAULT_PER_HOST_LIMIT = 8
+
+
+class AsyncCrawler:
+    def __init__(self, max_connections=DEFAULT_MAX_CONNECTIONS, per_host_limit=DEFAULT_PER_HOST_LIMIT,
+                 timeout=30, fetcher=None, parse_pool=None, html_parser=DEFAULT_PARSER, profiler=None, boilerplate=None,
+                 encoding_resolver=None, max_bytes=DEFAULT_MAX_BODY_BYTES,
+                 allowed_types=DEFAULT_ALLOWED_CONTENT_TYPES):
+        """
+        max_connections: 전체 동시 요청 수 (처리 중인 URL 수도 이 값으로 제한하여 메모리 사용량을 묶어 둠)
+        per_host_limit: 호스트당 동시 요청 수
+        fetcher: 조건부 GET 검증값을 공유할 HttpFetcher (None이면 사용 안 함)
+        parse_pool: 파싱을 실행할 ParsePool (None이면 이벤트 루프 기본 스레드 풀에서 html_parser로 파싱)
+        profiler: 가져오기/파싱 시간을 기록할 PipelineProfiler (None이면 기록 안 함)
+        boilerplate: 파싱한 요소의 공통 문구를 셀 BoilerplateIndex (None이면 사용 안 함, skip이면 공통 문구를 뺀 목록 반환)
+        encoding_resolver: 본문 인코딩을 판별할 EncodingResolver (None이면 새로 만듦)
+        max_bytes: 받을 수 있는 최대 본문 크기 (넘으면 받는 도중 중단, None이면 제한 없음)
+        allowed_types: 본문을 받을 Content-Type 목록 (None이면 모두 허용)
+        """
+        if aiohttp is None:
+            raise ImportError("비동기 처리에는 aiohttp가 필요합니다: pip install aiohttp")
+
+        self.max_connections = max_connections
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.fetcher = fetcher
+        self.parse_pool = parse_pool
+        self.html_parser = html_parser
+        self.profiler = profiler
+        self.boilerplate = boilerplate
+        self.encoding_resolver = encoding_resolver or EncodingResolver()
+        self.max_bytes = max_bytes
+        self.allowed_types = allowed_types
+
+    async def fetch_document(self, session, url):
+        """URL 하나 가져오기 (반환값: 상태 코드, 응답 헤더, 본문 바이트)"""
+        headers = {}
+        if self.fetcher:
+            # 검증값 조회는 SQLite 접근이므로 이벤트 루프 밖에서 실행
+            loop = asyncio.get_running_loop()
+            headers = await loop.run_in_executor(None, self.fetcher.conditional_headers, url)
+
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304:
+                return 304, response.headers, b''
+
+            response.raise_for_status()
+            check_content_type(response.headers.get('Content-Type'), self.allowed_types)
+            check_body_size(response.content_length or 0, self.max_bytes)
+
+            # 조각 단위로 읽으며 최대 크기를 넘으면 중단 (Content-Length가 없거나 틀린 응답 대비)
+            chunks = []
+            received = 0
+            async for chunk in response.content.iter_chunked(DEFAULT_CHUNK_SIZE):
+                received += len(chunk)
+                check_body_size(received, self.max_bytes)
+                chunks.append(chunk)
+            return response.status, response.headers, b''.join(chunks)
+
+    async def process_url(self, session, url):
+        """가져오기 → 파싱 (반환값: (텍스트 요소 목록, 304로 이전 결과를 재사용했는지 여부))"""
+        loop = asyncio.get_running_loop()
+
+        started = time.perf_counter()
+        status, headers, content = await self.fetch_document(session, url)
+        if self.profiler:
+            self.profiler.record('fetch', time.perf_counter() - started, url)
+            self.profiler.count('bytes_fetched', len(content), url)
+
+        if status == 304 and self.fetcher:
+            previous = await loop.run_in_executor(None, self.fetcher.get_previous, url)
+            if previous:
+                return await self.observe(url, previous['elements']), True
+
+        # 통계적 판별까지 가면 CPU를 쓰므로 이벤트 루프 밖에서 디코딩
+        started = time.perf_counter()
+        html = await loop.run_in_executor(None, self.encoding_resolver.decode, url, content,
+                                          headers.get('Content-Type'))
+        if self.profiler:
+            self.profiler.record('decode', time.perf_counter() - started, url)
+
+        started = time.perf_counter()
+        if self.parse_pool:
+            text_elements = await self.parse_pool.parse_async(html)
+        else:
+            text_elements = await loop.run_in_executor(None, extract_elements, html, self.html_parser)
+        if self.profiler:
+            self.profiler.record('parse', time.perf_counter() - started, url)
+
+        if self.fetcher:
+            # 모든 요소를 저장하는 SQLite 쓰기이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+            await loop.run_in_executor(None, self.fetcher.remember, url, headers, text_elements)
+
+        return await self.observe(url, text_elements), False
+
+    async def observe(self, url, text_elements):
+        """번역/저장 후처리로 넘기기 전에 공통 문구를 셈 (요소마다 해시를 구하므로 이벤트 루프 밖에서 실행)"""
+        if self.boilerplate is None:
+            return text_elements
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.boilerplate.observe, url, text_elements)
+
+    async def crawl(self, urls, handle_result, result_executor=None):
+        """모든 URL을 동시에 처리
+
+        handle_result(index, url, text_elements, not_modified, error)는 result_executor에서 실행됨
+        (번역/파일 쓰기처럼 블로킹되는 후처리용)
+        """
+        loop = asyncio.get_running_loop()
+        connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.per_host_limit)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        results = [None] * len(urls)
+        numbered = enumerate(urls, 1)  # 작업자들이 함께 꺼내 쓰는 (URL 번호, URL)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=DEFAULT_HEADERS) as session:
+
+            async def worker():
+                # URL마다 코루틴을 만들지 않고 연결 수만큼의 작업자가 차례로 꺼내 처리
+                # 후처리가 끝날 때까지 다음 URL을 꺼내지 않으므로 후처리가 느리면 새 요청도 기다림
+                for index, url in numbered:
+                    try:
+                        text_elements, not_modified = await self.process_url(session, url)
+                        error = None
+                    except Exception as e:
+                        text_elements, not_modified, error = [], False, e
+
+                    results[index - 1] = await loop.run_in_executor(
+                        result_executor, handle_result, index, url, text_elements, not_modified, error
+                    )
+
+            await asyncio.gather(*(worker() for _ in range(min(self.max_connections, len(urls)))))
+            return results
+
+    def run(self, urls, handle_result, result_executor=None):
+        """동기 코드에서 호출하는 진입점"""
+        return asyncio.run(self.crawl(urls, handle_result, result_executor))
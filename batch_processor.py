@@ -1,21 +1,70 @@
 #!/usr/bin/env python3
 """
 배치 URL 처리 도구
-여러개의 URL을 한 번에 처리하여 각각 별도의 엑셀 파일로 저장하거나 하나의 파일에 통합
+여러개의 URL을 한 번에 처리하여 각각 별도의 결과 파일(xlsx, jsonl, parquet, arrow)로 저장하거나 하나의 파일에 통합
 """
 
 import os
 import csv
 import json
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 import threading
 from cli_extractor import CLIWebTextExtractor
+from translation_cache import DEFAULT_CACHE_PATH
+from translation_batch import DEFAULT_WORKERS_PER_LANGUAGE
+from async_crawler import AsyncCrawler, DEFAULT_MAX_CONNECTIONS, DEFAULT_PER_HOST_LIMIT
+from parse_pool import ParsePool
+from html_extraction import available_parsers, DEFAULT_PARSER
+from output_writers import available_formats, format_extension, DEFAULT_OUTPUT_FORMAT
+from element_store import ElementStore, DEFAULT_STATE_PATH
+from job_journal import JobJournal, JOURNAL_FILENAME
+from rate_limiter import DEFAULT_TRANSLATION_RATE
+from translator_backends import available_translators, DEFAULT_TRANSLATOR
+from http_fetcher import DEFAULT_MAX_BODY_BYTES
+from pipeline_profiler import PipelineProfiler, save_report, PROFILE_FILENAME
+from streaming_pipeline import bounded_map
+from boilerplate_index import BoilerplateIndex, DEFAULT_MIN_PAGES
 
 class BatchProcessor:
-    def __init__(self, max_workers=3):
-        self.extractor = CLIWebTextExtractor()
+    def __init__(self, max_workers=3, use_cache=True, cache_path=DEFAULT_CACHE_PATH,
+                 translation_workers=DEFAULT_WORKERS_PER_LANGUAGE, use_validators=True,
+                 use_async=False, max_connections=DEFAULT_MAX_CONNECTIONS, per_host_limit=DEFAULT_PER_HOST_LIMIT,
+                 parse_processes=None, html_parser=DEFAULT_PARSER, output_format=DEFAULT_OUTPUT_FORMAT,
+                 incremental=True, state_path=DEFAULT_STATE_PATH, resume=False,
+                 translation_rate=DEFAULT_TRANSLATION_RATE, translator=DEFAULT_TRANSLATOR,
+                 profile=False, cprofile=False, profile_path=None, max_page_bytes=DEFAULT_MAX_BODY_BYTES,
+                 boilerplate=True, skip_boilerplate=False, boilerplate_min_pages=DEFAULT_MIN_PAGES):
+        self.extractor = CLIWebTextExtractor(
+            use_cache=use_cache,
+            cache_path=cache_path,
+            translation_workers=translation_workers,
+            use_validators=use_validators,
+            html_parser=html_parser,
+            translation_rate=translation_rate,
+            translator=translator,
+            max_page_bytes=max_page_bytes
+        )
+        # 요소별 번역 상태를 저장하여 다시 실행할 때 바뀐 요소만 번역
+        namespace = self.extractor.translator.cache_namespace
+        self.extractor.element_store = ElementStore(state_path, namespace=namespace) if incremental else None
+        # 같은 사이트의 여러 페이지에 반복되는 공통 문구를 출력에서 제외 (skip_boilerplate)
+        # 번역 캐시를 끈 실행에서는 공통 문구를 한 번만 번역하도록 기본으로 사용 (캐시가 있으면 캐시가 같은 역할을 함)
+        if skip_boilerplate or (boilerplate and not use_cache):
+            self.extractor.boilerplate = BoilerplateIndex(boilerplate_min_pages, skip=skip_boilerplate)
+        # 단계별 시간 측정 (profile_path가 없으면 출력 디렉토리의 profile.json에 저장)
+        self.extractor.profiler = PipelineProfiler(enabled=profile or cprofile, cprofile=cprofile)
+        self.profile_path = profile_path
         self.max_workers = max_workers
+        self.use_async = use_async
+        self.max_connections = max_connections
+        self.per_host_limit = per_host_limit
+        # None이면 CPU 코어 수만큼, 0이면 프로세스 풀 없이 작업 스레드에서 파싱
+        self.parse_processes = parse_processes
+        self.output_format = output_format
+        # True이면 출력 디렉토리의 작업 기록에서 완료된 URL을 건너뛰고 이어서 실행
+        self.resume = resume
+        self.journal = None
         self.results = []
         self.lock = threading.Lock()
     
@@ -77,75 +126,203 @@ class BatchProcessor:
         
         print(f"총 {len(urls)}개의 URL을 처리합니다...")
         print(f"번역 언어: {', '.join(languages)}")
-        print(f"출력 디렉토리: {output_dir}")
+        print(f"출력 디렉토리: {output_dir} ({self.output_format})")
         print(f"최대 동시 처리: {self.max_workers}개")
+        print(f"번역기: {self.extractor.translator.name}")
+        if self.use_async:
+            print(f"비동기 가져오기: 최대 {self.max_connections}개 연결, 호스트당 {self.per_host_limit}개")
+        
+        # 작업 기록: URL별 상태와 번역이 끝난 요소를 바로 기록하여 중단되어도 이어서 실행 가능
+        self.journal = JobJournal(os.path.join(output_dir, JOURNAL_FILENAME))
+        self.results = self.journal.start(urls, {'languages': list(languages), 'output_format': self.output_format,
+                                                  'translator': self.extractor.translator.name},
+                                          self.resume)
+        pending = self.journal.pending_urls()
+        completed = len(self.results)
+        if completed:
+            print(f"이어서 실행: 완료된 {completed}개 URL을 건너뛰고 {len(pending)}개를 처리합니다.")
         print("-" * 50)
         
+        parse_pool = None
+        if self.parse_processes != 0 and pending:
+            parse_pool = ParsePool(self.parse_processes, self.extractor.html_parser)
+        self.extractor.parse_pool = parse_pool
+        self.extractor.journal = self.journal
+        
+        try:
+            if self.use_async:
+                successful, failed = self.process_url_list_async(pending, len(urls), output_dir, languages, parse_pool)
+            else:
+                successful, failed = self.process_url_list_threaded(pending, len(urls), output_dir, languages)
+            successful += completed
+        finally:
+            self.extractor.parse_pool = None
+            self.extractor.journal = None
+            if parse_pool:
+                parse_pool.close()
+            self.journal.close()
+            self.journal = None
+        
+        print("-" * 50)
+        print(f"처리 완료! 성공: {successful}개, 실패: {failed}개")
+        if self.extractor.cache:
+            print(self.extractor.cache.summary())
+        if self.extractor.element_store:
+            print(self.extractor.element_store.summary())
+        if self.extractor.boilerplate:
+            print(self.extractor.boilerplate.summary())
+        print(self.extractor.translator.summary())
+        print(self.extractor.encoding_resolver.summary())
+        if self.extractor.translator.requires_network:
+            print(self.extractor.rate_limiter.summary())
+        save_report(self.extractor.profiler, self.profile_path or os.path.join(output_dir, PROFILE_FILENAME))
+        
+        # 결과 리포트 생성
+        self.generate_report(output_dir, successful, failed)
+        
+        return successful > 0
+    
+    def output_path(self, output_dir, index, url):
+        """URL별 출력 파일 경로"""
+        return os.path.join(output_dir, f"웹텍스트_{index:03d}_{self.url_to_filename(url)}{format_extension(self.output_format)}")
+    
+    def process_url_list_threaded(self, pending, total, output_dir, languages):
+        """스레드 풀로 URL별 가져오기/파싱/번역 처리
+        
+        pending: 처리할 (URL 번호, URL) 목록, total: 전체 URL 수 (반환값: (성공 수, 실패 수))
+        """
         successful = 0
         failed = 0
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 작업 제출
-            future_to_url = {}
-            for i, url in enumerate(urls, 1):
-                output_file = os.path.join(output_dir, f"웹텍스트_{i:03d}_{self.url_to_filename(url)}.xlsx")
-                future = executor.submit(self.process_single_url, url, output_file, languages, i, len(urls))
-                future_to_url[future] = url
-            
-            # 결과 수집
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
+        def process(item):
+            i, url = item
+            return self.process_single_url(url, self.output_path(output_dir, i, url), languages, i, total)
+        
+        # 작업자 수의 몇 배까지만 제출해 두고 끝나는 대로 다음 URL을 제출 (URL이 많아도 대기 작업이 쌓이지 않음)
+        results = bounded_map(process, pending, self.max_workers, ordered=False)
+        try:
+            for (i, url), future in results:
                 try:
-                    result = future.result()
-                    if result:
+                    if future.result():
                         successful += 1
                     else:
                         failed += 1
                 except Exception as e:
                     print(f"❌ {url} - 처리 중 예외 발생: {str(e)}")
+                    self.record_failure(i, e)
                     failed += 1
+        except KeyboardInterrupt:
+            # 아직 시작하지 않은 URL은 취소 (완료된 URL은 작업 기록에 남아 --resume으로 이어서 실행)
+            results.close()
+            raise
         
-        print("-" * 50)
-        print(f"처리 완료! 성공: {successful}개, 실패: {failed}개")
+        return successful, failed
+    
+    def process_url_list_async(self, pending, total, output_dir, languages, parse_pool=None):
+        """asyncio로 가져오고 파싱은 프로세스 풀, 번역/저장은 스레드 풀에서 처리
         
-        # 결과 리포트 생성
-        self.generate_report(output_dir, successful, failed)
+        pending: 처리할 (URL 번호, URL) 목록, total: 전체 URL 수 (반환값: (성공 수, 실패 수))
+        """
+        crawler = AsyncCrawler(
+            max_connections=self.max_connections,
+            per_host_limit=self.per_host_limit,
+            fetcher=self.extractor.fetcher,
+            parse_pool=parse_pool,
+            boilerplate=self.extractor.boilerplate,
+            html_parser=self.extractor.html_parser,
+            profiler=self.extractor.profiler,
+            encoding_resolver=self.extractor.encoding_resolver,
+            max_bytes=self.extractor.fetcher.max_bytes,
+            allowed_types=self.extractor.fetcher.allowed_types
+        )
         
-        return successful > 0
+        def handle_result(position, url, text_elements, not_modified, error):
+            index = pending[position - 1][0]
+            if error is not None:
+                print(f"❌ [{index}/{total}] 오류: {url} - {str(error)}")
+                self.record_failure(index, error)
+                return False
+            
+            output_file = self.output_path(output_dir, index, url)
+            return self.finish_url(url, output_file, languages, text_elements, not_modified, index, total)
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as result_executor:
+            results = crawler.run([url for index, url in pending], handle_result, result_executor)
+        
+        successful = sum(1 for result in results if result)
+        return successful, len(pending) - successful
     
     def process_single_url(self, url, output_file, languages, current, total):
         """단일 URL 처리"""
         try:
             print(f"[{current}/{total}] 처리 시작: {url}")
             
-            text_elements = self.extractor.extract_text_from_url(url, verbose=False)
-            
+            text_elements, not_modified = self.extractor.fetch_elements(url, verbose=False)
+            return self.finish_url(url, output_file, languages, text_elements, not_modified, current, total)
+                
+        except Exception as e:
+            print(f"❌ [{current}/{total}] 오류: {url} - {str(e)}")
+            self.record_failure(current, e)
+            return False
+    
+    def record_failure(self, index, error):
+        """작업 기록에 URL 실패 기록 (이어서 실행하면 다시 처리)"""
+        if self.journal:
+            self.journal.mark_failed(index, error)
+    
+    def finish_url(self, url, output_file, languages, text_elements, not_modified, current, total):
+        """추출한 텍스트를 번역하여 저장하고 결과 기록"""
+        try:
             if not text_elements:
                 print(f"❌ [{current}/{total}] 텍스트 추출 실패: {url}")
+                self.record_failure(current, "텍스트 추출 실패")
                 return False
             
-            success = self.extractor.create_excel_file(text_elements, output_file, languages, verbose=False)
+            # 변경되지 않은 페이지는 파싱/번역 없이 이전 출력 파일 재사용
+            if not_modified and self.extractor.reuse_previous_output(url, output_file, languages, current):
+                success = True
+                status = 'not_modified'
+            else:
+                success = self.extractor.create_output_file(text_elements, output_file, languages, False,
+                                                            self.output_format, url, current)
+                status = 'success'
+                if success:
+                    self.extractor.fetcher.remember_output(url, output_file, languages, current)
             
             if success:
-                print(f"✅ [{current}/{total}] 완료: {os.path.basename(output_file)}")
+                if status == 'not_modified':
+                    print(f"✅ [{current}/{total}] 변경 없음 (이전 결과 재사용): {os.path.basename(output_file)}")
+                else:
+                    print(f"✅ [{current}/{total}] 완료: {os.path.basename(output_file)}")
                 
-                # 결과 기록
+                # 결과 기록 (요소 상태 저장소를 사용하면 재사용/새로 번역한 요소 수 포함)
+                reused, translated = None, None
+                if status == 'success' and self.extractor.element_store:
+                    reused, translated = self.extractor.element_store.url_counts.get(url, (None, None))
+                
+                result = {
+                    'url': url,
+                    'output_file': output_file,
+                    'text_count': len(text_elements),
+                    'reused_count': reused,
+                    'translated_count': translated,
+                    'status': status,
+                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                }
                 with self.lock:
-                    self.results.append({
-                        'url': url,
-                        'output_file': output_file,
-                        'text_count': len(text_elements),
-                        'status': 'success',
-                        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    })
+                    self.results.append(result)
+                if self.journal:
+                    self.journal.mark_done(current, result)
                 
                 return True
             else:
-                print(f"❌ [{current}/{total}] 엑셀 생성 실패: {url}")
+                print(f"❌ [{current}/{total}] 결과 파일 생성 실패: {url}")
+                self.record_failure(current, "결과 파일 생성 실패")
                 return False
                 
         except Exception as e:
             print(f"❌ [{current}/{total}] 오류: {url} - {str(e)}")
+            self.record_failure(current, e)
             return False
     
     def url_to_filename(self, url):
@@ -172,7 +349,21 @@ class BatchProcessor:
                 f.write(f"처리 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
                 f.write(f"성공: {successful}개\n")
                 f.write(f"실패: {failed}개\n")
-                f.write(f"총 처리: {successful + failed}개\n\n")
+                f.write(f"총 처리: {successful + failed}개\n")
+                if self.extractor.cache:
+                    cache_stats = self.extractor.cache.stats()
+                    f.write(f"번역 캐시 적중: {cache_stats['hits']}개\n")
+                    f.write(f"번역 캐시 미스: {cache_stats['misses']}개\n")
+                f.write(f"번역기: {self.extractor.translator.name}\n")
+                if self.extractor.translator.requires_network:
+                    limiter_stats = self.extractor.rate_limiter.stats()
+                    f.write(f"번역 요청: {limiter_stats['requests']}회 (재시도 {limiter_stats['retries']}회, "
+                            f"429 {limiter_stats['throttled']}회, 실패 {limiter_stats['failures']}회)\n")
+                if self.extractor.element_store:
+                    state_stats = self.extractor.element_store.stats()
+                    f.write(f"재사용한 요소: {state_stats['reused']}개\n")
+                    f.write(f"새로 번역한 요소: {state_stats['translated']}개\n")
+                f.write("\n")
                 
                 if self.results:
                     f.write("상세 결과:\n")
@@ -181,6 +372,8 @@ class BatchProcessor:
                         f.write(f"URL: {result['url']}\n")
                         f.write(f"파일: {os.path.basename(result['output_file'])}\n")
                         f.write(f"텍스트 수: {result['text_count']}개\n")
+                        if result['reused_count'] is not None:
+                            f.write(f"재사용/새로 번역: {result['reused_count']}개 / {result['translated_count']}개\n")
                         f.write(f"상태: {result['status']}\n")
                         f.write(f"시간: {result['timestamp']}\n")
                         f.write("-" * 30 + "\n")
@@ -238,6 +431,9 @@ def main():
   python batch_processor.py urls.txt
   python batch_processor.py urls.json -o results -l en zh-cn
   python batch_processor.py urls.csv --workers 5
+  python batch_processor.py urls.txt --format parquet
+  python batch_processor.py urls.txt --resume
+  python batch_processor.py urls.txt --async --max-connections 500 --per-host 8
   python batch_processor.py --create-sample
         """
     )
@@ -248,10 +444,55 @@ def main():
     parser.add_argument('-l', '--languages', nargs='+', 
                        default=['en', 'zh-cn', 'vi'],
                        help='번역할 언어 코드 (기본값: en zh-cn vi)')
+    parser.add_argument('-f', '--format', default=DEFAULT_OUTPUT_FORMAT, choices=available_formats(),
+                       help=f'출력 형식 (기본값: {DEFAULT_OUTPUT_FORMAT})')
     parser.add_argument('-w', '--workers', type=int, default=3,
                        help='동시 처리 스레드 수 (기본값: 3)')
+    parser.add_argument('-t', '--translation-workers', type=int, default=DEFAULT_WORKERS_PER_LANGUAGE,
+                       help=f'언어별 동시 번역 요청 수 (모든 URL이 함께 씀, 기본값: {DEFAULT_WORKERS_PER_LANGUAGE})')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                       help='asyncio로 많은 URL을 동시에 가져오기 (aiohttp 필요)')
+    parser.add_argument('--max-connections', type=int, default=DEFAULT_MAX_CONNECTIONS,
+                       help=f'비동기 모드 전체 동시 연결 수 (기본값: {DEFAULT_MAX_CONNECTIONS})')
+    parser.add_argument('--per-host', type=int, default=DEFAULT_PER_HOST_LIMIT,
+                       help=f'비동기 모드 호스트당 동시 연결 수 (기본값: {DEFAULT_PER_HOST_LIMIT})')
+    parser.add_argument('-p', '--parse-processes', type=int, default=None,
+                       help='HTML 파싱 프로세스 수 (기본값: CPU 코어 수, 0이면 작업 스레드에서 파싱)')
+    parser.add_argument('--parser', default=DEFAULT_PARSER, choices=available_parsers(),
+                       help=f'HTML 파서 백엔드 (기본값: {DEFAULT_PARSER}, lxml이 더 빠름. 잘못 중첩된 마크업(닫지 않은 p/li, '
+                            'p 안의 블록, a 안의 a)에서는 요소가 다르게 나뉠 수 있음)')
+    parser.add_argument('--refresh', action='store_true',
+                       help='저장된 ETag/Last-Modified를 무시하고 항상 새로 가져오기')
+    parser.add_argument('--max-page-size', type=float, default=DEFAULT_MAX_BODY_BYTES / 1024 / 1024,
+                       help=f'받을 수 있는 최대 페이지 크기 (MB, 넘으면 해당 URL 실패 처리, 기본값: {DEFAULT_MAX_BODY_BYTES // 1024 // 1024})')
     parser.add_argument('--create-sample', action='store_true',
                        help='샘플 URL 파일들 생성')
+    parser.add_argument('--translation-rate', type=float, default=DEFAULT_TRANSLATION_RATE,
+                       help=f'모든 작업자가 공유하는 초당 번역 요청 수 시작값 (자동 조절, 기본값: {DEFAULT_TRANSLATION_RATE})')
+    parser.add_argument('--translator', default=DEFAULT_TRANSLATOR, choices=available_translators(),
+                       help=f'번역기 백엔드 (기본값: {DEFAULT_TRANSLATOR}, argos는 오프라인 로컬 모델, stub은 부하 테스트용)')
+    parser.add_argument('--profile', action='store_true',
+                       help='단계별 시간(가져오기/파싱/번역/쓰기)을 URL별로 측정하여 요약 출력 및 JSON 저장')
+    parser.add_argument('--profile-output',
+                       help='측정 결과 JSON 경로 (기본값: 출력 디렉토리/profile.json)')
+    parser.add_argument('--cprofile', action='store_true',
+                       help='--profile과 함께 함수별 cProfile 결과도 수집 (.prof 파일과 상위 함수 출력)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='번역 캐시 사용 안 함')
+    parser.add_argument('--cache-file', default=DEFAULT_CACHE_PATH,
+                       help=f'번역 캐시 파일 경로 (기본값: {DEFAULT_CACHE_PATH})')
+    parser.add_argument('--resume', action='store_true',
+                       help='중단된 작업을 출력 디렉토리의 작업 기록에서 이어서 실행 (완료된 URL은 건너뜀)')
+    parser.add_argument('--no-incremental', action='store_true',
+                       help='요소별 번역 상태를 사용하지 않고 모든 요소를 다시 번역')
+    parser.add_argument('--skip-boilerplate', action='store_true',
+                       help='같은 사이트의 여러 페이지에 반복되는 공통 문구(메뉴, 쿠키 안내, 바닥글 등)를 페이지별 출력에서 제외')
+    parser.add_argument('--boilerplate-min-pages', type=int, default=DEFAULT_MIN_PAGES,
+                       help=f'공통 문구로 보는 최소 페이지 수 (기본값: {DEFAULT_MIN_PAGES})')
+    parser.add_argument('--no-boilerplate', action='store_true',
+                       help='번역 캐시를 끈 실행에서도 공통 문구를 찾지 않음 (페이지마다 모든 요소를 번역)')
+    parser.add_argument('--state-file', default=DEFAULT_STATE_PATH,
+                       help=f'요소 상태 파일 경로 (기본값: {DEFAULT_STATE_PATH})')
     
     args = parser.parse_args()
     
@@ -267,7 +508,31 @@ def main():
         print(f"❌ 파일을 찾을 수 없습니다: {args.input_file}")
         return
     
-    processor = BatchProcessor(max_workers=args.workers)
+    processor = BatchProcessor(
+        max_workers=args.workers,
+        use_cache=not args.no_cache,
+        cache_path=args.cache_file,
+        translation_workers=args.translation_workers,
+        use_validators=not args.refresh,
+        use_async=args.use_async,
+        max_connections=args.max_connections,
+        per_host_limit=args.per_host,
+        parse_processes=args.parse_processes,
+        html_parser=args.parser,
+        output_format=args.format,
+        incremental=not args.no_incremental,
+        state_path=args.state_file,
+        resume=args.resume,
+        translation_rate=args.translation_rate,
+        translator=args.translator,
+        profile=args.profile,
+        cprofile=args.cprofile,
+        profile_path=args.profile_output,
+        max_page_bytes=int(args.max_page_size * 1024 * 1024),
+        boilerplate=not args.no_boilerplate,
+        skip_boilerplate=args.skip_boilerplate,
+        boilerplate_min_pages=args.boilerplate_min_pages
+    )
     
     try:
         success = processor.process_urls_from_file(
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+중복 제거 성능 비교 벤치마크
+기존 방식(이전 요소 전체와 비교)과 ElementDeduplicator를 합성 페이지(10k+ 노드)에서 비교
+사용법: python benchmarks/bench_dedup.py [--nodes 10000] [--seed 42]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from text_dedup import ElementDeduplicator
+from text_element import TextElement
+
+SYLLABLES = "가나다라마바사아자차카타파하경영환사회지배구조전략목표성과보고서기술혁신고객가치투자안전품질인재협력에너지탄소"
+
+
+def build_vocabulary(rng, size=3000):
+    """실제 페이지와 비슷한 크기의 어휘 생성"""
+    return ["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 5))) for _ in range(size)]
+
+
+def random_sentence(rng, min_words=3, max_words=18):
+    return " ".join(rng.choice(rng.vocabulary) for _ in range(rng.randint(min_words, max_words)))
+
+
+def generate_cli_candidates(rng, node_count):
+    """CLI 추출 순서를 흉내낸 후보 목록 (제목 → 중첩 div/p/span 텍스트)"""
+    headings = []
+    contents = []
+
+    while len(headings) + len(contents) < node_count:
+        heading = random_sentence(rng, 3, 6)
+        paragraphs = [random_sentence(rng) for _ in range(rng.randint(1, 5))]
+
+        headings.append(('h2', heading))
+        # 부모 div 텍스트는 자식 텍스트를 모두 포함 (DOM 순서상 부모가 먼저)
+        contents.append(('div', heading + "".join(paragraphs)))
+        for paragraph in paragraphs:
+            contents.append(('p', paragraph))
+            if rng.random() < 0.3:
+                contents.append(('span', paragraph[:len(paragraph) // 2]))
+        # 부모 없이 단독으로 나오는 단락
+        contents.append(('p', random_sentence(rng)))
+
+    return headings, contents
+
+
+def generate_gui_candidates(rng, node_count):
+    """GUI 재귀 추출 순서를 흉내낸 후보 목록 (규칙, 태그, 텍스트)"""
+    candidates = []
+    recent = []
+
+    while len(candidates) < node_count:
+        roll = rng.random()
+        if roll < 0.15:
+            candidates.append(('exact', 'h2', random_sentence(rng, 1, 4)))
+        elif roll < 0.3:
+            candidates.append(('exact', 'span', random_sentence(rng, 1, 3)))
+        elif roll < 0.45 and recent:
+            # 기존 단락과 거의 같은 텍스트 (90% 이상 겹침)
+            base = rng.choice(recent)
+            if rng.random() < 0.5:
+                candidates.append(('overlap', 'p', base + "."))
+            else:
+                candidates.append(('overlap', 'li', base[:-1]))
+        else:
+            text = random_sentence(rng)
+            recent.append(text)
+            recent = recent[-50:]
+            candidates.append(('overlap', 'p', text))
+
+    return candidates
+
+
+def legacy_cli(headings, contents):
+    """기존 CLI 중복 제거"""
+    text_elements = []
+    for tag, text in headings:
+        text_elements.append(TextElement('heading', tag, text))
+
+    for tag, text in contents:
+        is_duplicate = False
+        for existing in text_elements:
+            if text in existing.text or existing.text in text:
+                is_duplicate = True
+                break
+
+        if not is_duplicate:
+            text_elements.append(TextElement('content', tag, text))
+
+    return text_elements
+
+
+def engine_cli(headings, contents):
+    dedup = ElementDeduplicator()
+    for tag, text in headings:
+        dedup.add(TextElement('heading', tag, text))
+
+    for tag, text in contents:
+        dedup.add_if_not_overlapping(TextElement('content', tag, text))
+
+    return dedup.elements()
+
+
+def legacy_gui(candidates):
+    """기존 GUI 중복 제거"""
+    text_elements = []
+    seen_texts = set()
+
+    for rule, tag, text_clean in candidates:
+        if rule == 'exact':
+            if text_clean not in seen_texts:
+                text_elements.append(TextElement('content', tag, text_clean))
+                seen_texts.add(text_clean)
+            continue
+
+        is_duplicate = False
+        for seen_text in seen_texts:
+            if text_clean == seen_text:
+                is_duplicate = True
+                break
+            if text_clean in seen_text and len(text_clean) > len(seen_text) * 0.9:
+                is_duplicate = True
+                break
+            if seen_text in text_clean and len(seen_text) > len(text_clean) * 0.9:
+                text_elements[:] = [elem for elem in text_elements if elem.text != seen_text]
+                seen_texts.discard(seen_text)
+                break
+
+        if not is_duplicate and text_clean:
+            text_elements.append(TextElement('content', tag, text_clean))
+            seen_texts.add(text_clean)
+
+    return text_elements
+
+
+def engine_gui(candidates):
+    dedup = ElementDeduplicator()
+
+    for rule, tag, text_clean in candidates:
+        element = TextElement('content', tag, text_clean)
+        if rule == 'exact':
+            if text_clean not in dedup:
+                dedup.add(element)
+        else:
+            dedup.add_or_replace(element)
+
+    return dedup.elements()
+
+
+def measure(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="중복 제거 성능 비교 벤치마크")
+    parser.add_argument('--nodes', type=int, default=10000, help='합성 페이지 노드 수 (기본값: 10000)')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드 (기본값: 42)')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    rng.vocabulary = build_vocabulary(rng)
+
+    print(f"=== 중복 제거 벤치마크 (노드 {args.nodes}개) ===\n")
+
+    headings, contents = generate_cli_candidates(rng, args.nodes)
+    legacy_result, legacy_time = measure(legacy_cli, headings, contents)
+    engine_result, engine_time = measure(engine_cli, headings, contents)
+    print("[CLI 규칙: 포함 관계]")
+    print(f"  기존 방식: {legacy_time:.3f}초 ({len(legacy_result)}개 요소)")
+    print(f"  새 엔진:   {engine_time:.3f}초 ({len(engine_result)}개 요소)")
+    print(f"  속도 향상: {legacy_time / engine_time:.1f}배")
+    print(f"  결과 일치: {'예' if legacy_result == engine_result else '아니오'}\n")
+
+    candidates = generate_gui_candidates(rng, args.nodes)
+    legacy_result, legacy_time = measure(legacy_gui, candidates)
+    engine_result, engine_time = measure(engine_gui, candidates)
+    print("[GUI 규칙: 90% 겹침]")
+    print(f"  기존 방식: {legacy_time:.3f}초 ({len(legacy_result)}개 요소)")
+    print(f"  새 엔진:   {engine_time:.3f}초 ({len(engine_result)}개 요소)")
+    print(f"  속도 향상: {legacy_time / engine_time:.1f}배")
+    print(f"  결과 일치: {'예' if legacy_result == engine_result else '아니오'}")
+
+
+if __name__ == "__main__":
+    main()
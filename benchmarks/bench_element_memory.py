@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+텍스트 요소 메모리 벤치마크
+benchmarks/corpus에서 추출한 요소를 여러 URL에서 나온 것처럼 반복하여 GUI가 합친 결과와 같은 크기로 만들고,
+요소마다 dict({'type', 'tag', 'text', 'url', 'url_index'})로 저장할 때와 TextElement로 저장할 때의
+요소당 메모리(tracemalloc, 텍스트 문자열 자체는 두 방식이 공유하므로 제외)를 비교
+사용법: python benchmarks/bench_element_memory.py [--elements 200000] [--min-reduction 0.4]
+"""
+
+import os
+import sys
+import glob
+import argparse
+import tracemalloc
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+
+from html_extraction import extract_elements
+from text_element import TextElement
+
+
+def load_records(corpus):
+    """코퍼스 페이지에서 추출한 (유형, 태그, 텍스트) 목록"""
+    records = []
+    for path in sorted(glob.glob(os.path.join(corpus, '*.html'))):
+        with open(path, 'rb') as f:
+            records.extend(element.to_record() for element in extract_elements(f.read()))
+    return records
+
+
+def build_dicts(records, urls, count):
+    elements = []
+    for i in range(count):
+        element_type, tag, text = records[i % len(records)]
+        url_index = i // len(records) % len(urls)
+        elements.append({'type': element_type, 'tag': tag, 'text': text,
+                         'url': urls[url_index], 'url_index': url_index + 1})
+    return elements
+
+
+def build_slotted(records, urls, count):
+    elements = []
+    for i in range(count):
+        element_type, tag, text = records[i % len(records)]
+        url_index = i // len(records) % len(urls)
+        elements.append(TextElement(element_type, tag, text, urls[url_index], url_index + 1))
+    return elements
+
+
+def measure(build, records, urls, count):
+    """요소 목록을 만드는 동안 늘어난 메모리 (바이트)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    elements = build(records, urls, count)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del elements
+    return used
+
+
+def main():
+    parser = argparse.ArgumentParser(description="텍스트 요소 메모리 벤치마크")
+    parser.add_argument('--corpus', default=os.path.join(BENCHMARK_DIR, 'corpus'),
+                        help='HTML 페이지 디렉토리 (기본값: benchmarks/corpus)')
+    parser.add_argument('--elements', type=int, default=200000, help='만들 요소 수 (기본값: 200000)')
+    parser.add_argument('--min-reduction', type=float, default=0.4,
+                        help='dict 대비 최소 메모리 감소 비율 (기본값: 0.4)')
+    args = parser.parse_args()
+
+    records = load_records(args.corpus)
+    if not records:
+        print(f"요소를 추출할 HTML 파일이 없습니다: {args.corpus}")
+        sys.exit(1)
+
+    urls = [f"https://example.com/page/{i}" for i in range(max(1, args.elements // len(records)))]
+    print(f"=== 텍스트 요소 메모리 벤치마크 (요소 {args.elements:,}개, URL {len(urls)}개) ===\n")
+
+    dict_bytes = measure(build_dicts, records, urls, args.elements)
+    slotted_bytes = measure(build_slotted, records, urls, args.elements)
+
+    for label, used in (("dict", dict_bytes), ("TextElement", slotted_bytes)):
+        print(f"  {label:<12} {used / 1024 / 1024:8.1f}MB, 요소당 {used / args.elements:6.1f}바이트")
+
+    reduction = 1 - slotted_bytes / dict_bytes
+    print(f"\n  감소: {reduction * 100:.0f}%")
+
+    if reduction < args.min_reduction:
+        print(f"\n❌ 메모리 감소가 기대치({args.min_reduction * 100:.0f}%)보다 작습니다")
+        sys.exit(1)
+
+    print(f"\n✅ 요소당 메모리 {dict_bytes / args.elements:.0f}바이트 → {slotted_bytes / args.elements:.0f}바이트")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+프로세스 풀 파싱 확장성 벤치마크
+저장된 HTML 페이지(또는 합성 페이지)를 프로세스 수를 바꿔가며 파싱하고 초당 처리 페이지 수를 비교
+사용법: python benchmarks/bench_parse_pool.py [--corpus 디렉토리] [--pages 200] [--max-processes N]
+"""
+
+import os
+import sys
+import time
+import glob
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_extraction import extract_elements
+from parse_pool import ParsePool, parse_to_records
+
+
+def generate_page(rng, sections=60):
+    """중첩 div와 단락이 섞인 합성 페이지"""
+    words = ["지속가능경영", "환경", "사회", "전략", "목표", "성과", "기술", "혁신", "고객", "가치", "투자", "안전"]
+    parts = ["<html><head><meta charset='utf-8'><title>page</title></head><body><main>"]
+    for section in range(sections):
+        parts.append(f"<section><h2>섹션 {section} {rng.choice(words)}</h2><div><div>")
+        for _ in range(rng.randint(2, 6)):
+            sentence = " ".join(rng.choice(words) for _ in range(rng.randint(5, 20)))
+            parts.append(f"<p>{sentence} {rng.randint(0, 10 ** 6)}</p><span>{sentence[:20]}</span>")
+        parts.append("<ul>" + "".join(f"<li>항목 {rng.randint(0, 10 ** 6)} {rng.choice(words)}</li>" for _ in range(5)) + "</ul>")
+        parts.append("</div></div></section>")
+    parts.append("</main></body></html>")
+    return "".join(parts).encode('utf-8')
+
+
+def load_corpus(corpus_dir, pages, seed):
+    """저장된 HTML 페이지를 읽거나, 없으면 합성 페이지 생성"""
+    if corpus_dir:
+        files = sorted(glob.glob(os.path.join(corpus_dir, '*.html')))
+        if not files:
+            print(f"HTML 파일을 찾을 수 없습니다: {corpus_dir}")
+            sys.exit(1)
+        documents = []
+        for path in files:
+            with open(path, 'rb') as f:
+                documents.append(f.read())
+        # 요청한 페이지 수만큼 반복
+        return [documents[i % len(documents)] for i in range(pages)]
+
+    rng = random.Random(seed)
+    return [generate_page(rng) for _ in range(pages)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프로세스 풀 파싱 확장성 벤치마크")
+    parser.add_argument('--corpus', help='저장된 HTML 페이지 디렉토리 (기본값: 합성 페이지)')
+    parser.add_argument('--pages', type=int, default=200, help='파싱할 페이지 수 (기본값: 200)')
+    parser.add_argument('--max-processes', type=int, default=os.cpu_count(),
+                        help='최대 프로세스 수 (기본값: CPU 코어 수)')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드 (기본값: 42)')
+    args = parser.parse_args()
+
+    documents = load_corpus(args.corpus, args.pages, args.seed)
+    total_bytes = sum(len(document) for document in documents)
+    print(f"=== 파싱 확장성 벤치마크 ({len(documents)}페이지, {total_bytes / 1024 / 1024:.1f}MB) ===\n")
+
+    start = time.perf_counter()
+    expected = [extract_elements(document) for document in documents]
+    baseline = time.perf_counter() - start
+    print(f"  단일 스레드: {baseline:.2f}초 ({len(documents) / baseline:.1f} 페이지/초)")
+
+    process_counts = []
+    count = 1
+    while count < args.max_processes:
+        process_counts.append(count)
+        count *= 2
+    process_counts.append(args.max_processes)
+
+    for processes in process_counts:
+        with ParsePool(processes) as pool:
+            # 작업 프로세스 시작 비용은 측정에서 제외
+            pool.parse(documents[0])
+
+            start = time.perf_counter()
+            futures = [pool.executor.submit(parse_to_records, document) for document in documents]
+            results = [future.result() for future in futures]
+            elapsed = time.perf_counter() - start
+
+        matches = all(
+            [e.to_record() for e in elements] == records
+            for elements, records in zip(expected, results)
+        )
+        print(f"  프로세스 {processes:>2}개: {elapsed:.2f}초 ({len(documents) / elapsed:.1f} 페이지/초, "
+              f"{baseline / elapsed:.1f}배, 결과 일치: {'예' if matches else '아니오'})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+파서 백엔드 일치성/속도 벤치마크
+benchmarks/corpus의 HTML 페이지마다 각 백엔드의 추출 결과가 html.parser와 정확히 같은지 확인하고 속도를 비교
+잘못 중첩된 마크업 페이지(malformed_*.html)는 백엔드마다 트리 모양이 달라 결과가 다른 것이 정상이므로
+차이만 보고하고 실패로 보지 않음 (html_extraction 모듈 설명 참고)
+사용법: python benchmarks/bench_parser.py [--corpus 디렉토리] [--repeat 5]
+"""
+
+import os
+import sys
+import time
+import glob
+import argparse
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+
+from html_extraction import extract_elements, available_parsers, DEFAULT_PARSER
+
+# 백엔드 간 결과 차이가 알려진 잘못 중첩된 마크업 페이지의 파일 이름 접두어
+MALFORMED_PREFIX = 'malformed_'
+
+
+def time_parser(content, parser, repeat):
+    """가장 빠른 실행 시간 (초)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract_elements(content, parser)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파서 백엔드 일치성/속도 벤치마크")
+    parser.add_argument('--corpus', default=os.path.join(BENCHMARK_DIR, 'corpus'),
+                        help='HTML 페이지 디렉토리 (기본값: benchmarks/corpus)')
+    parser.add_argument('--repeat', type=int, default=5, help='페이지별 반복 횟수 (기본값: 5)')
+    args = parser.parse_args()
+
+    files = sorted(glob.glob(os.path.join(args.corpus, '*.html')))
+    if not files:
+        print(f"HTML 파일을 찾을 수 없습니다: {args.corpus}")
+        sys.exit(1)
+
+    backends = [name for name in available_parsers() if name != DEFAULT_PARSER]
+    if not backends:
+        print("비교할 추가 파서 백엔드가 없습니다. (pip install lxml)")
+        sys.exit(1)
+
+    print(f"=== 파서 백엔드 벤치마크 ({len(files)}페이지, 기준: {DEFAULT_PARSER}) ===\n")
+
+    mismatches = 0
+    totals = {name: 0.0 for name in [DEFAULT_PARSER] + backends}
+
+    for path in files:
+        with open(path, 'rb') as f:
+            content = f.read()
+
+        expected = extract_elements(content, DEFAULT_PARSER)
+        baseline = time_parser(content, DEFAULT_PARSER, args.repeat)
+        totals[DEFAULT_PARSER] += baseline
+
+        malformed = os.path.basename(path).startswith(MALFORMED_PREFIX)
+        line = f"  {os.path.basename(path):<24} {len(content) / 1024:>7.1f}KB  {DEFAULT_PARSER}: {baseline * 1000:>7.1f}ms"
+        for name in backends:
+            elements = extract_elements(content, name)
+            if elements == expected:
+                status = '일치'
+            elif malformed:
+                status = f'알려진 차이 {len(expected)}→{len(elements)}개'
+            else:
+                status = '불일치'
+                mismatches += 1
+            elapsed = time_parser(content, name, args.repeat)
+            totals[name] += elapsed
+            line += f"  {name}: {elapsed * 1000:>7.1f}ms ({baseline / elapsed:.1f}배, {status})"
+        print(line)
+
+    print()
+    for name in backends:
+        print(f"  전체 {name}: {totals[DEFAULT_PARSER] / totals[name]:.1f}배 빠름")
+
+    if mismatches:
+        print(f"\n❌ 결과 불일치: {mismatches}건")
+        sys.exit(1)
+
+    print("\n✅ 잘못 중첩된 마크업 페이지를 제외한 모든 페이지에서 추출 결과 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+번역 속도 제한/재시도 스트레스 테스트
+처리량 한도를 넘으면 429를 돌려주고 응답 지연과 일시적 연결 오류를 섞는 가짜 번역기를
+여러 작업 스레드가 동시에 호출하여, 속도 제한 없이 호출할 때와 공유 AdaptiveRateLimiter를 쓸 때의
+누락된 번역 수와 처리량을 비교
+사용법: python benchmarks/bench_rate_limiter.py [--requests 300] [--threads 16] [--server-rate 20]
+"""
+
+import os
+import sys
+import time
+import random
+import threading
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+
+from cli_extractor import CLIWebTextExtractor, TRANSLATION_FAILED_PREFIX
+from rate_limiter import AdaptiveRateLimiter
+from translator_backends import TranslatorBackend
+
+
+class ThrottledError(Exception):
+    """429 응답을 흉내내는 예외"""
+
+    def __init__(self):
+        super().__init__("429 Too Many Requests")
+        self.status_code = 429
+
+
+class FakeThrottlingTranslator(TranslatorBackend):
+    """서버 쪽 토큰 버킷으로 초당 처리량을 제한하는 가짜 번역기"""
+
+    name = 'fake'
+    requires_network = True
+
+    def __init__(self, server_rate, latency, error_rate, seed):
+        self.server_rate = server_rate
+        self.latency = latency
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.tokens = 1.0
+        self.updated_at = time.monotonic()
+        self.throttled = 0
+
+    def translate(self, text, target_lang):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(2.0, self.tokens + (now - self.updated_at) * self.server_rate)
+            self.updated_at = now
+            throttled = self.tokens < 1
+            if throttled:
+                self.throttled += 1
+            else:
+                self.tokens -= 1
+            delay = self.random.uniform(*self.latency)
+            fail = self.random.random() < self.error_rate
+
+        time.sleep(delay)
+        if throttled:
+            raise ThrottledError()
+        if fail:
+            raise ConnectionError("connection reset")
+        return f"[{target_lang}] {text}"
+
+
+class PassThroughLimiter:
+    """비교용: 속도 제한과 재시도 없이 바로 호출"""
+
+    def call(self, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    def summary(self):
+        return "번역 요청 - 속도 제한 없음"
+
+
+def run(label, limiter, args):
+    extractor = CLIWebTextExtractor(use_cache=False, use_validators=False)
+    extractor.translator = FakeThrottlingTranslator(args.server_rate, (0.01, args.max_latency),
+                                                    args.error_rate, args.seed)
+    extractor.rate_limiter = limiter
+
+    texts = [f"테스트 문장 {i}" for i in range(args.requests)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        results = list(executor.map(lambda text: extractor._translate_uncached(text, 'en', verbose=False), texts))
+    elapsed = time.perf_counter() - started
+
+    dropped = sum(1 for result in results if result.startswith(TRANSLATION_FAILED_PREFIX))
+    print(f"[{label}]")
+    print(f"  완료: {len(results) - dropped}/{len(results)}, 누락: {dropped}, "
+          f"소요: {elapsed:.1f}초, 처리량: {(len(results) - dropped) / elapsed:.1f}건/초")
+    print(f"  서버가 거절한 요청(429): {extractor.translator.throttled}회")
+    print(f"  {limiter.summary()}")
+    return dropped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="번역 속도 제한/재시도 스트레스 테스트")
+    parser.add_argument('--requests', type=int, default=300, help='번역 요청 수 (기본값: 300)')
+    parser.add_argument('--threads', type=int, default=16, help='동시 작업 스레드 수 (기본값: 16)')
+    parser.add_argument('--server-rate', type=float, default=20.0, help='가짜 번역기의 초당 처리 한도 (기본값: 20)')
+    parser.add_argument('--max-latency', type=float, default=0.2, help='최대 응답 지연 (초, 기본값: 0.2)')
+    parser.add_argument('--error-rate', type=float, default=0.02, help='일시적 연결 오류 비율 (기본값: 0.02)')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드 (기본값: 42)')
+    args = parser.parse_args()
+
+    print(f"=== 번역 속도 제한 스트레스 테스트 (요청 {args.requests}개, 스레드 {args.threads}개, "
+          f"서버 한도 초당 {args.server_rate:.0f}건) ===\n")
+
+    run("속도 제한 없음", PassThroughLimiter(), args)
+    print()
+    dropped = run("AdaptiveRateLimiter", AdaptiveRateLimiter(base_delay=0.2, max_delay=5.0), args)
+
+    if dropped:
+        print(f"\n❌ 속도 제한을 사용해도 번역 {dropped}건이 누락되었습니다.")
+        sys.exit(1)
+
+    print("\n✅ 속도 제한 사용 시 누락된 번역 없음")
+
+
+if __name__ == "__main__":
+    main()
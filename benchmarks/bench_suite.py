@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+오프라인 벤치마크 모음
+benchmarks/corpus의 저장된 HTML 페이지(작은 페이지, 큰 페이지, 깊게 중첩된 페이지, 표가 많은 페이지, CJK/EUC-KR, 잘못 중첩된 마크업)를
+로컬 HTTP 서버로 제공하고 네트워크 없이 다음 단계를 측정
+- extract: extract_text_from_url (가져오기 + 파싱 + 중복 제거)
+- dedup: 추출한 요소와 부모 요소처럼 겹치는 후보를 ElementDeduplicator로 중복 제거
+- translate: stub 번역기로 세 언어 동시 번역
+- excel: create_excel_file (stub 번역 + 스트리밍 엑셀 쓰기)
+단계별 처리량과 최대 메모리(tracemalloc)를 보고하고, 저장된 기준값(baseline.json)과 비교하여
+시간/메모리가 허용 범위를 넘게 늘었거나 추출 결과가 달라졌으면 실패로 종료
+사용법: python benchmarks/bench_suite.py [--repeat 5] [--tolerance 0.5] [--save-baseline] [--output 결과.json]
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import hashlib
+import argparse
+import platform
+import tempfile
+import threading
+import tracemalloc
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+
+from cli_extractor import CLIWebTextExtractor
+from text_dedup import ElementDeduplicator
+from text_element import TextElement
+
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+LANGUAGES = ['en', 'zh-cn', 'vi']
+CASES = ['extract', 'dedup', 'translate', 'excel']
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(directory):
+    """코퍼스 디렉토리를 제공하는 로컬 HTTP 서버 시작 (반환값: (서버, 기본 URL))"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), partial(QuietHandler, directory=directory))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def create_extractor():
+    """캐시/조건부 요청 없이 stub 번역기를 쓰는 추출기 (매 실행이 같은 일을 하도록)"""
+    return CLIWebTextExtractor(use_cache=False, use_validators=False, translator='stub')
+
+
+def digest(values):
+    """결과 비교용 해시"""
+    return hashlib.sha256(json.dumps(values, ensure_ascii=False).encode('utf-8')).hexdigest()[:16]
+
+
+def dedup_candidates(elements):
+    """추출한 요소와, 이웃한 요소 세 개를 합친 부모 요소 같은 후보 (포함 관계 검사를 일으킴)"""
+    texts = [element.text for element in elements]
+    candidates = []
+    for i in range(0, len(texts), 3):
+        candidates.append(' '.join(texts[i:i + 3]))
+        candidates.extend(texts[i:i + 3])
+    return candidates
+
+
+def run_dedup(candidates):
+    dedup = ElementDeduplicator()
+    for text in candidates:
+        dedup.add_if_not_overlapping(TextElement('content', 'div', text))
+    return [element.text for element in dedup.elements()]
+
+
+def measure(func, repeat):
+    """가장 빠른 실행 시간과 최대 메모리 (한 번 미리 실행한 뒤 측정, 메모리는 시간 측정과 따로 측정)"""
+    result = func()
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return best, peak, result
+
+
+def run_page(extractor, base_url, name, content, repeat, work_dir):
+    """페이지 하나의 모든 단계 측정 (반환값: {단계: 측정 결과})"""
+    url = f"{base_url}/{name}"
+    results = {}
+
+    seconds, peak, elements = measure(lambda: extractor.extract_text_from_url(url, verbose=False), repeat)
+    results['extract'] = {'seconds': seconds, 'peak_bytes': peak, 'items': len(elements),
+                          'bytes': len(content), 'digest': digest([element.text for element in elements])}
+
+    candidates = dedup_candidates(elements)
+    seconds, peak, kept = measure(lambda: run_dedup(candidates), repeat)
+    results['dedup'] = {'seconds': seconds, 'peak_bytes': peak, 'items': len(candidates), 'digest': digest(kept)}
+
+    texts = [element.text for element in elements]
+    seconds, peak, translations = measure(lambda: extractor.translate_languages(texts, LANGUAGES, verbose=False),
+                                          repeat)
+    results['translate'] = {'seconds': seconds, 'peak_bytes': peak, 'items': len(texts) * len(LANGUAGES),
+                            'digest': digest([translations[lang] for lang in LANGUAGES])}
+
+    output_file = os.path.join(work_dir, f"{os.path.splitext(name)[0]}.xlsx")
+    seconds, peak, success = measure(
+        lambda: extractor.create_excel_file(elements, output_file, LANGUAGES, verbose=False), repeat)
+    results['excel'] = {'seconds': seconds, 'peak_bytes': peak, 'items': len(elements), 'success': success}
+
+    return results
+
+
+def summarize(pages):
+    """단계별 합계 (시간, 처리 항목 수, 최대 메모리)"""
+    totals = {}
+    for case in CASES:
+        entries = [page[case] for page in pages.values()]
+        totals[case] = {
+            'seconds': sum(entry['seconds'] for entry in entries),
+            'items': sum(entry['items'] for entry in entries),
+            'peak_bytes': max(entry['peak_bytes'] for entry in entries)
+        }
+    return totals
+
+
+def compare(report, baseline, tolerance):
+    """기준값과 비교하여 문제 목록 반환"""
+    problems = []
+
+    for name, page in report['pages'].items():
+        expected = baseline['pages'].get(name)
+        if expected is None:
+            continue
+        for case in CASES:
+            if 'digest' in page[case] and page[case]['digest'] != expected[case].get('digest'):
+                problems.append(f"{name} {case}: 결과가 기준값과 다릅니다")
+
+    for case in CASES:
+        current = report['totals'][case]
+        expected = baseline['totals'].get(case)
+        if not expected:
+            continue
+        if current['seconds'] > expected['seconds'] * (1 + tolerance):
+            problems.append(f"{case}: 시간 {current['seconds'] * 1000:.1f}ms > 기준값 {expected['seconds'] * 1000:.1f}ms "
+                            f"(+{(current['seconds'] / expected['seconds'] - 1) * 100:.0f}%)")
+        if current['peak_bytes'] > expected['peak_bytes'] * (1 + tolerance):
+            problems.append(f"{case}: 메모리 {current['peak_bytes'] / 1024:.0f}KB > 기준값 "
+                            f"{expected['peak_bytes'] / 1024:.0f}KB")
+
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 벤치마크 모음")
+    parser.add_argument('--corpus', default=os.path.join(BENCHMARK_DIR, 'corpus'),
+                        help='HTML 페이지 디렉토리 (기본값: benchmarks/corpus)')
+    parser.add_argument('--repeat', type=int, default=5, help='단계별 반복 횟수 (가장 빠른 값 사용, 기본값: 5)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='기준값 파일 (기본값: benchmarks/baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준값으로 저장')
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='기준값 대비 허용하는 시간/메모리 증가 비율 (기본값: 0.5)')
+    parser.add_argument('--output', help='측정 결과를 저장할 JSON 파일')
+    args = parser.parse_args()
+
+    files = sorted(glob.glob(os.path.join(args.corpus, '*.html')))
+    if not files:
+        print(f"HTML 파일을 찾을 수 없습니다: {args.corpus}")
+        sys.exit(1)
+
+    print(f"=== 오프라인 벤치마크 ({len(files)}페이지, 반복 {args.repeat}회, 언어: {' '.join(LANGUAGES)}) ===\n")
+
+    server, base_url = start_server(args.corpus)
+    extractor = create_extractor()
+    pages = {}
+
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            print(f"{'페이지':<14}{'크기':>9}  " + "".join(f"{case:>12}" for case in CASES))
+            for path in files:
+                name = os.path.basename(path)
+                with open(path, 'rb') as f:
+                    content = f.read()
+
+                pages[name] = run_page(extractor, base_url, name, content, args.repeat, work_dir)
+                times = "".join(f"{pages[name][case]['seconds'] * 1000:10.2f}ms" for case in CASES)
+                print(f"{name:<14}{len(content) / 1024:7.1f}KB  {times}")
+    finally:
+        server.shutdown()
+
+    failed_pages = [name for name, page in pages.items() if not page['excel']['success'] or not page['extract']['items']]
+    totals = summarize(pages)
+    total_bytes = sum(page['extract']['bytes'] for page in pages.values())
+
+    print("\n단계별 처리량 / 최대 메모리:")
+    print(f"  extract   {total_bytes / totals['extract']['seconds'] / 1024 / 1024:8.2f}MB/초, "
+          f"{len(pages) / totals['extract']['seconds']:8.1f}페이지/초, {totals['extract']['peak_bytes'] / 1024:8.0f}KB")
+    for case, unit in (('dedup', '후보'), ('translate', '번역'), ('excel', '행')):
+        print(f"  {case:<9} {totals[case]['items'] / totals[case]['seconds']:8.0f}{unit}/초, "
+              f"{' ' * 17}{totals[case]['peak_bytes'] / 1024:8.0f}KB")
+
+    report = {
+        'machine': {'platform': platform.platform(), 'python': platform.python_version(),
+                    'cpus': os.cpu_count()},
+        'repeat': args.repeat,
+        'pages': pages,
+        'totals': totals
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n측정 결과 저장: {args.output}")
+
+    if failed_pages:
+        print(f"\n❌ 처리에 실패한 페이지: {', '.join(failed_pages)}")
+        sys.exit(1)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n✅ 기준값 저장: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\n⚠️ 기준값 파일이 없습니다: {args.baseline} (--save-baseline으로 먼저 저장하세요)")
+        return
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    if baseline.get('machine') != report['machine']:
+        print(f"\n⚠️ 기준값과 측정 환경이 다릅니다 ({baseline.get('machine')}). 시간 비교는 참고용입니다.")
+
+    problems = compare(report, baseline, args.tolerance)
+    if problems:
+        print(f"\n❌ 기준값 대비 회귀 {len(problems)}건 (허용 범위 +{args.tolerance * 100:.0f}%):")
+        for problem in problems:
+            print(f"  - {problem}")
+        sys.exit(1)
+
+    print(f"\n✅ 기준값 대비 회귀 없음 (허용 범위 +{args.tolerance * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+번역기 풀 동시성 스트레스 테스트
+연결 하나를 순서대로 쓰고 요청 본문을 클라이언트 상태에 담아 두는(스레드 안전하지 않은) 가짜 번역 클라이언트를
+작업 스레드 수를 늘려 가며 호출하여, 인스턴스 하나를 공유할 때와 TranslatorPool로 작업자마다 빌려 쓸 때의
+처리량과 뒤섞인(다른 요청의) 결과 수를 비교
+사용법: python benchmarks/bench_translator_pool.py [--requests 200] [--workers 1 4 16] [--latency 0.02]
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+
+from cli_extractor import CLIWebTextExtractor
+from translator_backends import TranslatorBackend
+from translator_pool import TranslatorPool
+
+
+class FakeSessionTranslator(TranslatorBackend):
+    """HTTP 세션 하나를 가진 번역 클라이언트 흉내 (동시 요청은 직렬화되고 요청 상태가 덮어써질 수 있음)"""
+
+    name = 'fake-session'
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.connection = threading.Lock()
+        self.request = None
+
+    def translate(self, text, target_lang):
+        # 요청 본문을 클라이언트 상태에 저장한 뒤 연결이 비기를 기다림 (그 사이 다른 스레드가 덮어쓸 수 있음)
+        self.request = text
+        with self.connection:
+            time.sleep(self.latency)
+            return f"[{target_lang}] {self.request}"
+
+
+def run(label, translator, workers, args):
+    extractor = CLIWebTextExtractor(use_cache=False, use_validators=False)
+    extractor.translator = translator
+
+    texts = [f"테스트 문장 {i}" for i in range(args.requests)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(lambda text: extractor._translate_uncached(text, 'en', verbose=False), texts))
+    elapsed = time.perf_counter() - started
+
+    corrupted = sum(1 for text, result in zip(texts, results) if result != f"[en] {text}")
+    throughput = len(texts) / elapsed
+    print(f"  {label:<8} 작업자 {workers:>3}개: {elapsed:6.2f}초, {throughput:7.1f}건/초, 뒤섞인 결과: {corrupted}개")
+    return throughput, corrupted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="번역기 풀 동시성 스트레스 테스트")
+    parser.add_argument('--requests', type=int, default=200, help='작업자 수마다 보낼 번역 요청 수 (기본값: 200)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 16], help='작업 스레드 수 (기본값: 1 4 16)')
+    parser.add_argument('--latency', type=float, default=0.02, help='요청 하나의 응답 시간 (초, 기본값: 0.02)')
+    parser.add_argument('--min-speedup', type=float, default=0.5,
+                        help='풀 사용 시 작업자 수 대비 최소 처리량 증가 비율 (기본값: 0.5)')
+    args = parser.parse_args()
+
+    print(f"=== 번역기 풀 스트레스 테스트 (요청 {args.requests}개, 응답 시간 {args.latency * 1000:.0f}ms) ===\n")
+
+    failed = False
+    baseline = None
+    for workers in args.workers:
+        run("공유", FakeSessionTranslator(args.latency), workers, args)
+
+        # 추출기와 같은 크기 설정 (최대 개수 없이 동시에 부르는 작업자 수만큼 생성)
+        pool = TranslatorPool(partial(FakeSessionTranslator, args.latency))
+        throughput, corrupted = run("풀", pool, workers, args)
+        print(f"  {'':<8} {pool.summary()}")
+
+        if baseline is None:
+            baseline = (workers, throughput)
+        expected = baseline[1] * (1 + (workers / baseline[0] - 1) * args.min_speedup)
+        if corrupted:
+            print(f"  ❌ 풀 사용 시 뒤섞인 결과 {corrupted}개")
+            failed = True
+        if throughput < expected:
+            print(f"  ❌ 처리량이 기대치({expected:.1f}건/초)보다 낮습니다")
+            failed = True
+        if pool.stats()['live'] > workers:
+            print(f"  ❌ 인스턴스 수가 작업자 수보다 많습니다")
+            failed = True
+        print()
+
+    if failed:
+        sys.exit(1)
+
+    print("✅ 번역기 풀: 뒤섞인 결과 없음, 작업자 수에 따라 처리량 증가")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+단일 순회 DOM 워커 벤치마크
+요소마다 get_text를 다시 호출하던 기존 방식(아래 legacy_*, baseline 추출 코드를 그대로 옮김)과 현재 추출 함수의 결과가 같은지 확인하고 속도를 비교
+benchmarks/corpus의 페이지와 깊게 중첩된 합성 페이지를 CLI/GUI 규칙 모두로 측정
+잘못 중첩된 마크업 페이지(malformed_*.html)는 html.parser 결과만 기존 방식과 같아야 하고 lxml은 차이만 보고
+사용법: python benchmarks/bench_walker.py [--corpus 디렉토리] [--depth 60] [--repeat 3]
+"""
+
+import os
+import re
+import sys
+import time
+import glob
+import argparse
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+
+from bs4 import BeautifulSoup, Comment
+from html_extraction import extract_elements, extract_dom_elements, available_parsers, DEFAULT_PARSER
+
+# lxml 결과가 기존 방식과 다른 것이 알려진 잘못 중첩된 마크업 페이지의 파일 이름 접두어
+MALFORMED_PREFIX = 'malformed_'
+
+
+def legacy_extract_elements(content):
+    """기존 CLI 추출 (baseline cli_extractor.extract_text_from_url의 파싱 부분 그대로)"""
+    soup = BeautifulSoup(content, 'html.parser')
+    
+    # 불필요한 태그 제거
+    for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
+        tag.decompose()
+    
+    text_elements = []
+    
+    # 제목들 추출
+    for heading in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
+        text = heading.get_text(strip=True)
+        if text and len(text) > 1:
+            text_elements.append({
+                'type': 'heading',
+                'tag': heading.name,
+                'text': text
+            })
+    
+    # 본문 텍스트 추출
+    for para in soup.find_all(['p', 'div', 'span', 'li']):
+        text = para.get_text(strip=True)
+        if text and len(text) > 10:
+            # 중복 제거
+            is_duplicate = False
+            for existing in text_elements:
+                if text in existing['text'] or existing['text'] in text:
+                    is_duplicate = True
+                    break
+            
+            if not is_duplicate:
+                text_elements.append({
+                    'type': 'content',
+                    'tag': para.name,
+                    'text': text
+                })
+    
+    return text_elements
+
+
+def legacy_extract_dom_elements(content):
+    """기존 GUI 추출 (baseline web_text_extractor.extract_text_from_url의 파싱 부분 그대로)"""
+    soup = BeautifulSoup(content, 'html.parser')
+    
+    # 불필요한 태그 및 주석 제거
+    for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
+        tag.decompose()
+        
+    # HTML 주석 제거
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
+    
+    # 텍스트 추출 - DOM 순서대로 개별 요소별로
+    text_elements = []
+    seen_texts = set()  # 중복 방지용
+    
+    # 메인 컨텐츠 영역 찾기
+    main_content = soup.find('main') or soup.find('article') or soup.find(class_=re.compile(r'content|main|body', re.I)) or soup.find('body')
+    
+    if main_content:
+        # DOM을 순회하면서 개별 텍스트 요소 추출
+        legacy_extract_text_recursively(main_content, text_elements, seen_texts)
+    else:
+        # main_content를 찾지 못한 경우 전체 body에서 추출
+        body = soup.find('body')
+        if body:
+            legacy_extract_text_recursively(body, text_elements, seen_texts)
+    
+    return text_elements
+
+
+def legacy_extract_text_recursively(element, text_elements, seen_texts):
+    """재귀적으로 텍스트 추출 (baseline web_text_extractor._extract_text_recursively 그대로)"""
+    for child in element.children:
+        # 텍스트 노드인 경우 (순수 텍스트) - 주석 제외
+        if child.name is None:
+            # HTML 주석인지 확인
+            if isinstance(child, Comment):
+                continue
+                
+            text = str(child).strip()
+            if text and len(text) > 2 and not text.startswith('<'):
+                text_clean = text.replace('\n', ' ').replace('\t', ' ').strip()
+                # 공백만 있거나 특수문자만 있는 경우 제외
+                if text_clean and text_clean not in seen_texts and len(text_clean.replace(' ', '')) > 1:
+                    text_elements.append({
+                        'type': 'content',
+                        'tag': 'text',
+                        'text': text_clean
+                    })
+                    seen_texts.add(text_clean)
+        
+        # HTML 요소인 경우
+        elif child.name:
+            # 제목 태그들은 개별적으로 처리
+            if child.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+                text = child.get_text(strip=True)
+                if text and len(text) > 1:
+                    text_clean = text.replace('\n', ' ').replace('\t', ' ').strip()
+                    if text_clean and text_clean not in seen_texts:
+                        text_elements.append({
+                            'type': 'heading',
+                            'tag': child.name,
+                            'text': text_clean
+                        })
+                        seen_texts.add(text_clean)
+            
+            # 단락, 리스트 항목 등은 개별적으로 처리
+            elif child.name in ['p', 'li', 'td', 'th', 'blockquote', 'pre']:
+                text = child.get_text(strip=True)
+                if text and len(text) > 2:
+                    text_clean = text.replace('\n', ' ').replace('\t', ' ').strip()
+                    # 중복 체크
+                    is_duplicate = False
+                    for seen_text in seen_texts:
+                        if text_clean == seen_text:
+                            is_duplicate = True
+                            break
+                        # 포함 관계 체크 (90% 이상 겹치면 중복으로 간주)
+                        if text_clean in seen_text and len(text_clean) > len(seen_text) * 0.9:
+                            is_duplicate = True
+                            break
+                        if seen_text in text_clean and len(seen_text) > len(text_clean) * 0.9:
+                            # 더 긴 텍스트로 교체
+                            text_elements[:] = [elem for elem in text_elements if elem['text'] != seen_text]
+                            seen_texts.discard(seen_text)
+                            break
+                    
+                    if not is_duplicate and text_clean:
+                        text_elements.append({
+                            'type': 'content',
+                            'tag': child.name,
+                            'text': text_clean
+                        })
+                        seen_texts.add(text_clean)
+            
+            # 인라인 요소들 - 텍스트가 의미있는 경우만
+            elif child.name in ['span', 'a', 'strong', 'b', 'em', 'i', 'code', 'label']:
+                text = child.get_text(strip=True)
+                if text and len(text) > 1:
+                    text_clean = text.replace('\n', ' ').replace('\t', ' ').strip()
+                    if text_clean and text_clean not in seen_texts:
+                        # 너무 짧거나 의미없는 텍스트 제외
+                        if len(text_clean) > 2 and not text_clean.isdigit():
+                            text_elements.append({
+                                'type': 'content',
+                                'tag': child.name,
+                                'text': text_clean
+                            })
+                            seen_texts.add(text_clean)
+            
+            # div, section 등 컨테이너 요소는 재귀적으로 처리
+            elif child.name in ['div', 'section', 'article', 'ul', 'ol', 'table', 'tbody', 'thead', 'tr']:
+                # 하위 요소들을 재귀적으로 처리
+                legacy_extract_text_recursively(child, text_elements, seen_texts)
+
+
+def as_records(elements):
+    """비교용 (유형, 태그, 텍스트) 목록 (기존 방식의 dict와 TextElement 모두)"""
+    return [(element['type'], element['tag'], element['text']) if isinstance(element, dict) else element.to_record()
+            for element in elements]
+
+
+def nested_page(depth, sections=20):
+    """div가 depth 단계로 중첩된 섹션들로 이루어진 페이지"""
+    parts = ['<html><head><title>nested</title></head><body><div class="content">']
+    for section in range(sections):
+        parts.append(f'<h2>Section {section} overview</h2>')
+        for level in range(depth):
+            parts.append(f'<div class="level-{level}"><span>label {section}-{level}</span>'
+                         f'<p>Paragraph {section}.{level} with <b>bold</b> and <a href="#">a link</a> text.</p>')
+        parts.append('</div>' * depth)
+    parts.append('</div></body></html>')
+    return ''.join(parts).encode('utf-8')
+
+
+def best_time(func, content, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(content)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="단일 순회 DOM 워커 벤치마크")
+    parser.add_argument('--corpus', default=os.path.join(BENCHMARK_DIR, 'corpus'),
+                        help='HTML 페이지 디렉토리 (기본값: benchmarks/corpus)')
+    parser.add_argument('--depth', type=int, default=60, help='합성 페이지 중첩 깊이 (기본값: 60)')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (기본값: 3)')
+    args = parser.parse_args()
+
+    pages = []
+    for path in sorted(glob.glob(os.path.join(args.corpus, '*.html'))):
+        with open(path, 'rb') as f:
+            pages.append((os.path.basename(path), f.read()))
+    pages.append((f'nested-{args.depth}', nested_page(args.depth)))
+
+    rules = [
+        ('CLI', legacy_extract_elements, extract_elements),
+        ('GUI', legacy_extract_dom_elements, extract_dom_elements),
+    ]
+
+    print(f"=== 단일 순회 DOM 워커 벤치마크 ({len(pages)}페이지) ===")
+
+    mismatches = 0
+    for rule, legacy, current in rules:
+        print(f"\n[{rule} 규칙]")
+        for name, content in pages:
+            expected = as_records(legacy(content))
+            legacy_time = best_time(legacy, content, args.repeat)
+            line = f"  {name:<24} 기존: {legacy_time * 1000:>8.1f}ms"
+
+            for backend in available_parsers():
+                if as_records(current(content, backend)) == expected:
+                    status = '일치'
+                elif backend != DEFAULT_PARSER and name.startswith(MALFORMED_PREFIX):
+                    # 잘못 중첩된 마크업은 lxml이 요소를 암묵적으로 닫아 트리가 달라지는 것이 정상
+                    status = '알려진 차이'
+                else:
+                    status = '불일치'
+                    mismatches += 1
+                elapsed = best_time(lambda data: current(data, backend), content, args.repeat)
+                line += (f"  {backend}: {elapsed * 1000:>7.1f}ms "
+                         f"({legacy_time / elapsed:.1f}배, {status})")
+            print(line)
+
+    if mismatches:
+        print(f"\n❌ 결과 불일치: {mismatches}건")
+        sys.exit(1)
+
+    print(f"\n✅ 모든 페이지에서 기존 추출 결과와 일치 (기준 파서: {DEFAULT_PARSER})")
+
+
+if __name__ == "__main__":
+    main()
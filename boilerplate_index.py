@@ -0,0 +1,103 @@
+"""
+사이트 공통 문구(보일러플레이트) 색인
+nav/header/footer를 제거한 뒤에도 남는 메뉴, 쿠키 안내, 바닥글 문장처럼 같은 호스트의 여러 페이지에 반복되는 텍스트를
+호스트별로 내용 해시가 나온 페이지 수를 세어 찾아냄
+- min_pages개 이상의 페이지에 나온 텍스트는 공통 문구로 보고 번역을 기억해 두어 다음 페이지부터는 번역 없이 채움
+  (번역 캐시가 있는 실행에서는 캐시가 같은 문구를 찾아 주므로 번역은 기억하지 않고 세기만 함)
+- skip이면 공통 문구를 페이지별 출력에서 제외 (공통 문구로 판단되기 전에 처리한 앞쪽 페이지에는 남음)
+observe는 번역을 시작하기 전 추출 단계에서 호출하여, 번역을 기다리는 페이지보다 먼저 추출된 페이지도 판단에 반영함
+실행 중에만 유지하며 여러 작업 스레드가 함께 사용
+"""
+
+import threading
+from urllib.parse import urlparse
+from element_store import content_hash
+
+DEFAULT_MIN_PAGES = 3             # 공통 문구로 보는 최소 페이지 수
+DEFAULT_MAX_ENTRIES = 200000      # 호스트별로 세는 최대 해시 수 (넘으면 한 페이지에만 나온 해시를 버림)
+
+
+class BoilerplateIndex:
+    def __init__(self, min_pages=DEFAULT_MIN_PAGES, skip=False, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        min_pages: 같은 호스트에서 이 수 이상의 페이지에 나온 텍스트를 공통 문구로 봄
+        skip: 공통 문구를 출력에서 제외
+        max_entries: 호스트별로 세는 최대 해시 수 (URL이 많아도 메모리가 계속 늘지 않도록)
+        """
+        self.min_pages = max(2, min_pages)
+        self.skip = skip
+        self.max_entries = max_entries
+        self.hosts = {}  # 호스트 -> {내용 해시: 나온 페이지 수}
+        self.pages = {}  # 호스트 -> 본 페이지 수
+        self.boilerplate = {}  # 호스트 -> 공통 문구로 판단한 내용 해시 (다른 호스트의 같은 문구는 따로 셈)
+        self.translations = {}  # (내용 해시, 언어 코드) -> 공통 문구 번역
+        self.repeated = 0  # 공통 문구로 판단된 요소 수 (번역 재사용 또는 제외 대상)
+        self.omitted = 0  # 출력에서 제외한 요소 수
+        self.lock = threading.Lock()
+
+    def observe(self, url, text_elements):
+        """페이지의 텍스트를 세고 요소 목록 반환 (skip이면 공통 문구를 뺀 목록)
+
+        URL마다 한 번만 호출 (같은 페이지 안에서 반복되는 텍스트는 한 번만 셈)
+        """
+        host = urlparse(url).hostname or ''
+        hashes = [content_hash(element.text) for element in text_elements]
+
+        with self.lock:
+            counts = self.hosts.setdefault(host, {})
+            boilerplate = self.boilerplate.setdefault(host, set())
+            self.pages[host] = self.pages.get(host, 0) + 1
+            for row_hash in set(hashes):
+                count = counts.get(row_hash, 0) + 1
+                counts[row_hash] = count
+                if count >= self.min_pages:
+                    boilerplate.add(row_hash)
+
+            if len(counts) > self.max_entries:
+                for row_hash in [row_hash for row_hash, count in counts.items() if count == 1]:
+                    del counts[row_hash]
+
+            repeated = [row_hash in boilerplate for row_hash in hashes]
+            self.repeated += sum(repeated)
+            if not self.skip:
+                return text_elements
+            self.omitted += sum(repeated)
+
+        return [element for element, is_repeated in zip(text_elements, repeated) if not is_repeated]
+
+    def known_translations(self):
+        """기억해 둔 공통 문구 번역 ({(내용 해시, 언어 코드): 번역}, ElementStore.lookup과 같은 형태)"""
+        with self.lock:
+            return dict(self.translations)
+
+    def remember(self, url, entries):
+        """url 페이지에서 번역한 (내용 해시, 언어 코드, 번역) 중 그 호스트의 공통 문구 번역만 기억
+
+        번역은 내용이 같으면 같으므로 기억한 번역은 호스트와 상관없이 채워 씀
+        """
+        host = urlparse(url).hostname or ''
+        with self.lock:
+            boilerplate = self.boilerplate.get(host, ())
+            for row_hash, lang, translated in entries:
+                if row_hash in boilerplate:
+                    self.translations[(row_hash, lang)] = translated
+
+    def stats(self):
+        """통계 반환"""
+        with self.lock:
+            return {
+                'hosts': len(self.hosts),
+                'pages': sum(self.pages.values()),
+                'boilerplate': sum(len(hashes) for hashes in self.boilerplate.values()),
+                'repeated': self.repeated,
+                'omitted': self.omitted,
+            }
+
+    def summary(self):
+        """통계 요약 문자열"""
+        stats = self.stats()
+        text = (f"공통 문구 - 호스트 {stats['hosts']}개, 페이지 {stats['pages']}개, "
+                f"반복 문구 {stats['boilerplate']}개, 반복된 요소 {stats['repeated']}개")
+        if self.skip:
+            text += f" (출력에서 제외 {stats['omitted']}개)"
+        return text
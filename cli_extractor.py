@@ -4,124 +4,269 @@
 간단한 사용법: python cli_extractor.py <URL> [출력파일명]
 """
 
+import os
 import sys
+import shutil
 import argparse
-import requests
-from bs4 import BeautifulSoup
-import openpyxl
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
-from googletrans import Translator
+from functools import partial
 import re
 from datetime import datetime
+from translation_cache import TranslationCache, DEFAULT_CACHE_PATH
+from translation_batch import TranslationBatcher, LanguageExecutors, DEFAULT_WORKERS_PER_LANGUAGE
+from html_extraction import extract_elements, supports_incremental, available_parsers, DEFAULT_PARSER
+from http_fetcher import HttpFetcher, DEFAULT_MAX_BODY_BYTES
+from encoding_detection import EncodingResolver
+from rate_limiter import AdaptiveRateLimiter, DEFAULT_TRANSLATION_RATE
+from translator_pool import TranslatorPool
+from translator_backends import create_translator, available_translators, DEFAULT_TRANSLATOR
+from element_store import content_hash
+from pipeline_profiler import PipelineProfiler, save_report, default_profile_path
+from streaming_pipeline import prefetch, DEFAULT_PREFETCH_DEPTH
+from output_writers import (create_output_writer, format_from_path, format_extension, format_records_url_index,
+                            available_formats, DEFAULT_OUTPUT_FORMAT, DEFAULT_ROW_CHUNK_SIZE)
+
+# 번역 실패 시 결과 대신 기록하는 문자열의 시작 부분
+TRANSLATION_FAILED_PREFIX = "[번역 실패:"
 
 class CLIWebTextExtractor:
-    def __init__(self):
-        self.translator = Translator()
+    def __init__(self, use_cache=True, cache_path=DEFAULT_CACHE_PATH,
+                 translation_workers=DEFAULT_WORKERS_PER_LANGUAGE, use_validators=True,
+                 html_parser=DEFAULT_PARSER, translation_rate=DEFAULT_TRANSLATION_RATE,
+                 translator=DEFAULT_TRANSLATOR, max_page_bytes=DEFAULT_MAX_BODY_BYTES):
+        # 동시에 번역하는 작업자마다 별도의 번역기 인스턴스를 빌려 씀
+        # (번역은 언어별 작업 풀에서만 실행되므로 인스턴스는 언어당 번역 작업자 수 x 언어 수를 넘지 않음)
+        self.translator = TranslatorPool(partial(create_translator, translator))
+        # 모든 작업 스레드가 공유하는 번역 요청 속도 제한 (429/일시적 오류는 재시도, 네트워크 번역기만 사용)
+        self.rate_limiter = AdaptiveRateLimiter(translation_rate)
+        # 번역 엔진이 다르면 캐시와 이전 출력 파일을 공유하지 않음
+        namespace = self.translator.cache_namespace
+        self.cache = TranslationCache(cache_path, namespace=namespace) if use_cache else None
+        self.translation_workers = translation_workers
+        # 모든 URL/묶음의 번역이 함께 쓰는 언어별 작업 풀 (묶음마다 새로 만들지 않음)
+        self.language_executors = LanguageExecutors(translation_workers)
+        self.fetcher = HttpFetcher(namespace=f"cli-{namespace}" if namespace else 'cli', use_validators=use_validators,
+                                   max_bytes=max_page_bytes)
+        self.html_parser = html_parser
+        self.encoding_resolver = EncodingResolver()  # 호스트별로 판별한 인코딩을 기억
+        self.parse_pool = None  # 설정되면 파싱을 프로세스 풀에서 실행
+        self.element_store = None  # 설정되면 URL별로 바뀌지 않은 요소의 번역을 재사용
+        self.journal = None  # 설정되면 번역이 끝난 요소를 배치 작업 기록에 남김
+        self.boilerplate = None  # 설정되면 페이지를 추출할 때 공통 문구를 셈 (선택적으로 출력에서 제외, 캐시가 없으면 번역도 한 번만)
+        self.row_chunk_size = DEFAULT_ROW_CHUNK_SIZE  # 번역 후 바로 결과 파일로 내보내는 행 수
+        self.pipeline_depth = DEFAULT_PREFETCH_DEPTH  # 쓰기를 기다리며 미리 번역해 두는 최대 묶음 수
+        self.profiler = PipelineProfiler(enabled=False)  # --profile이면 단계별 시간 측정
+        self.profile_path = None  # 측정 결과 JSON 경로 (None이면 출력 파일 이름으로 정함)
     
     def extract_text_from_url(self, url, verbose=True):
-        """웹페이지에서 텍스트 추출"""
+        """웹페이지에서 텍스트 추출 (변경 없음(304)이면 이전에 추출한 요소를 그대로 반환)"""
+        text_elements, _ = self.fetch_elements(url, verbose)
+        return text_elements
+    
+    def fetch_elements(self, url, verbose=True):
+        """웹페이지에서 텍스트 추출 (반환값: (텍스트 요소 목록, 304로 이전 결과를 재사용했는지 여부))"""
         try:
             if verbose:
                 print(f"웹페이지 접속 중: {url}")
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            response.encoding = response.apparent_encoding
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 불필요한 태그 제거
-            for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-                tag.decompose()
-            
-            text_elements = []
+            # 조각 단위로 파싱할 수 있으면 본문을 다 받지 않고 바로 파서에 넣음
+            stream = self.parse_pool is None and supports_incremental(self.html_parser)
+            with self.profiler.stage('fetch', url):
+                response = self.fetcher.fetch(url, stream=stream)
             
-            # 제목들 추출
-            for heading in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-                text = heading.get_text(strip=True)
-                if text and len(text) > 1:
-                    text_elements.append({
-                        'type': 'heading',
-                        'tag': heading.name,
-                        'text': text
-                    })
+            # 변경되지 않은 페이지는 파싱하지 않고 이전 추출 결과 재사용
+            if response.status_code == 304:
+                previous = self.fetcher.get_previous(url)
+                if previous:
+                    if verbose:
+                        print(f"변경 없음 (304): 이전에 추출한 {len(previous['elements'])}개의 텍스트 요소를 재사용합니다.")
+                    return self.observe_boilerplate(url, previous['elements']), True
             
-            # 본문 텍스트 추출
-            for para in soup.find_all(['p', 'div', 'span', 'li']):
-                text = para.get_text(strip=True)
-                if text and len(text) > 10:
-                    # 중복 제거
-                    is_duplicate = False
-                    for existing in text_elements:
-                        if text in existing['text'] or existing['text'] in text:
-                            is_duplicate = True
-                            break
-                    
-                    if not is_duplicate:
-                        text_elements.append({
-                            'type': 'content',
-                            'tag': para.name,
-                            'text': text
-                        })
+            response.raise_for_status()
+            content_type = response.headers.get('Content-Type')
+            if stream:
+                # 본문 받기, 디코딩, 파싱이 조각마다 번갈아 일어나므로 모두 parse 단계로 기록
+                with self.profiler.stage('parse', url):
+                    chunks = self.fetcher.iter_body(response, partial(self.profiler.count, 'bytes_fetched', url=url))
+                    text_elements = extract_elements(self.encoding_resolver.decode_chunks(url, chunks, content_type),
+                                                     self.html_parser)
+            else:
+                self.profiler.count('bytes_fetched', len(response.content), url)
+                with self.profiler.stage('decode', url):
+                    html = self.encoding_resolver.decode(url, response.content, content_type)
+                
+                with self.profiler.stage('parse', url):
+                    if self.parse_pool:
+                        text_elements = self.parse_pool.parse(html)
+                    else:
+                        text_elements = extract_elements(html, self.html_parser)
             
             if verbose:
                 print(f"총 {len(text_elements)}개의 텍스트 요소를 추출했습니다.")
             
-            return text_elements
+            self.fetcher.remember(url, response.headers, text_elements)
+            return self.observe_boilerplate(url, text_elements), False
             
         except Exception as e:
             print(f"텍스트 추출 오류: {str(e)}")
-            return []
+            return [], False
+    
+    def observe_boilerplate(self, url, text_elements):
+        """추출 단계에서 공통 문구를 셈 (번역 계획보다 먼저 세어야 먼저 추출된 페이지도 판단에 반영됨)
+        
+        공통 문구 색인이 없으면 그대로, skip이면 공통 문구를 뺀 목록 반환
+        """
+        if self.boilerplate is None:
+            return text_elements
+        return self.boilerplate.observe(url, text_elements)
+    
+    def reuse_previous_output(self, url, output_file, languages, url_index=1):
+        """304로 재사용한 페이지의 이전 출력 파일이 같은 언어 구성이면 그대로 사용
+        
+        url_index: 이번 실행에서 이 URL의 번호 (행마다 url_index를 기록하는 형식은 번호가 같을 때만 재사용)
+        """
+        previous = self.fetcher.get_previous(url)
+        if not previous or not previous['output_file'] or previous['languages'] != list(languages):
+            return False
+        
+        # 출력 형식이 다르면 재사용하지 않음
+        if os.path.splitext(previous['output_file'])[1] != os.path.splitext(output_file)[1]:
+            return False
+        
+        # JSONL/열 단위 형식은 행에 URL 번호가 들어 있으므로 다른 번호로 쓴 파일은 캐시된 요소로 다시 씀
+        if format_records_url_index(format_from_path(output_file)) and previous['url_index'] != url_index:
+            return False
+        
+        if not os.path.exists(previous['output_file']):
+            return False
+        
+        if os.path.abspath(output_file) != previous['output_file']:
+            shutil.copyfile(previous['output_file'], output_file)
+        
+        return True
     
     def translate_text(self, text, target_lang, verbose=True):
-        """텍스트 번역"""
+        """텍스트 번역 (번역 캐시 우선 조회)"""
+        if self.cache:
+            cached = self.cache.get(text, target_lang)
+            if cached is not None:
+                return cached
+        
+        return self._translate_uncached(text, target_lang, verbose)
+    
+    def translate_texts(self, texts, target_lang, verbose=True):
+        """여러 텍스트를 묶음 단위로 번역 (입력 순서대로 결과 반환)"""
+        return self._create_batcher(verbose).translate(texts, target_lang)
+    
+    def translate_languages(self, texts, languages, verbose=True):
+        """모든 언어를 동시에 번역 ({언어 코드: 번역 목록} 반환)"""
+        return self._create_batcher(verbose).translate_languages(texts, languages, executors=self.language_executors)
+    
+    def translate_changed(self, texts, languages, stored, entries, verbose=True, url=None):
+        """저장된 번역이 모든 언어에 있는 요소는 재사용하고 나머지만 번역 (반환값: (번역, 재사용한 요소 수))
+        
+        stored: ElementStore.lookup 결과, entries: 저장할 (내용 해시, 언어 코드, 번역)을 추가할 목록
+        url: 번역한 글자 수를 기록할 URL
+        """
+        hashes = [content_hash(text) for text in texts]
+        changed = [i for i, row_hash in enumerate(hashes)
+                   if any((row_hash, lang) not in stored for lang in languages)]
+        
+        translations = {lang: [stored.get((row_hash, lang)) for row_hash in hashes] for lang in languages}
+        if changed:
+            self.profiler.count('chars_translated', sum(len(texts[i]) for i in changed) * len(languages), url)
+            fresh = self.translate_languages([texts[i] for i in changed], languages, verbose)
+            for position, i in enumerate(changed):
+                for lang in languages:
+                    translations[lang][i] = fresh[lang][position]
+        
+        # 번역에 실패한 요소는 다음 실행에서 다시 번역하도록 저장하지 않음
+        for i, row_hash in enumerate(hashes):
+            for lang in languages:
+                if not translations[lang][i].startswith(TRANSLATION_FAILED_PREFIX):
+                    entries.append((row_hash, lang, translations[lang][i]))
+        
+        return translations, len(texts) - len(changed)
+    
+    def _create_batcher(self, verbose=True):
+        return TranslationBatcher(
+            self._translate_raw,
+            lambda text, lang: self._translate_uncached(text, lang, verbose),
+            cache=self.cache,
+            batch_func=self._translate_batch_raw if self.translator.supports_batch else None,
+            failure_func=lambda texts, lang, error: self._translation_failed(texts, lang, error, verbose)
+        )
+    
+    def _translate_uncached(self, text, target_lang, verbose=True):
+        """캐시 조회 없이 번역하고 성공한 결과만 캐시에 저장"""
         try:
-            if len(text) > 4000:
-                # 긴 텍스트 분할 처리
-                sentences = re.split(r'[.!?。！？]', text)
-                translated_sentences = []
-                
-                current_chunk = ""
-                for sentence in sentences:
-                    if len(current_chunk + sentence) < 4000:
-                        current_chunk += sentence + "."
-                    else:
-                        if current_chunk:
-                            result = self.translator.translate(current_chunk, dest=target_lang)
-                            translated_sentences.append(result.text)
-                        current_chunk = sentence + "."
-                
-                if current_chunk:
-                    result = self.translator.translate(current_chunk, dest=target_lang)
-                    translated_sentences.append(result.text)
-                
-                return " ".join(translated_sentences)
-            else:
-                result = self.translator.translate(text, dest=target_lang)
-                return result.text
+            translated_text = self._translate_raw(text, target_lang)
+            
+            if self.cache:
+                self.cache.set(text, target_lang, translated_text)
+            
+            return translated_text
                 
         except Exception as e:
-            if verbose:
-                print(f"번역 오류 ({target_lang}): {str(e)}")
-            return f"[번역 실패: {text[:50]}...]"
+            return self._translation_failed([text], target_lang, e, verbose)[0]
+    
+    def _translation_failed(self, texts, target_lang, error, verbose=True):
+        """번역하지 못한 텍스트의 대체 문자열 목록 (캐시/요소 상태에 저장되지 않아 다음 실행에서 다시 번역)"""
+        if verbose:
+            count = f", {len(texts)}개 텍스트" if len(texts) > 1 else ""
+            print(f"번역 오류 ({target_lang}{count}): {str(error)}")
+        return [f"{TRANSLATION_FAILED_PREFIX} {text[:50]}...]" for text in texts]
+    
+    def _translate_raw(self, text, target_lang):
+        """번역기 호출 (실패 시 예외 발생)"""
+        max_length = self.translator.max_text_length
+        if max_length and len(text) > max_length:
+            # 긴 텍스트 분할 처리
+            sentences = re.split(r'[.!?。！？]', text)
+            translated_sentences = []
+            
+            current_chunk = ""
+            for sentence in sentences:
+                if len(current_chunk + sentence) < max_length:
+                    current_chunk += sentence + "."
+                else:
+                    if current_chunk:
+                        translated_sentences.append(self._call_translator(self.translator.translate, current_chunk, target_lang))
+                    current_chunk = sentence + "."
+            
+            if current_chunk:
+                translated_sentences.append(self._call_translator(self.translator.translate, current_chunk, target_lang))
+            
+            return " ".join(translated_sentences)
+        
+        return self._call_translator(self.translator.translate, text, target_lang)
+    
+    def _translate_batch_raw(self, texts, target_lang):
+        """목록 번역을 지원하는 번역기로 여러 텍스트를 한 번에 번역 (실패 시 예외 발생)"""
+        return self._call_translator(self.translator.translate_batch, texts, target_lang)
+    
+    def _call_translator(self, func, payload, target_lang):
+        """네트워크 번역기는 공유 속도 제한을 거쳐 호출 (payload: 텍스트 또는 텍스트 목록)"""
+        chars = len(payload) if isinstance(payload, str) else sum(len(text) for text in payload)
+        self.profiler.count('chars_sent', chars)
+        self.profiler.count(f'chars_sent:{target_lang}', chars)
+        
+        with self.profiler.stage(f'translate:{target_lang}'):
+            if self.translator.requires_network:
+                return self.rate_limiter.call(func, payload, target_lang)
+            return func(payload, target_lang)
     
     def create_excel_file(self, text_elements, file_path, languages=['en', 'zh-cn', 'vi'], verbose=True):
         """엑셀 파일 생성"""
+        return self.create_output_file(text_elements, file_path, languages, verbose, 'xlsx')
+    
+    def create_output_file(self, text_elements, file_path, languages=['en', 'zh-cn', 'vi'], verbose=True,
+                           output_format=None, url=None, url_index=None):
+        """결과 파일 생성 (output_format이 없으면 파일 확장자로 판단, url/url_index는 요소에 없을 때 기록할 값)"""
+        output_format = output_format or format_from_path(file_path)
+        
         try:
             if verbose:
-                print("엑셀 파일 생성 중...")
-            
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "웹 텍스트 추출 결과"
-            
-            # 헤더 설정
-            headers = ["번호", "유형", "태그", "원본 텍스트(한국어)"]
+                print(f"결과 파일 생성 중 ({output_format})...")
             
             lang_names = {
                 'en': '영어',
@@ -132,82 +277,115 @@ class CLIWebTextExtractor:
                 'fr': '프랑스어'
             }
             
-            for lang in languages:
-                headers.append(f"{lang_names.get(lang, lang)} 번역")
+            language_headers = [f"{lang_names.get(lang, lang)} 번역" for lang in languages]
             
-            # 헤더 스타일 설정
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+            total_elements = len(text_elements)
+            if verbose:
+                print(f"번역 중 ({', '.join(languages)}): {total_elements}개 텍스트")
             
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = Alignment(horizontal='center')
+            # 요소 상태 저장소/작업 기록이 있으면 이전 실행(또는 중단 전)과 같은 요소는 저장된 번역으로 채움
+            # 번역 캐시를 끈 실행에서는 다른 페이지에서 번역한 공통 문구도 공통 문구 색인에서 채움
+            # (캐시가 있으면 같은 문구는 캐시에서 바로 찾으므로 색인에 번역을 중복으로 기억하지 않음)
+            boilerplate_memo = self.boilerplate if self.cache is None else None
+            incremental = url is not None and (self.element_store is not None or self.journal is not None
+                                               or boilerplate_memo is not None)
+            stored = {}
+            if incremental and boilerplate_memo is not None:
+                stored.update(boilerplate_memo.known_translations())
+            if incremental and self.element_store:
+                stored.update(self.element_store.lookup(url))
+            if incremental and self.journal:
+                stored.update(self.journal.lookup_elements(url))
+            entries = []
+            reused = 0
             
-            # 데이터 입력 및 번역
-            total_elements = len(text_elements)
+            def translated_chunks():
+                # 묶음 단위로 모든 언어를 동시에 번역
+                nonlocal reused
+                for chunk_start in range(0, total_elements, self.row_chunk_size):
+                    chunk = text_elements[chunk_start:chunk_start + self.row_chunk_size]
+                    texts = [element.text for element in chunk]
+                    with self.profiler.stage('translate', url):
+                        if incremental:
+                            chunk_entries = []
+                            translations, chunk_reused = self.translate_changed(texts, languages, stored, chunk_entries,
+                                                                                verbose, url)
+                            reused += chunk_reused
+                            entries.extend(chunk_entries)
+                            # 번역이 끝난 묶음은 바로 작업 기록에 남겨 중단되어도 다시 번역하지 않음
+                            if self.journal:
+                                self.journal.record_elements(url, chunk_entries)
+                            if boilerplate_memo is not None:
+                                boilerplate_memo.remember(url, chunk_entries)
+                        else:
+                            self.profiler.count('chars_translated', sum(len(text) for text in texts) * len(languages), url)
+                            translations = self.translate_languages(texts, languages, verbose)
+                    yield chunk_start, chunk, translations
             
-            for idx, element in enumerate(text_elements, 1):
-                if verbose:
-                    print(f"처리 중: {idx}/{total_elements} - {element['text'][:50]}...")
-                
-                row = idx + 1
-                ws.cell(row=row, column=1, value=idx)
-                ws.cell(row=row, column=2, value=element['type'])
-                ws.cell(row=row, column=3, value=element['tag'])
-                ws.cell(row=row, column=4, value=element['text'])
-                
-                col = 5
+            with create_output_writer(output_format, file_path, languages, language_headers=language_headers,
+                                      url=url, url_index=url_index) as writer:
+                # 다음 묶음을 번역하는 동안 번역이 끝난 묶음을 바로 내보냄 (쓰기가 밀리면 번역도 기다림)
+                for chunk_start, chunk, translations in prefetch(translated_chunks(), self.pipeline_depth):
+                    with self.profiler.stage('write', url):
+                        for offset, element in enumerate(chunk):
+                            if verbose:
+                                print(f"처리 중: {chunk_start + offset + 1}/{total_elements} - {element.text[:50]}...")
+                            
+                            # 선택된 언어의 번역 결과
+                            writer.write(element, [translations[lang][offset] for lang in languages])
                 
-                # 선택된 언어로 번역
-                for lang in languages:
-                    translated_text = self.translate_text(element['text'], lang, verbose)
-                    ws.cell(row=row, column=col, value=translated_text)
-                    col += 1
-            
-            # 열 너비 자동 조정
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
+                # 파일 저장
+                with self.profiler.stage('write', url):
+                    writer.save()
             
-            # 파일 저장
-            wb.save(file_path)
+            if incremental and self.element_store:
+                self.element_store.replace(url, entries, reused, total_elements - reused)
+            if incremental and verbose:
+                print(f"저장된 번역 재사용: {reused}개, 새로 번역: {total_elements - reused}개")
             
             if verbose:
-                print(f"엑셀 파일이 저장되었습니다: {file_path}")
+                print(f"결과 파일이 저장되었습니다: {file_path}")
             
             return True
             
         except Exception as e:
-            print(f"엑셀 파일 생성 오류: {str(e)}")
+            print(f"결과 파일 생성 오류: {str(e)}")
             return False
     
-    def process_url(self, url, output_file=None, languages=['en', 'zh-cn', 'vi'], verbose=True):
-        """URL 처리 메인 함수"""
+    def process_url(self, url, output_file=None, languages=['en', 'zh-cn', 'vi'], verbose=True, output_format=None):
+        """URL 처리 메인 함수 (output_format이 없으면 출력 파일 확장자로 판단, 기본값 xlsx)"""
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
         
+        if not output_format:
+            output_format = format_from_path(output_file) if output_file else DEFAULT_OUTPUT_FORMAT
+        
         if not output_file:
-            output_file = f"웹텍스트_추출_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+            output_file = f"웹텍스트_추출_{datetime.now().strftime('%Y%m%d_%H%M%S')}{format_extension(output_format)}"
         
         # 텍스트 추출
-        text_elements = self.extract_text_from_url(url, verbose)
+        text_elements, not_modified = self.fetch_elements(url, verbose)
         
         if not text_elements:
             print("텍스트 추출에 실패했습니다.")
             return False
         
-        # 엑셀 파일 생성
-        success = self.create_excel_file(text_elements, output_file, languages, verbose)
+        # 변경되지 않은 페이지는 이전 출력 파일 재사용
+        if not_modified and self.reuse_previous_output(url, output_file, languages, 1):
+            print(f"✅ 변경 없음 - 이전 결과를 재사용했습니다. 파일: {output_file}")
+            return True
+        
+        # 결과 파일 생성
+        success = self.create_output_file(text_elements, output_file, languages, verbose, output_format, url, 1)
+        
+        if success:
+            self.fetcher.remember_output(url, output_file, languages, 1)
+        
+        if verbose and self.cache:
+            print(self.cache.summary())
+        if verbose and self.translator.requires_network:
+            print(self.rate_limiter.summary())
+        save_report(self.profiler, self.profile_path or default_profile_path(output_file))
         
         if success:
             print(f"✅ 작업 완료! 파일: {output_file}")
@@ -224,13 +402,18 @@ def main():
 사용 예시:
   python cli_extractor.py https://example.com
   python cli_extractor.py https://example.com -o result.xlsx
+  python cli_extractor.py https://example.com -o result.parquet
   python cli_extractor.py https://example.com -l en zh-cn vi ja
   python cli_extractor.py https://example.com --quiet
+  python cli_extractor.py https://example.com --translator argos
+  python cli_extractor.py https://example.com --profile --cprofile
         """
     )
     
     parser.add_argument('url', help='추출할 웹페이지 URL')
-    parser.add_argument('-o', '--output', help='출력 엑셀 파일명')
+    parser.add_argument('-o', '--output', help='출력 파일명 (확장자로 형식 판단: .xlsx, .jsonl, .parquet, .arrow)')
+    parser.add_argument('-f', '--format', choices=available_formats(), default=None,
+                       help='출력 형식 (기본값: 출력 파일 확장자, 없으면 xlsx)')
     parser.add_argument('-l', '--languages', nargs='+', 
                        default=['en', 'zh-cn', 'vi'],
                        help='번역할 언어 코드 (기본값: en zh-cn vi)')
@@ -238,6 +421,29 @@ def main():
                        help='자세한 출력 비활성화')
     parser.add_argument('--list-languages', action='store_true',
                        help='지원되는 언어 코드 목록 표시')
+    parser.add_argument('-t', '--translation-workers', type=int, default=DEFAULT_WORKERS_PER_LANGUAGE,
+                       help=f'언어별 동시 번역 요청 수 (기본값: {DEFAULT_WORKERS_PER_LANGUAGE})')
+    parser.add_argument('--translation-rate', type=float, default=DEFAULT_TRANSLATION_RATE,
+                       help=f'초당 번역 요청 수 시작값 (오류/지연에 따라 자동 조절, 기본값: {DEFAULT_TRANSLATION_RATE})')
+    parser.add_argument('--translator', default=DEFAULT_TRANSLATOR, choices=available_translators(),
+                       help=f'번역기 백엔드 (기본값: {DEFAULT_TRANSLATOR}, argos는 오프라인 로컬 모델, stub은 부하 테스트용)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='번역 캐시 사용 안 함')
+    parser.add_argument('--cache-file', default=DEFAULT_CACHE_PATH,
+                       help=f'번역 캐시 파일 경로 (기본값: {DEFAULT_CACHE_PATH})')
+    parser.add_argument('--parser', default=DEFAULT_PARSER, choices=available_parsers(),
+                       help=f'HTML 파서 백엔드 (기본값: {DEFAULT_PARSER}, lxml이 더 빠름. 잘못 중첩된 마크업(닫지 않은 p/li, '
+                            'p 안의 블록, a 안의 a)에서는 요소가 다르게 나뉠 수 있음)')
+    parser.add_argument('--refresh', action='store_true',
+                       help='저장된 ETag/Last-Modified를 무시하고 항상 새로 가져오기')
+    parser.add_argument('--max-page-size', type=float, default=DEFAULT_MAX_BODY_BYTES / 1024 / 1024,
+                       help=f'받을 수 있는 최대 페이지 크기 (MB, 넘으면 중단, 기본값: {DEFAULT_MAX_BODY_BYTES // 1024 // 1024})')
+    parser.add_argument('--profile', action='store_true',
+                       help='단계별 시간(가져오기/파싱/번역/쓰기)을 측정하여 요약 출력 및 JSON 저장')
+    parser.add_argument('--profile-output',
+                       help='측정 결과 JSON 경로 (기본값: <출력 파일 이름>_profile.json)')
+    parser.add_argument('--cprofile', action='store_true',
+                       help='--profile과 함께 함수별 cProfile 결과도 수집 (.prof 파일과 상위 함수 출력)')
     
     args = parser.parse_args()
     
@@ -263,14 +469,27 @@ def main():
             print(f"  {code}: {name}")
         return
     
-    extractor = CLIWebTextExtractor()
+    extractor = CLIWebTextExtractor(
+        use_cache=not args.no_cache,
+        cache_path=args.cache_file,
+        translation_workers=args.translation_workers,
+        use_validators=not args.refresh,
+        html_parser=args.parser,
+        translation_rate=args.translation_rate,
+        translator=args.translator,
+        max_page_bytes=int(args.max_page_size * 1024 * 1024)
+    )
+    if args.profile or args.cprofile:
+        extractor.profiler = PipelineProfiler(cprofile=args.cprofile)
+        extractor.profile_path = args.profile_output
     
     try:
         success = extractor.process_url(
             args.url, 
             args.output, 
             args.languages, 
-            not args.quiet
+            not args.quiet,
+            args.format
         )
         
         sys.exit(0 if success else 1)
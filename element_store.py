@@ -0,0 +1,100 @@
+"""
+URL별 요소 상태 저장소
+URL마다 추출한 요소의 내용 해시와 그 요소의 번역을 SQLite 파일에 기록하여,
+같은 URL 목록을 다시 처리할 때 새로 생기거나 바뀐 요소만 번역하고 나머지는 저장된 번역으로 채움
+"""
+
+import os
+import sqlite3
+import hashlib
+import threading
+import time
+from translation_cache import DEFAULT_CACHE_DIR
+
+DEFAULT_STATE_PATH = os.path.join(DEFAULT_CACHE_DIR, 'element_state.db')
+
+
+def content_hash(text):
+    """요소 내용 해시 (번역은 텍스트에만 의존하므로 텍스트로 계산)"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class ElementStore:
+    def __init__(self, db_path=DEFAULT_STATE_PATH, namespace=None):
+        """
+        namespace: 번역 엔진이 다른 상태끼리 섞이지 않도록 구분 (None이면 기본 공간)
+        """
+        self.db_path = db_path
+        self.namespace = namespace
+        self.reused = 0
+        self.translated = 0
+        self.url_counts = {}  # URL -> (재사용 수, 새로 번역한 수), 이번 실행 기준
+        self.lock = threading.Lock()
+
+        state_dir = os.path.dirname(db_path)
+        if state_dir and not os.path.exists(state_dir):
+            os.makedirs(state_dir, exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS elements (
+                url TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                lang TEXT NOT NULL,
+                translated_text TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (url, content_hash, lang)
+            )
+        """)
+        self.conn.commit()
+
+    def _key(self, url):
+        """저장에 쓰는 URL 키 (이름 공간이 있으면 앞에 붙임)"""
+        return f"{self.namespace}\x00{url}" if self.namespace else url
+
+    def lookup(self, url):
+        """URL의 저장된 번역 ({(내용 해시, 언어 코드): 번역})"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT content_hash, lang, translated_text FROM elements WHERE url = ?", (self._key(url),)
+            ).fetchall()
+
+        return {(row_hash, lang): translated_text for row_hash, lang, translated_text in rows}
+
+    def replace(self, url, entries, reused, translated):
+        """URL의 요소 상태를 이번 결과로 교체 (페이지에서 사라진 요소는 삭제)
+
+        entries: (내용 해시, 언어 코드, 번역) 목록
+        reused/translated: 저장된 번역을 재사용한 요소 수 / 새로 번역한 요소 수
+        """
+        now = time.time()
+        key = self._key(url)
+
+        with self.lock:
+            self.conn.execute("DELETE FROM elements WHERE url = ?", (key,))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO elements (url, content_hash, lang, translated_text, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ((key, row_hash, lang, translated_text, now) for row_hash, lang, translated_text in entries)
+            )
+            self.conn.commit()
+
+            self.reused += reused
+            self.translated += translated
+            self.url_counts[url] = (reused, translated)
+
+    def stats(self):
+        """재사용/새로 번역 통계"""
+        return {
+            'reused': self.reused,
+            'translated': self.translated
+        }
+
+    def summary(self):
+        """통계 요약 문자열"""
+        return f"요소 상태 - 재사용: {self.reused}개, 새로 번역: {self.translated}개"
+
+    def close(self):
+        """연결 종료"""
+        with self.lock:
+            self.conn.close()
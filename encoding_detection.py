@@ -0,0 +1,207 @@
+"""
+문서 인코딩 판별
+본문 전체에 통계적 판별(apparent_encoding)을 돌리는 대신 값싼 근거부터 차례로 확인
+1. BOM  2. Content-Type 헤더의 charset  3. 앞부분의 <meta charset> / http-equiv 선언
+4. 앞부분이 UTF-8로 읽히는지  5. 같은 호스트에서 이전에 판별한 인코딩
+6. 마지막 수단으로 앞부분(기본 64KB)에만 통계적 판별 (charset_normalizer 또는 chardet)
+판별한 인코딩으로 직접 디코딩한 문자열을 파서에 넘기므로 파서도 인코딩을 다시 판별하지 않음
+"""
+
+import re
+import codecs
+import threading
+from urllib.parse import urlparse
+
+try:
+    import charset_normalizer
+except ImportError:
+    charset_normalizer = None
+
+try:
+    import chardet
+except ImportError:
+    chardet = None
+
+DEFAULT_DETECTION_BYTES = 64 * 1024
+META_SCAN_BYTES = 4096
+FALLBACK_ENCODING = 'utf-8'
+
+BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# 브라우저(WHATWG)처럼 선언된 인코딩을 상위 호환 인코딩으로 읽음
+ENCODING_ALIASES = {
+    'euc-kr': 'cp949',
+    'ks_c_5601-1987': 'cp949',
+    'iso-8859-1': 'cp1252',
+    'latin-1': 'cp1252',
+    'ascii': 'cp1252',
+    'us-ascii': 'cp1252',
+    'gb2312': 'gb18030',
+    'gbk': 'gb18030',
+    'shift_jis': 'cp932',
+}
+
+# 요약에 표시하는 판별 근거 이름
+SOURCE_LABELS = {
+    'bom': 'BOM',
+    'header': 'Content-Type',
+    'meta': 'meta 선언',
+    'utf-8': 'UTF-8',
+    'host': '호스트 캐시',
+    'detected': '통계적 판별',
+    'fallback': '기본값',
+}
+
+CONTENT_TYPE_CHARSET_PATTERN = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.I)
+META_CHARSET_PATTERN = re.compile(
+    rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.I
+)
+
+
+def normalize_encoding(name):
+    """파이썬 코덱 이름으로 변환 (알 수 없는 인코딩이면 None)"""
+    if not name:
+        return None
+    name = name.strip().lower()
+    name = ENCODING_ALIASES.get(name, name)
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def charset_from_content_type(content_type):
+    """Content-Type 헤더의 charset (없으면 None)"""
+    if not content_type:
+        return None
+    match = CONTENT_TYPE_CHARSET_PATTERN.search(content_type)
+    return normalize_encoding(match.group(1)) if match else None
+
+
+def bom_encoding(content):
+    """BOM으로 표시된 인코딩 (없으면 None)"""
+    for bom, encoding in BOMS:
+        if content.startswith(bom):
+            return encoding
+    return None
+
+
+def meta_charset(content, limit=META_SCAN_BYTES):
+    """문서 앞부분의 <meta charset> 또는 http-equiv Content-Type 선언 (없으면 None)"""
+    match = META_CHARSET_PATTERN.search(content[:limit])
+    if not match:
+        return None
+    encoding = normalize_encoding(match.group(1).decode('ascii', 'ignore'))
+    # UTF-16/32 선언은 ASCII로 읽힌 문서에서는 맞을 수 없으므로 UTF-8로 봄 (HTML 표준과 같음)
+    if encoding and encoding.startswith(('utf-16', 'utf-32')):
+        return 'utf-8'
+    return encoding
+
+
+def decodes_as(content, encoding):
+    """앞부분이 주어진 인코딩으로 오류 없이 디코딩되는지 (끝에서 잘린 멀티바이트 문자는 허용)"""
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(content, final=False)
+        return True
+    except (UnicodeDecodeError, LookupError):
+        return False
+
+
+def detect_statistically(content):
+    """통계적 인코딩 판별 (판별 라이브러리가 없거나 실패하면 None)"""
+    if charset_normalizer is not None:
+        best = charset_normalizer.from_bytes(content).best()
+        return normalize_encoding(best.encoding) if best else None
+    if chardet is not None:
+        return normalize_encoding(chardet.detect(content).get('encoding'))
+    return None
+
+
+class EncodingResolver:
+    def __init__(self, detection_bytes=DEFAULT_DETECTION_BYTES):
+        """
+        detection_bytes: 통계적 판별과 UTF-8 확인에 사용할 앞부분 크기
+        """
+        self.detection_bytes = detection_bytes
+        self.host_encodings = {}  # 호스트 -> 선언 없이 판별한 인코딩
+        self.sources = {}         # 판별 근거 -> 횟수
+        self.lock = threading.Lock()
+
+    def resolve(self, url, content, content_type=None):
+        """문서 인코딩 판별 (반환값: (인코딩, 판별 근거))"""
+        encoding, source = self._resolve(url, content, content_type)
+        with self.lock:
+            self.sources[source] = self.sources.get(source, 0) + 1
+        return encoding, source
+
+    def _resolve(self, url, content, content_type):
+        encoding = bom_encoding(content)
+        if encoding:
+            return encoding, 'bom'
+
+        encoding = charset_from_content_type(content_type)
+        if encoding:
+            return encoding, 'header'
+
+        encoding = meta_charset(content)
+        if encoding:
+            return encoding, 'meta'
+
+        prefix = content[:self.detection_bytes]
+        if decodes_as(prefix, 'utf-8'):
+            return 'utf-8', 'utf-8'
+
+        host = urlparse(url).netloc if url else None
+        with self.lock:
+            cached = self.host_encodings.get(host)
+        if cached and decodes_as(prefix, cached):
+            return cached, 'host'
+
+        encoding = detect_statistically(prefix)
+        if encoding:
+            if host:
+                with self.lock:
+                    self.host_encodings[host] = encoding
+            return encoding, 'detected'
+
+        return FALLBACK_ENCODING, 'fallback'
+
+    def decode(self, url, content, content_type=None):
+        """판별한 인코딩으로 본문 디코딩 (잘못된 바이트는 대체 문자로 바꿈)"""
+        if isinstance(content, str):
+            return content
+        encoding, source = self.resolve(url, content, content_type)
+        return content.decode(encoding, errors='replace')
+
+    def decode_chunks(self, url, chunks, content_type=None):
+        """바이트 조각을 받아 디코딩한 문자열 조각을 차례로 반환 (앞부분만 모아 인코딩을 판별한 뒤 바로 흘려보냄)"""
+        chunks = iter(chunks)
+        prefix = b''
+        for chunk in chunks:
+            prefix += chunk
+            if len(prefix) >= self.detection_bytes:
+                break
+
+        encoding, source = self.resolve(url, prefix, content_type)
+        decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        yield decoder.decode(prefix)
+        for chunk in chunks:
+            yield decoder.decode(chunk)
+        yield decoder.decode(b'', final=True)
+
+    def stats(self):
+        """판별 근거별 횟수"""
+        with self.lock:
+            return dict(self.sources)
+
+    def summary(self):
+        """통계 요약 문자열"""
+        stats = self.stats()
+        counts = ', '.join(f"{SOURCE_LABELS.get(source, source)} {count}개" for source, count in stats.items())
+        return f"인코딩 판별 - {counts or '없음'} (통계적 판별 호스트: {len(self.host_encodings)}개)"
@@ -0,0 +1,82 @@
+"""
+스트리밍 엑셀 쓰기
+행을 메모리에 쌓지 않고 준비되는 즉시 임시 파일로 내보내면서 열별 최대 길이만 기록하고,
+저장할 때 열 너비를 먼저 정한 뒤 openpyxl 쓰기 전용(write-only) 모드로 행을 흘려 보내므로
+출력 행 수와 관계없이 메모리 사용량이 일정함
+"""
+
+import json
+import tempfile
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.utils import get_column_letter
+
+DEFAULT_SHEET_TITLE = "웹 텍스트 추출 결과"
+MAX_COLUMN_WIDTH = 50
+
+
+class StreamingExcelWriter:
+    def __init__(self, file_path, headers, title=DEFAULT_SHEET_TITLE, max_column_width=MAX_COLUMN_WIDTH):
+        self.file_path = file_path
+        self.headers = list(headers)
+        self.title = title
+        self.max_column_width = max_column_width
+        self.row_count = 0
+
+        # 열별 최대 글자 수 (헤더 포함)
+        self.column_lengths = [len(str(header)) for header in self.headers]
+        self.spool = tempfile.TemporaryFile(mode='w+', encoding='utf-8')
+
+    def write_row(self, values):
+        """행 하나 기록 (열 너비 통계만 남기고 바로 임시 파일로 내보냄)"""
+        for col, value in enumerate(values):
+            length = len(str(value))
+            if col >= len(self.column_lengths):
+                self.column_lengths.append(length)
+            elif length > self.column_lengths[col]:
+                self.column_lengths[col] = length
+
+        self.spool.write(json.dumps(values, ensure_ascii=False))
+        self.spool.write('\n')
+        self.row_count += 1
+
+    def save(self):
+        """열 너비를 정한 뒤 기록된 행을 쓰기 전용 통합 문서로 저장"""
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(self.title)
+
+        # 열 너비 자동 조정 (쓰기 전용 모드는 첫 행 전에 정해야 함)
+        for col, max_length in enumerate(self.column_lengths, 1):
+            ws.column_dimensions[get_column_letter(col)].width = min(max_length + 2, self.max_column_width)
+
+        # 헤더 스타일 설정
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+
+        header_row = []
+        for header in self.headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = Alignment(horizontal='center')
+            header_row.append(cell)
+        ws.append(header_row)
+
+        self.spool.seek(0)
+        for line in self.spool:
+            ws.append(json.loads(line))
+
+        wb.save(self.file_path)
+        self.close()
+
+    def close(self):
+        """임시 파일 정리 (저장하지 않고 닫으면 기록한 행은 버려짐)"""
+        if not self.spool.closed:
+            self.spool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
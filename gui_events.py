@@ -0,0 +1,85 @@
+"""
+작업 스레드 → GUI 이벤트 전달
+작업 스레드는 로그/상태/진행률/대화상자 이벤트를 스레드 안전한 큐에 넣기만 하고 Tk 위젯은 건드리지 않음
+Tk 메인 루프가 after() 타이머로 큐를 비우면서 쌓인 이벤트를 합쳐 한 번에 반영
+- 로그: 쌓인 줄을 한 번에 추가 (한 번에 max_log_lines 줄까지만, 그보다 오래된 줄은 버림)
+- 상태 문자열/진행률: 마지막 값만 반영
+- 대화상자/작업 완료: 순서대로 하나씩 처리 (앞에 쌓인 로그/상태를 먼저 반영)
+"""
+
+import queue
+from collections import deque
+
+DEFAULT_POLL_INTERVAL_MS = 50   # 큐를 비우는 주기
+DEFAULT_LOG_MAX_LINES = 1000    # 로그 창에 남기는 최대 줄 수
+MAX_EVENTS_PER_POLL = 20000     # 한 번에 처리하는 최대 이벤트 수 (메인 루프가 오래 멈추지 않도록)
+
+# 합쳐서 마지막 값만 반영하는 이벤트
+COALESCED_EVENTS = ('status', 'progress')
+
+
+class GuiEventQueue:
+    def __init__(self, max_log_lines=DEFAULT_LOG_MAX_LINES):
+        """
+        max_log_lines: 한 번에 반영하는 최대 로그 줄 수 (로그 창의 최대 줄 수와 같게 둠)
+        """
+        self.events = queue.SimpleQueue()
+        self.max_log_lines = max_log_lines
+        self.dropped_lines = 0  # 화면에 반영하기 전에 버린 로그 줄 수
+
+    def log(self, line):
+        """로그 한 줄 추가"""
+        self.events.put(('log', line))
+
+    def status(self, text):
+        """상태 문자열 변경"""
+        self.events.put(('status', text))
+
+    def progress(self, value, maximum):
+        """진행률 변경 (value/maximum)"""
+        self.events.put(('progress', (value, maximum)))
+
+    def dialog(self, kind, title, message):
+        """메시지 상자 표시 (kind: 'info', 'error')"""
+        self.events.put(('dialog', (kind, title, message)))
+
+    def finished(self):
+        """작업 종료 (실행 버튼 다시 활성화 등)"""
+        self.events.put(('finished', None))
+
+    def drain(self, max_events=MAX_EVENTS_PER_POLL):
+        """쌓인 이벤트를 합쳐 반환 (반환값: 순서대로 반영할 (종류, 값) 목록, 로그 값은 줄 목록)"""
+        updates = []
+        lines = deque(maxlen=self.max_log_lines)
+        latest = {}
+
+        def flush():
+            if lines:
+                updates.append(('log', list(lines)))
+                lines.clear()
+            for kind in COALESCED_EVENTS:
+                if kind in latest:
+                    updates.append((kind, latest.pop(kind)))
+
+        for _ in range(max_events):
+            try:
+                kind, value = self.events.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == 'log':
+                if len(lines) == lines.maxlen:
+                    self.dropped_lines += 1
+                lines.append(value)
+            elif kind in COALESCED_EVENTS:
+                latest[kind] = value
+            else:
+                flush()
+                updates.append((kind, value))
+
+        flush()
+        return updates
+
+    def empty(self):
+        """처리할 이벤트가 없는지"""
+        return self.events.empty()
@@ -0,0 +1,405 @@
+"""
+HTML 텍스트 요소 추출
+네트워크와 무관한 순수 파싱 단계로 분리하여 작업 풀에서 실행할 수 있도록 함
+
+파서 백엔드
+- html.parser: BeautifulSoup + 파이썬 내장 파서 (기본값)
+- lxml: libxml2 기반 C 파서로 직접 트리를 만듦 (pip install lxml)
+
+올바르게 중첩된 문서에서는 두 백엔드의 추출 결과가 같지만, 잘못 중첩된 마크업에서는 트리 모양이 달라 결과가 다름
+(benchmarks/corpus/malformed_*.html)
+- html.parser는 닫는 태그가 나올 때까지 요소를 열어 둠: 닫는 태그가 없는 p/li는 뒤따르는 요소를 모두 품고,
+  p 안의 div, a 안의 a도 그대로 하위 요소가 됨
+- lxml은 HTML 규칙대로 요소를 암묵적으로 닫음: 새 p/li나 블록 요소가 나오면 열린 p/li를 닫고, a 안의 a는 바깥 a를 닫음
+따라서 lxml로 바꾸면 이런 페이지에서는 요소가 더 잘게 나뉘고 번역 단위와 중복 제거 결과가 달라질 수 있음
+
+두 백엔드 모두 트리를 한 번만 순회하며 모든 텍스트 조각을 문서 순서대로 한 목록에 모으고,
+각 요소는 그 목록의 [시작, 끝) 범위로 기록함. 요소의 텍스트(get_text(strip=True)와 동일)는
+필요할 때만 범위를 이어 붙여 만들므로 중첩된 요소마다 하위 텍스트를 다시 읽지 않음
+
+문서는 바이트, 문자열 또는 문자열 조각 이터레이터로 받음
+lxml 백엔드는 조각을 받는 대로 파서에 넣어 전체 문서 문자열을 만들지 않음 (html.parser는 이어 붙여 파싱)
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from bs4 import BeautifulSoup, UnicodeDammit
+from bs4.element import Tag, NavigableString, CData
+from text_dedup import ElementDeduplicator
+from text_element import TextElement
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+REMOVED_TAGS = ['script', 'style', 'nav', 'header', 'footer', 'aside']
+HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+CONTENT_TAGS = ['p', 'div', 'span', 'li']
+
+# GUI(DOM 순서) 추출 규칙
+BLOCK_TAGS = {'p', 'li', 'td', 'th', 'blockquote', 'pre'}
+INLINE_TAGS = {'span', 'a', 'strong', 'b', 'em', 'i', 'code', 'label'}
+CONTAINER_TAGS = {'div', 'section', 'article', 'ul', 'ol', 'table', 'tbody', 'thead', 'tr'}
+MAIN_CLASS_PATTERN = re.compile(r'content|main|body', re.I)
+
+# BeautifulSoup의 get_text가 제외하는 문자열 컨테이너 (루비 주석, 템플릿)
+SKIPPED_STRING_TAGS = {'rt', 'rp', 'template'}
+TEXT_STRING_TYPES = (NavigableString, CData)
+
+DEFAULT_PARSER = 'html.parser'
+
+
+class DocumentText:
+    """한 번의 순회로 만든 텍스트 조각 목록과 요소 범위
+
+    nodes: 문서 순서(전위 순회)의 [태그, 시작, 끝, 다음 형제 위치] 목록
+           텍스트 노드는 태그가 None이고 조각 하나를 가리킴
+    """
+
+    def __init__(self):
+        self.pieces = []
+        self.nodes = []
+        self._offsets = None
+
+    def text(self, start, end):
+        """범위의 텍스트 (get_text(strip=True)와 동일)"""
+        return ''.join(self.pieces[start:end])
+
+    def length(self, start, end):
+        """범위의 텍스트 길이 (문자열을 만들지 않고 계산)"""
+        if self._offsets is None:
+            offsets = [0]
+            total = 0
+            for piece in self.pieces:
+                total += len(piece)
+                offsets.append(total)
+            self._offsets = offsets
+        return self._offsets[end] - self._offsets[start]
+
+    def add_text(self, text):
+        text = text.strip()
+        if text:
+            self.nodes.append([None, len(self.pieces), len(self.pieces) + 1, len(self.nodes) + 1])
+            self.pieces.append(text)
+
+    def open_element(self, tag):
+        self.nodes.append([tag, len(self.pieces), None, None])
+        return len(self.nodes) - 1
+
+    def close_element(self, index):
+        node = self.nodes[index]
+        node[2] = len(self.pieces)
+        node[3] = len(self.nodes)
+
+
+def extract_elements(content, parser=DEFAULT_PARSER):
+    """HTML 바이트(또는 문자열, 문자열 조각 이터레이터)에서 텍스트 요소 목록 추출 (CLI 규칙)"""
+    root = _load_backend(parser).parse(content)
+    if root is None:
+        return []
+
+    document = _load_backend(parser).walk(root)
+    dedup = ElementDeduplicator()
+
+    # 제목들 추출
+    heading_tags = set(HEADING_TAGS)
+    heading_starts = []
+    heading_ends = []
+    for tag, start, end, skip in document.nodes:
+        if tag in heading_tags and document.length(start, end) > 1:
+            dedup.add(TextElement('heading', tag, document.text(start, end)))
+            heading_starts.append(start)
+            heading_ends.append(end)
+
+    # 본문 텍스트 추출 (기존 요소와 포함 관계가 있으면 중복으로 제외)
+    content_tags = set(CONTENT_TAGS)
+    accepted_end = -1
+    for tag, start, end, skip in document.nodes:
+        if tag not in content_tags or document.length(start, end) <= 10:
+            continue
+
+        # 구조만으로 판별되는 중복은 문자열을 만들지 않고 제외
+        # - 이미 추가된 상위 요소 안의 요소는 그 텍스트의 부분 문자열
+        # - 제목을 품고 있거나 제목 안에 있는 요소는 제목과 포함 관계
+        if start < accepted_end:
+            continue
+        if _contains_range(heading_starts, heading_ends, start, end):
+            continue
+        if _inside_range(heading_starts, heading_ends, start, end):
+            continue
+
+        added = dedup.add_if_not_overlapping(TextElement('content', tag, document.text(start, end)))
+        if added:
+            accepted_end = end
+
+    return dedup.elements()
+
+
+def extract_dom_elements(content, parser=DEFAULT_PARSER):
+    """HTML에서 본문 영역을 찾아 DOM 순서대로 텍스트 요소 추출 (GUI 규칙)"""
+    backend = _load_backend(parser)
+    root = backend.parse(content)
+    if root is None:
+        return []
+
+    # 메인 컨텐츠 영역 찾기 (없으면 body)
+    main_content = backend.find_main_content(root)
+    if main_content is None:
+        return []
+
+    document = backend.walk(main_content)
+    dedup = ElementDeduplicator()
+    nodes = document.nodes
+
+    # 컨테이너는 하위로 내려가고 나머지 요소는 통째로 건너뛰며 문서 순서대로 처리
+    position = 1
+    while position < len(nodes):
+        tag, start, end, skip = nodes[position]
+
+        # 텍스트 노드인 경우 (순수 텍스트)
+        if tag is None:
+            text = document.pieces[start]
+            if len(text) > 2 and not text.startswith('<'):
+                text_clean = text.replace('\n', ' ').replace('\t', ' ').strip()
+                # 공백만 있거나 특수문자만 있는 경우 제외
+                if text_clean and text_clean not in dedup and len(text_clean.replace(' ', '')) > 1:
+                    dedup.add(TextElement('content', 'text', text_clean))
+            position = skip
+            continue
+
+        # div, section 등 컨테이너 요소는 하위 요소들을 이어서 처리
+        if tag in CONTAINER_TAGS:
+            position += 1
+            continue
+
+        position = skip
+
+        # 제목 태그들은 개별적으로 처리
+        if tag in HEADING_TAGS:
+            text = document.text(start, end)
+            if text and len(text) > 1:
+                text_clean = text.replace('\n', ' ').replace('\t', ' ').strip()
+                if text_clean and text_clean not in dedup:
+                    dedup.add(TextElement('heading', tag, text_clean))
+
+        # 단락, 리스트 항목 등은 개별적으로 처리
+        elif tag in BLOCK_TAGS:
+            text = document.text(start, end)
+            if text and len(text) > 2:
+                text_clean = text.replace('\n', ' ').replace('\t', ' ').strip()
+                # 중복 체크 (90% 이상 겹치면 중복으로 간주, 더 긴 텍스트는 기존 요소를 교체)
+                if text_clean:
+                    dedup.add_or_replace(TextElement('content', tag, text_clean))
+
+        # 인라인 요소들 - 텍스트가 의미있는 경우만
+        elif tag in INLINE_TAGS:
+            text = document.text(start, end)
+            if text and len(text) > 1:
+                text_clean = text.replace('\n', ' ').replace('\t', ' ').strip()
+                if text_clean and text_clean not in dedup:
+                    # 너무 짧거나 의미없는 텍스트 제외
+                    if len(text_clean) > 2 and not text_clean.isdigit():
+                        dedup.add(TextElement('content', tag, text_clean))
+
+    return dedup.elements()
+
+
+def supports_incremental(parser):
+    """문자열 조각을 받는 대로 파싱하는 백엔드인지"""
+    return _load_backend(parser).incremental
+
+
+def available_parsers():
+    """현재 환경에서 사용 가능한 파서 목록"""
+    return [name for name in PARSER_BACKENDS if name != 'lxml' or lxml is not None]
+
+
+def _load_backend(parser):
+    backend = PARSER_BACKENDS.get(parser)
+    if backend is None:
+        raise ValueError(f"지원하지 않는 파서입니다: {parser} (사용 가능: {', '.join(PARSER_BACKENDS)})")
+    return backend
+
+
+def _contains_range(starts, ends, start, end):
+    """[start, end) 안에 완전히 들어가는 범위가 있는지 (starts는 오름차순)"""
+    index = bisect_left(starts, start)
+    while index < len(starts) and starts[index] < end:
+        if ends[index] <= end:
+            return True
+        index += 1
+    return False
+
+
+def _inside_range(starts, ends, start, end):
+    """[start, end)를 감싸는 가장 가까운 범위가 있는지 (starts는 오름차순)"""
+    index = bisect_right(starts, start) - 1
+    return index >= 0 and ends[index] >= end
+
+
+class HtmlParserBackend:
+    """BeautifulSoup(html.parser) 백엔드"""
+
+    incremental = False
+
+    @staticmethod
+    def parse(content):
+        if not isinstance(content, (bytes, str)):
+            content = ''.join(content)
+        soup = BeautifulSoup(content, 'html.parser')
+
+        # 불필요한 태그 제거
+        for tag in soup(REMOVED_TAGS):
+            tag.decompose()
+
+        return soup
+
+    @staticmethod
+    def find_main_content(soup):
+        return (soup.find('main') or soup.find('article') or soup.find(class_=MAIN_CLASS_PATTERN)
+                or soup.find('body'))
+
+    @staticmethod
+    def walk(root):
+        """트리를 한 번 순회하여 DocumentText 생성 (깊은 중첩에서도 재귀 없이 동작)"""
+        document = DocumentText()
+        skipped_depth = 0
+        stack = [(root, None)]
+        # 노드마다 호출되므로 메서드를 미리 꺼내 둠
+        pop = stack.pop
+        push = stack.append
+        open_element = document.open_element
+        close_element = document.close_element
+        add_text = document.add_text
+
+        while stack:
+            node, open_index = pop()
+
+            # 요소 닫기
+            if open_index is not None:
+                close_element(open_index)
+                if node.name in SKIPPED_STRING_TAGS:
+                    skipped_depth -= 1
+                continue
+
+            if isinstance(node, Tag):
+                name = node.name
+                index = open_element(name)
+                if name in SKIPPED_STRING_TAGS:
+                    skipped_depth += 1
+                push((node, index))
+                for child in reversed(node.contents):
+                    push((child, None))
+            elif type(node) in TEXT_STRING_TYPES and not skipped_depth:
+                add_text(node)
+
+        return document
+
+
+class LxmlBackend:
+    """lxml 백엔드 (인코딩 판별은 BeautifulSoup과 같은 방식으로 하여 결과를 맞춤)"""
+
+    incremental = True
+
+    @staticmethod
+    def parse(content):
+        if lxml is None:
+            raise ImportError("lxml 파서를 사용하려면 lxml이 필요합니다: pip install lxml")
+
+        if not isinstance(content, (bytes, str)):
+            return LxmlBackend._remove_tags(LxmlBackend._parse_chunks(content))
+
+        if isinstance(content, bytes):
+            content = UnicodeDammit(content, is_html=True).unicode_markup or ''
+        if not content.strip():
+            return None
+
+        parser = lxml.html.HTMLParser(encoding='utf-8')
+        try:
+            root = lxml.html.document_fromstring(content.encode('utf-8'), parser=parser)
+        except etree.ParserError:
+            return None
+
+        return LxmlBackend._remove_tags(root)
+
+    @staticmethod
+    def _parse_chunks(chunks):
+        """문자열 조각을 받는 대로 파서에 넣어 트리 생성 (내용이 없으면 None)"""
+        parser = lxml.html.HTMLParser(encoding='utf-8')
+        has_content = False
+        for chunk in chunks:
+            if not has_content and not chunk.strip():
+                continue
+            has_content = True
+            parser.feed(chunk.encode('utf-8'))
+        if not has_content:
+            return None
+        return parser.close()
+
+    @staticmethod
+    def _remove_tags(root):
+        """불필요한 태그 제거 (뒤따르는 텍스트는 유지)"""
+        if root is None:
+            return None
+        for element in list(root.iter(*REMOVED_TAGS)):
+            if element.getparent() is not None:
+                element.drop_tree()
+        return root
+
+    @staticmethod
+    def find_main_content(root):
+        for tag in ('main', 'article'):
+            for element in root.iter(tag):
+                return element
+
+        for element in root.iter():
+            class_name = element.get('class') if isinstance(element.tag, str) else None
+            if class_name and MAIN_CLASS_PATTERN.search(class_name):
+                return element
+
+        for element in root.iter('body'):
+            return element
+
+        return None
+
+    @staticmethod
+    def walk(root):
+        """트리를 한 번 순회하여 DocumentText 생성 (요소 뒤 텍스트(tail)는 부모 쪽에 포함)"""
+        document = DocumentText()
+        skipped_depth = 0
+        stack = [(root, None)]
+
+        while stack:
+            element, open_index = stack.pop()
+
+            if open_index is not None:
+                document.close_element(open_index)
+                if element.tag in SKIPPED_STRING_TAGS:
+                    skipped_depth -= 1
+                if element is not root and element.tail and not skipped_depth:
+                    document.add_text(element.tail)
+                continue
+
+            # 주석/처리 명령은 내용은 제외하고 뒤따르는 텍스트만 포함
+            if not isinstance(element.tag, str):
+                if element.tail and not skipped_depth:
+                    document.add_text(element.tail)
+                continue
+
+            index = document.open_element(element.tag)
+            if element.tag in SKIPPED_STRING_TAGS:
+                skipped_depth += 1
+            if element.text and not skipped_depth:
+                document.add_text(element.text)
+            stack.append((element, index))
+            stack.extend((child, None) for child in reversed(element))
+
+        return document
+
+
+PARSER_BACKENDS = {
+    'html.parser': HtmlParserBackend,
+    'lxml': LxmlBackend,
+}
@@ -0,0 +1,208 @@
+"""
+공용 HTTP 가져오기 계층
+호스트별 연결 풀(keep-alive)을 공유하고, ETag/Last-Modified 검증값을 디스크에 저장해
+다음 실행 시 조건부 GET(If-None-Match/If-Modified-Since)을 보냄
+304 응답이면 이전 추출 결과를 그대로 재사용
+본문은 조각 단위로 읽으며 최대 크기를 넘거나 HTML이 아닌 응답은 본문을 다 받기 전에 중단
+"""
+
+import os
+import json
+import sqlite3
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from translation_cache import DEFAULT_CACHE_DIR
+from text_element import TextElement
+
+DEFAULT_VALIDATOR_PATH = os.path.join(DEFAULT_CACHE_DIR, 'http_validators.db')
+
+DEFAULT_MAX_BODY_BYTES = 20 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Content-Type 헤더가 없는 응답은 허용
+DEFAULT_ALLOWED_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+class ResponseRejected(requests.RequestException):
+    """본문을 끝까지 받지 않고 거부한 응답 (허용하지 않는 Content-Type, 최대 크기 초과)"""
+
+
+def check_content_type(content_type, allowed_types=DEFAULT_ALLOWED_CONTENT_TYPES):
+    """허용하지 않는 Content-Type이면 ResponseRejected 발생 (allowed_types가 None이면 모두 허용)"""
+    if not content_type or allowed_types is None:
+        return
+    media_type = content_type.split(';', 1)[0].strip().lower()
+    if media_type not in allowed_types:
+        raise ResponseRejected(f"HTML이 아닌 응답입니다: {media_type}")
+
+
+def check_body_size(size, max_bytes=DEFAULT_MAX_BODY_BYTES):
+    """본문 크기가 최대 크기를 넘으면 ResponseRejected 발생 (max_bytes가 None이면 제한 없음)"""
+    if max_bytes is not None and size > max_bytes:
+        raise ResponseRejected(f"본문이 최대 크기({max_bytes / 1024 / 1024:.1f}MB)를 넘습니다")
+
+
+class HttpFetcher:
+    def __init__(self, namespace='default', validator_path=DEFAULT_VALIDATOR_PATH, use_validators=True,
+                 pool_connections=20, pool_maxsize=10, timeout=30, max_bytes=DEFAULT_MAX_BODY_BYTES,
+                 allowed_types=DEFAULT_ALLOWED_CONTENT_TYPES, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        namespace: 추출 방식이 다른 도구(CLI/GUI)끼리 저장된 결과가 섞이지 않도록 구분
+        pool_connections: 연결 풀을 유지할 호스트 수
+        pool_maxsize: 호스트당 유지할 연결 수
+        max_bytes: 받을 수 있는 최대 본문 크기 (None이면 제한 없음)
+        allowed_types: 본문을 받을 Content-Type 목록 (None이면 모두 허용)
+        chunk_size: 본문을 읽는 조각 크기
+        """
+        self.namespace = namespace
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.allowed_types = allowed_types
+        self.chunk_size = chunk_size
+        self.lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self.conn = None
+        if use_validators:
+            validator_dir = os.path.dirname(validator_path)
+            if validator_dir and not os.path.exists(validator_dir):
+                os.makedirs(validator_dir, exist_ok=True)
+
+            self.conn = sqlite3.connect(validator_path, timeout=30, check_same_thread=False)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    namespace TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    elements TEXT NOT NULL,
+                    output_file TEXT,
+                    languages TEXT,
+                    url_index INTEGER,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, url)
+                )
+            """)
+            # url_index 열이 없던 이전 저장소에 열 추가 (기존 출력 파일은 URL 번호를 모르므로 재사용하지 않게 됨)
+            columns = [row[1] for row in self.conn.execute("PRAGMA table_info(pages)")]
+            if 'url_index' not in columns:
+                self.conn.execute("ALTER TABLE pages ADD COLUMN url_index INTEGER")
+            self.conn.commit()
+
+    def fetch(self, url, stream=False):
+        """조건부 GET 요청 (304이면 response.status_code == 304)
+
+        Content-Type과 Content-Length는 본문을 받기 전에 확인하고, 본문은 조각 단위로 읽으며 최대 크기를 넘으면 중단
+        stream이 True이면 성공 응답의 본문을 읽지 않고 반환하므로 iter_body로 조각을 받아 바로 파싱할 수 있음
+        """
+        response = self.session.get(url, headers=self.conditional_headers(url), timeout=self.timeout, stream=True)
+        try:
+            if response.ok and response.status_code != 304:
+                check_content_type(response.headers.get('Content-Type'), self.allowed_types)
+                check_body_size(int(response.headers.get('Content-Length') or 0), self.max_bytes)
+                if stream:
+                    return response
+
+            # 오류 응답과 304도 같은 제한으로 읽어 연결을 풀에 돌려줌
+            response._content = b''.join(self.iter_body(response))
+            return response
+        except Exception:
+            response.close()
+            raise
+
+    def iter_body(self, response, count=None):
+        """본문을 조각 단위로 읽음 (최대 크기를 넘으면 ResponseRejected, count가 있으면 조각마다 크기를 넘김)"""
+        received = 0
+        try:
+            for chunk in response.iter_content(self.chunk_size):
+                received += len(chunk)
+                check_body_size(received, self.max_bytes)
+                if count:
+                    count(len(chunk))
+                yield chunk
+        finally:
+            response.close()
+
+    def get_previous(self, url):
+        """이전 실행에서 저장한 검증값과 추출 결과 (없으면 None)"""
+        if self.conn is None:
+            return None
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified, elements, output_file, languages, url_index FROM pages "
+                "WHERE namespace = ? AND url = ?", (self.namespace, url)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        etag, last_modified, elements, output_file, languages, url_index = row
+        return {
+            'etag': etag,
+            'last_modified': last_modified,
+            'elements': [TextElement.from_dict(element) for element in json.loads(elements)],
+            'output_file': output_file,
+            'languages': json.loads(languages) if languages else None,
+            'url_index': url_index
+        }
+
+    def conditional_headers(self, url):
+        """이전 검증값으로 만든 조건부 요청 헤더"""
+        headers = {}
+        previous = self.get_previous(url)
+        if previous:
+            if previous['etag']:
+                headers['If-None-Match'] = previous['etag']
+            if previous['last_modified']:
+                headers['If-Modified-Since'] = previous['last_modified']
+        return headers
+
+    def remember(self, url, headers, elements):
+        """응답 헤더의 검증값과 추출 결과 저장 (검증값이 없는 응답은 저장하지 않음)"""
+        if self.conn is None:
+            return
+
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(namespace, url, etag, last_modified, elements, output_file, languages, url_index, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, NULL, NULL, NULL, ?)",
+                (self.namespace, url, etag, last_modified,
+                 json.dumps([element.to_dict() for element in elements], ensure_ascii=False), time.time())
+            )
+            self.conn.commit()
+
+    def remember_output(self, url, output_file, languages, url_index=None):
+        """추출 결과로 만든 출력 파일 기록 (다음 실행에서 304이면 재사용, url_index: 파일의 행에 기록한 URL 번호)"""
+        if self.conn is None:
+            return
+
+        with self.lock:
+            self.conn.execute(
+                "UPDATE pages SET output_file = ?, languages = ?, url_index = ? WHERE namespace = ? AND url = ?",
+                (os.path.abspath(output_file), json.dumps(list(languages)), url_index, self.namespace, url)
+            )
+            self.conn.commit()
+
+    def close(self):
+        """세션과 저장소 연결 종료"""
+        self.session.close()
+        if self.conn is not None:
+            with self.lock:
+                self.conn.close()
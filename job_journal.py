@@ -0,0 +1,165 @@
+"""
+배치 작업 기록 (중단 후 이어서 실행)
+출력 디렉토리의 SQLite 파일에 URL별 처리 상태와 번역이 끝난 요소를 작업이 끝나는 즉시 기록하여,
+중단되거나 비정상 종료된 배치 작업을 --resume으로 완료된 부분을 건너뛰고 이어서 실행
+"""
+
+import os
+import json
+import sqlite3
+import threading
+import time
+
+JOURNAL_FILENAME = '.batch_journal.db'
+
+# 완료로 간주하는 URL 상태
+DONE_STATUSES = ('success', 'not_modified')
+
+
+class JobJournal:
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+
+        journal_dir = os.path.dirname(db_path)
+        if journal_dir and not os.path.exists(journal_dir):
+            os.makedirs(journal_dir, exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS settings (
+                name TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS urls (
+                url_index INTEGER PRIMARY KEY,
+                url TEXT NOT NULL,
+                status TEXT NOT NULL,
+                output_file TEXT,
+                text_count INTEGER,
+                reused_count INTEGER,
+                translated_count INTEGER,
+                error TEXT,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS elements (
+                url TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                lang TEXT NOT NULL,
+                translated_text TEXT NOT NULL,
+                PRIMARY KEY (url, content_hash, lang)
+            );
+        """)
+        self.conn.commit()
+
+    def start(self, urls, settings, resume=False):
+        """작업 시작 (반환값: 이미 완료된 URL의 결과 목록)
+
+        resume이 True이고 저장된 작업 설정(언어, 출력 형식 등)이 같으면 완료된 URL은 그대로 두고,
+        그렇지 않으면 기록을 비우고 처음부터 시작
+        """
+        settings_json = json.dumps(settings, sort_keys=True, ensure_ascii=False)
+        now = time.time()
+
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM settings WHERE name = 'job'").fetchone()
+            if resume and row is not None and row[0] != settings_json:
+                print("⚠️ 이전 작업과 설정이 달라 처음부터 다시 시작합니다.")
+                resume = False
+
+            existing = {}
+            if resume:
+                for url_index, url, status, output_file in self.conn.execute(
+                        "SELECT url_index, url, status, output_file FROM urls"):
+                    existing[url_index] = (url, status, output_file)
+            else:
+                self.conn.execute("DELETE FROM urls")
+                self.conn.execute("DELETE FROM elements")
+
+            # 완료 기록이 없거나, URL이 바뀌었거나, 출력 파일이 사라진 항목은 대기 상태로
+            pending = []
+            for url_index, url in enumerate(urls, 1):
+                previous = existing.get(url_index)
+                if previous and previous[0] == url and previous[1] in DONE_STATUSES and previous[2] \
+                        and os.path.exists(previous[2]):
+                    continue
+                pending.append((url_index, url, now))
+
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO urls (url_index, url, status, updated_at) VALUES (?, ?, 'pending', ?)",
+                pending
+            )
+            self.conn.execute("DELETE FROM urls WHERE url_index > ?", (len(urls),))
+            self.conn.execute("INSERT OR REPLACE INTO settings (name, value) VALUES ('job', ?)", (settings_json,))
+            self.conn.commit()
+
+        return self.completed_results()
+
+    def completed_results(self):
+        """완료된 URL의 결과 목록 (URL 순서)"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT url, output_file, text_count, reused_count, translated_count, status, updated_at "
+                "FROM urls WHERE status IN (?, ?) ORDER BY url_index", DONE_STATUSES
+            ).fetchall()
+
+        return [{
+            'url': url,
+            'output_file': output_file,
+            'text_count': text_count,
+            'reused_count': reused_count,
+            'translated_count': translated_count,
+            'status': status,
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(updated_at))
+        } for url, output_file, text_count, reused_count, translated_count, status, updated_at in rows]
+
+    def pending_urls(self):
+        """처리할 (URL 번호, URL) 목록"""
+        with self.lock:
+            return self.conn.execute(
+                "SELECT url_index, url FROM urls WHERE status NOT IN (?, ?) ORDER BY url_index", DONE_STATUSES
+            ).fetchall()
+
+    def mark_done(self, url_index, result):
+        """URL 완료 기록 (중간 저장한 요소 번역은 더 필요 없으므로 삭제)"""
+        with self.lock:
+            self.conn.execute(
+                "UPDATE urls SET status = ?, output_file = ?, text_count = ?, reused_count = ?, "
+                "translated_count = ?, error = NULL, updated_at = ? WHERE url_index = ?",
+                (result['status'], os.path.abspath(result['output_file']), result['text_count'],
+                 result['reused_count'], result['translated_count'], time.time(), url_index)
+            )
+            self.conn.execute("DELETE FROM elements WHERE url = ?", (result['url'],))
+            self.conn.commit()
+
+    def mark_failed(self, url_index, error):
+        """URL 실패 기록 (이어서 실행하면 다시 처리)"""
+        with self.lock:
+            self.conn.execute(
+                "UPDATE urls SET status = 'failed', error = ?, updated_at = ? WHERE url_index = ?",
+                (str(error), time.time(), url_index)
+            )
+            self.conn.commit()
+
+    def record_elements(self, url, entries):
+        """번역이 끝난 요소 기록 (entries: (내용 해시, 언어 코드, 번역) 목록)"""
+        with self.lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO elements (url, content_hash, lang, translated_text) VALUES (?, ?, ?, ?)",
+                ((url, row_hash, lang, translated_text) for row_hash, lang, translated_text in entries)
+            )
+            self.conn.commit()
+
+    def lookup_elements(self, url):
+        """중단 전에 번역이 끝난 요소 ({(내용 해시, 언어 코드): 번역})"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT content_hash, lang, translated_text FROM elements WHERE url = ?", (url,)
+            ).fetchall()
+
+        return {(row_hash, lang): translated_text for row_hash, lang, translated_text in rows}
+
+    def close(self):
+        """연결 종료"""
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,239 @@
+"""
+출력 형식별 결과 파일 쓰기
+모든 형식이 같은 방식(write로 행을 하나씩 넘기고 save로 마무리)으로 동작하므로
+CLI, GUI, 배치 처리 모두 출력 형식과 관계없이 번역이 끝난 행을 바로 흘려 보낼 수 있음
+
+- xlsx: 스트리밍 엑셀 (excel_writer.StreamingExcelWriter)
+- jsonl: 한 줄에 레코드 하나인 JSON Lines
+- parquet / arrow: 열 단위 형식, 일정 행 수마다 레코드 배치로 기록 (선택 의존성: pip install pyarrow)
+
+열 단위 형식과 JSONL 레코드는 url, url_index, type, tag, text 열과 언어 코드별 번역 열로 구성
+"""
+
+import os
+import json
+from excel_writer import StreamingExcelWriter
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+RECORD_FIELDS = ['url', 'url_index', 'type', 'tag', 'text']
+# parquet/arrow 레코드 배치 크기 (이 행 수만큼만 메모리에 유지)
+DEFAULT_RECORD_BATCH_SIZE = 50000
+DEFAULT_OUTPUT_FORMAT = 'xlsx'
+# 번역 후 한 번에 내보내는 행 수 (번역 결과도 이 단위로만 메모리에 유지)
+DEFAULT_ROW_CHUNK_SIZE = 500
+
+
+class ExcelOutputWriter:
+    extension = '.xlsx'
+    records_url_index = False  # 행마다 url_index를 기록하는지 (출력 파일을 다른 URL 번호로 재사용할 수 있는지)
+
+    def __init__(self, file_path, languages, language_headers=None, include_url=False, url=None, url_index=None):
+        """
+        language_headers: 언어별 열 제목 목록 (없으면 언어 코드)
+        include_url: URL 열 포함 여부 (여러 URL을 합친 GUI 결과용)
+        """
+        headers = ["번호"]
+        if include_url:
+            headers.append("URL")
+        headers += ["유형", "태그", "원본 텍스트(한국어)"]
+        headers += list(language_headers or languages)
+
+        self.include_url = include_url
+        self.url = url
+        self.writer = StreamingExcelWriter(file_path, headers)
+
+    def write(self, element, translations):
+        """요소 하나와 언어 순서대로의 번역 목록 기록"""
+        row = [self.writer.row_count + 1]
+        if self.include_url:
+            row.append(element.url or self.url or '')
+        row += [element.type, element.tag, element.text]
+        row += translations
+        self.writer.write_row(row)
+
+    def save(self):
+        self.writer.save()
+
+    def close(self):
+        self.writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class _PartialFileWriter:
+    """임시 파일(.part)에 쓰고 save 시 최종 경로로 옮김 (실패한 출력은 남기지 않음)"""
+
+    extension = ''
+    records_url_index = True
+
+    def __init__(self, file_path, languages, language_headers=None, include_url=False, url=None, url_index=None):
+        self.file_path = file_path
+        self.partial_path = file_path + '.part'
+        self.languages = list(languages)
+        self.url = url
+        self.url_index = url_index
+        self.saved = False
+
+    def record_values(self, element):
+        """url, url_index, type, tag, text 값"""
+        return (
+            element.url if element.url is not None else self.url,
+            element.url_index if element.url_index is not None else self.url_index,
+            element.type,
+            element.tag,
+            element.text
+        )
+
+    def save(self):
+        self.finish()
+        os.replace(self.partial_path, self.file_path)
+        self.saved = True
+
+    def close(self):
+        if not self.saved:
+            self.finish()
+            if os.path.exists(self.partial_path):
+                os.remove(self.partial_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def finish(self):
+        raise NotImplementedError
+
+
+class JsonlOutputWriter(_PartialFileWriter):
+    extension = '.jsonl'
+
+    def __init__(self, file_path, languages, **options):
+        super().__init__(file_path, languages, **options)
+        self.file = open(self.partial_path, 'w', encoding='utf-8')
+        self.encoder = json.JSONEncoder(ensure_ascii=False)
+
+    def write(self, element, translations):
+        record = dict(zip(RECORD_FIELDS, self.record_values(element)))
+        record.update(zip(self.languages, translations))
+        self.file.write(self.encoder.encode(record))
+        self.file.write('\n')
+
+    def finish(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+class _ColumnarOutputWriter(_PartialFileWriter):
+    """열별 목록에 모았다가 batch_size 행마다 레코드 배치로 기록"""
+
+    def __init__(self, file_path, languages, batch_size=DEFAULT_RECORD_BATCH_SIZE, **options):
+        if pa is None:
+            raise ImportError("parquet/arrow 출력에는 pyarrow가 필요합니다: pip install pyarrow")
+
+        super().__init__(file_path, languages, **options)
+        self.batch_size = batch_size
+        self.schema = pa.schema(
+            [('url', pa.string()), ('url_index', pa.int64()), ('type', pa.string()), ('tag', pa.string()),
+             ('text', pa.string())] + [(lang, pa.string()) for lang in self.languages]
+        )
+        self.columns = [[] for _ in self.schema.names]
+        self.pending = 0
+        self.file_writer = self.open_writer()
+
+    def write(self, element, translations):
+        values = self.record_values(element)
+        for column, value in zip(self.columns, values):
+            column.append(value)
+        for column, value in zip(self.columns[len(RECORD_FIELDS):], translations):
+            column.append(value)
+
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(self.columns, self.schema)],
+            schema=self.schema
+        )
+        self.file_writer.write_batch(batch)
+        self.columns = [[] for _ in self.schema.names]
+        self.pending = 0
+
+    def finish(self):
+        if self.file_writer is not None:
+            self.flush()
+            self.file_writer.close()
+            self.file_writer = None
+
+    def open_writer(self):
+        raise NotImplementedError
+
+
+class ParquetOutputWriter(_ColumnarOutputWriter):
+    extension = '.parquet'
+
+    def open_writer(self):
+        return pq.ParquetWriter(self.partial_path, self.schema)
+
+
+class ArrowOutputWriter(_ColumnarOutputWriter):
+    extension = '.arrow'
+
+    def open_writer(self):
+        return pa.ipc.new_file(self.partial_path, self.schema)
+
+
+OUTPUT_FORMATS = {
+    'xlsx': ExcelOutputWriter,
+    'jsonl': JsonlOutputWriter,
+    'parquet': ParquetOutputWriter,
+    'arrow': ArrowOutputWriter,
+}
+
+
+def available_formats():
+    """현재 환경에서 사용 가능한 출력 형식 목록"""
+    return [name for name in OUTPUT_FORMATS if name not in ('parquet', 'arrow') or pa is not None]
+
+
+def format_extension(output_format):
+    return OUTPUT_FORMATS[output_format].extension
+
+
+def format_records_url_index(output_format):
+    """출력 형식이 행마다 url_index를 기록하는지 (그렇다면 URL 번호가 같을 때만 파일을 재사용할 수 있음)"""
+    return OUTPUT_FORMATS[output_format].records_url_index
+
+
+def format_from_path(file_path, default=DEFAULT_OUTPUT_FORMAT):
+    """파일 확장자로 출력 형식 판단 (알 수 없으면 default)"""
+    extension = os.path.splitext(file_path)[1].lower()
+    for name, writer_class in OUTPUT_FORMATS.items():
+        if writer_class.extension == extension:
+            return name
+    return default
+
+
+def create_output_writer(output_format, file_path, languages, **options):
+    """출력 형식에 맞는 쓰기 객체 생성
+
+    options: language_headers, include_url, url(요소에 url이 없을 때 사용), url_index
+    """
+    writer_class = OUTPUT_FORMATS.get(output_format)
+    if writer_class is None:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {output_format} (사용 가능: {', '.join(OUTPUT_FORMATS)})")
+    return writer_class(file_path, languages, **options)
@@ -0,0 +1,47 @@
+"""
+프로세스 풀 HTML 파싱
+BeautifulSoup 파싱과 요소 추출은 순수 파이썬 CPU 작업이라 스레드로는 코어 하나만 쓰게 되므로,
+HTML 바이트를 프로세스 풀로 보내고 (유형, 태그, 텍스트) 튜플 형태의 간단한 레코드로 돌려받음
+"""
+
+import os
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from html_extraction import extract_elements, DEFAULT_PARSER
+from text_element import TextElement
+
+
+def parse_to_records(content, parser=DEFAULT_PARSER):
+    """작업 프로세스에서 실행: HTML → (유형, 태그, 텍스트) 튜플 목록"""
+    return [element.to_record() for element in extract_elements(content, parser)]
+
+
+def records_to_elements(records):
+    """레코드 목록을 텍스트 요소 목록으로 변환"""
+    return [TextElement(element_type, tag, text) for element_type, tag, text in records]
+
+
+class ParsePool:
+    def __init__(self, workers=None, parser=DEFAULT_PARSER):
+        self.workers = workers or os.cpu_count() or 1
+        self.parser = parser
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+
+    def parse(self, content):
+        """HTML 파싱 (호출 스레드는 결과를 기다리기만 함)"""
+        return records_to_elements(self.executor.submit(parse_to_records, content, self.parser).result())
+
+    async def parse_async(self, content):
+        """이벤트 루프에서 사용하는 비동기 파싱"""
+        records = await asyncio.wrap_future(self.executor.submit(parse_to_records, content, self.parser))
+        return records_to_elements(records)
+
+    def close(self):
+        """작업 프로세스 종료"""
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
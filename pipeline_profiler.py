@@ -0,0 +1,187 @@
+"""
+파이프라인 단계별 시간 측정
+가져오기(fetch), 인코딩 판별(decode), 파싱(parse, 중복 제거 포함), 언어별 번역(translate:<언어>),
+결과 파일 쓰기(write) 단계의 실제 경과 시간과 호출 횟수, 가져온 바이트 수, 번역한 글자 수를
+전체와 URL별로 기록하고 요약 출력/JSON 저장
+cprofile을 켜면 각 단계가 실행되는 동안 스레드마다 cProfile을 돌려 함수별 시간을 합쳐 보여줌
+"""
+
+import io
+import os
+import json
+import time
+import pstats
+import cProfile
+import threading
+from contextlib import contextmanager, nullcontext
+
+# 요약에 보여줄 단계 순서 (번역 단계는 언어별로 뒤에 붙음)
+STAGE_ORDER = ['fetch', 'decode', 'parse', 'translate', 'write']
+DEFAULT_TOP_FUNCTIONS = 20
+PROFILE_FILENAME = 'profile.json'  # 배치 처리 시 출력 디렉토리에 저장하는 이름
+
+_DISABLED_STAGE = nullcontext()
+
+
+class PipelineProfiler:
+    def __init__(self, enabled=True, cprofile=False):
+        """
+        enabled: False이면 모든 기록을 건너뜀 (측정 비용 없음)
+        cprofile: 단계 실행 중 함수별 프로파일도 수집
+        """
+        self.enabled = enabled
+        self.cprofile = enabled and cprofile
+        self.started_at = time.perf_counter()
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+        self.stages = {}    # 단계 이름 -> [경과 시간, 호출 횟수]
+        self.counters = {}  # 카운터 이름 -> 값
+        self.urls = {}      # URL -> {'stages': {...}, 'counters': {...}}
+        self.profiles = []  # 스레드별 cProfile.Profile
+
+    def stage(self, name, url=None):
+        """with 블록의 경과 시간을 단계 시간으로 기록"""
+        if not self.enabled:
+            return _DISABLED_STAGE
+        return self._stage(name, url)
+
+    @contextmanager
+    def _stage(self, name, url):
+        if self.cprofile:
+            self._start_cprofile()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started, url)
+            if self.cprofile:
+                self._stop_cprofile()
+
+    def record(self, name, seconds, url=None, calls=1):
+        """이미 잰 경과 시간 기록 (이벤트 루프처럼 with 블록을 쓰기 어려운 곳에서 사용)"""
+        if not self.enabled:
+            return
+
+        with self.lock:
+            targets = [self.stages]
+            if url is not None:
+                targets.append(self._url_entry(url)['stages'])
+            for stages in targets:
+                entry = stages.setdefault(name, [0.0, 0])
+                entry[0] += seconds
+                entry[1] += calls
+
+    def count(self, name, value, url=None):
+        """카운터에 값 더하기 (가져온 바이트 수, 번역한 글자 수 등)"""
+        if not self.enabled:
+            return
+
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+            if url is not None:
+                counters = self._url_entry(url)['counters']
+                counters[name] = counters.get(name, 0) + value
+
+    def _url_entry(self, url):
+        entry = self.urls.get(url)
+        if entry is None:
+            entry = self.urls[url] = {'stages': {}, 'counters': {}}
+        return entry
+
+    def _start_cprofile(self):
+        # 단계가 중첩되면 가장 바깥 단계에서만 켜고 끔
+        depth = getattr(self.local, 'depth', 0)
+        if depth == 0:
+            profile = getattr(self.local, 'profile', None)
+            if profile is None:
+                profile = self.local.profile = cProfile.Profile()
+                with self.lock:
+                    self.profiles.append(profile)
+            profile.enable()
+        self.local.depth = depth + 1
+
+    def _stop_cprofile(self):
+        self.local.depth -= 1
+        if self.local.depth == 0:
+            self.local.profile.disable()
+
+    def report(self):
+        """측정 결과 (JSON으로 저장할 수 있는 dict)"""
+        def stage_dict(stages):
+            return {name: {'seconds': round(seconds, 6), 'calls': calls}
+                    for name, (seconds, calls) in sorted(stages.items(), key=lambda item: _stage_key(item[0]))}
+
+        with self.lock:
+            return {
+                'total_seconds': round(time.perf_counter() - self.started_at, 6),
+                'stages': stage_dict(self.stages),
+                'counters': dict(self.counters),
+                'urls': {url: {'stages': stage_dict(entry['stages']), 'counters': dict(entry['counters'])}
+                         for url, entry in self.urls.items()}
+            }
+
+    def summary(self):
+        """단계별 시간 요약 문자열"""
+        report = self.report()
+        total = report['total_seconds']
+
+        lines = [f"단계별 시간 (전체 {total:.2f}초, 병렬 단계는 작업자 시간의 합):"]
+        for name, stage in report['stages'].items():
+            average = stage['seconds'] / stage['calls'] * 1000 if stage['calls'] else 0.0
+            lines.append(f"  {name:<16} {stage['seconds']:9.3f}초  {stage['calls']:7d}회  평균 {average:8.2f}ms")
+
+        counters = report['counters']
+        if counters:
+            lines.append(f"  가져온 바이트: {counters.get('bytes_fetched', 0):,}, "
+                         f"번역한 글자: {counters.get('chars_translated', 0):,} "
+                         f"(번역기로 보낸 글자: {counters.get('chars_sent', 0):,})")
+        return '\n'.join(lines)
+
+    def write_json(self, path):
+        """측정 결과를 JSON 파일로 저장"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+
+    def cprofile_stats(self, top=DEFAULT_TOP_FUNCTIONS, path=None):
+        """수집한 함수별 프로파일을 합쳐 누적 시간 상위 함수 목록 반환 (path가 있으면 pstats 파일로 저장)"""
+        with self.lock:
+            profiles = list(self.profiles)
+        if not profiles:
+            return ""
+
+        stream = io.StringIO()
+        stats = pstats.Stats(profiles[0], stream=stream)
+        for profile in profiles[1:]:
+            stats.add(profile)
+
+        if path:
+            stats.dump_stats(path)
+        stats.sort_stats('cumulative').print_stats(top)
+        return stream.getvalue()
+
+
+def _stage_key(name):
+    base = name.split(':', 1)[0]
+    order = STAGE_ORDER.index(base) if base in STAGE_ORDER else len(STAGE_ORDER)
+    return order, name
+
+
+def default_profile_path(output_file):
+    """출력 파일 옆에 저장할 측정 결과 JSON 경로"""
+    return f"{os.path.splitext(output_file)[0]}_profile.json"
+
+
+def save_report(profiler, json_path, log=print, top=DEFAULT_TOP_FUNCTIONS):
+    """요약을 출력하고 측정 결과를 JSON으로 저장 (cProfile을 켰으면 같은 이름의 .prof 파일과 상위 함수도 출력)"""
+    if not profiler.enabled:
+        return
+
+    log(profiler.summary())
+    profiler.write_json(json_path)
+    log(f"프로파일 결과 저장: {json_path}")
+
+    if profiler.cprofile:
+        stats_path = f"{os.path.splitext(json_path)[0]}.prof"
+        log(f"함수별 프로파일 (누적 시간 상위 {top}개, 전체: {stats_path}):")
+        log(profiler.cprofile_stats(top, stats_path))
@@ -0,0 +1,202 @@
+"""
+번역 요청 속도 제한 및 재시도
+모든 작업 스레드가 하나의 토큰 버킷을 공유하여 번역기 호출 속도를 제한하고,
+관찰된 오류/지연에 따라 속도를 조절 (성공하면 조금씩 올리고, 429(요청 과다)면 30% 줄임)
+일시적인 오류는 지수 백오프와 지터를 두고 재시도하여 번역이 조용히 누락되지 않도록 함
+"""
+
+import time
+import random
+import threading
+
+DEFAULT_TRANSLATION_RATE = 5.0    # 초당 요청 수 (시작값)
+DEFAULT_MAX_TRANSLATION_RATE = 50.0
+DEFAULT_MAX_RETRIES = 8
+
+# 재시도할 예외를 내는 HTTP 클라이언트 라이브러리 (연결 끊김, 시간 초과 등)
+TRANSIENT_ERROR_MODULES = ('httpx', 'httpcore', 'requests', 'urllib3', 'aiohttp')
+
+
+class ThrottledError(Exception):
+    """번역기가 요청 과다(429)로 거절함 (상태 코드가 없는 예외를 내는 백엔드가 변환하여 발생)"""
+
+    status_code = 429
+
+
+def error_status(error):
+    """예외에 담긴 HTTP 상태 코드 (없으면 None)"""
+    for source in (error, getattr(error, 'response', None)):
+        if source is None:
+            continue
+        for name in ('status_code', 'status'):
+            status = getattr(source, name, None)
+            if isinstance(status, int):
+                return status
+    return None
+
+
+def is_throttling_error(error):
+    """요청 과다(429)로 거절된 경우인지
+
+    응답 상태 코드(requests/httpx/aiohttp 예외의 status_code/status, ThrottledError)로 판단하고,
+    상태 코드를 알 수 없는 예외만 정확한 문구로 확인 (메시지에 든 URL/숫자의 '429'는 무시)
+    """
+    status = error_status(error)
+    if status is not None:
+        return status == 429
+    return 'Too Many Requests' in str(error)
+
+
+def is_retryable_error(error):
+    """다시 시도하면 성공할 수 있는 오류인지 (요청 과다, 서버 오류, 네트워크 오류)"""
+    if is_throttling_error(error):
+        return True
+
+    status = error_status(error)
+    if status is not None:
+        return status >= 500
+
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    return type(error).__module__.split('.')[0] in TRANSIENT_ERROR_MODULES
+
+
+def retry_after_seconds(error):
+    """응답의 Retry-After 헤더 값 (초, 없으면 None)"""
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or getattr(error, 'headers', None)
+    if not headers:
+        return None
+    try:
+        return max(0.0, float(headers.get('Retry-After')))
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveRateLimiter:
+    def __init__(self, rate=DEFAULT_TRANSLATION_RATE, min_rate=0.2, max_rate=DEFAULT_MAX_TRANSLATION_RATE,
+                 max_retries=DEFAULT_MAX_RETRIES, base_delay=0.5, max_delay=30.0, latency_target=10.0):
+        """
+        rate: 시작 속도 (초당 요청 수), min_rate/max_rate: 조절 범위
+        max_retries: 요청 하나당 최대 재시도 횟수 (넘으면 마지막 예외 발생)
+        base_delay/max_delay: 백오프 대기 시간의 시작값/상한 (초)
+        latency_target: 평균 응답 시간이 이보다 길면 속도를 낮춤 (초)
+        """
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.latency_target = latency_target
+        self.lock = threading.Lock()
+
+        self.tokens = 1.0
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0        # 429 이후 모든 작업자가 함께 쉬는 시각
+        self.consecutive_throttles = 0
+        self.slow_start = True          # 첫 429 전까지는 빠르게 (성공마다 1씩) 올림
+        self.latency = None             # 응답 시간 이동 평균
+
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.failures = 0
+
+    def call(self, func, *args, **kwargs):
+        """속도 제한을 지키며 func 호출 (일시적인 오류는 백오프 후 재시도)"""
+        attempt = 0
+        while True:
+            self.acquire()
+            started = time.monotonic()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if not is_retryable_error(e) or attempt >= self.max_retries:
+                    with self.lock:
+                        self.failures += 1
+                    raise
+
+                attempt += 1
+                if is_throttling_error(e):
+                    self.on_throttled(retry_after_seconds(e))
+                else:
+                    # 네트워크/서버 오류는 이 요청만 지수 백오프 (Full Jitter)
+                    with self.lock:
+                        self.retries += 1
+                    time.sleep(random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt)))
+                continue
+
+            self.on_success(time.monotonic() - started)
+            return result
+
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                wait = self.blocked_until - now
+                if wait <= 0:
+                    # 한꺼번에 몰려 서버 한도를 넘지 않도록 버킷은 0.25초 분량으로 작게 유지
+                    capacity = max(1.0, self.rate * 0.25)
+                    self.tokens = min(capacity, self.tokens + (now - self.updated_at) * self.rate)
+                    self.updated_at = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        self.requests += 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def on_success(self, latency):
+        """성공: 응답이 빠르면 속도를 조금씩 올리고 느려지면 낮춤"""
+        with self.lock:
+            self.consecutive_throttles = 0
+            self.latency = latency if self.latency is None else self.latency * 0.8 + latency * 0.2
+
+            if self.latency > self.latency_target:
+                self.slow_start = False
+                self.rate = max(self.min_rate, self.rate * 0.9)
+            elif self.slow_start:
+                # 한도를 찾을 때까지 초당 약 2배씩 증가
+                self.rate = min(self.max_rate, self.rate + 1.0)
+            else:
+                # 한도 근처에서는 초당 약 1씩 증가 (성공 하나마다 1/rate)
+                self.rate = min(self.max_rate, self.rate + 1.0 / self.rate)
+
+    def on_throttled(self, retry_after=None):
+        """429: 속도를 30% 줄이고 모든 작업자가 함께 잠시 대기"""
+        with self.lock:
+            self.throttled += 1
+            self.retries += 1
+            now = time.monotonic()
+
+            # 동시에 보낸 요청들이 함께 429를 받아도 한 번만 줄임
+            if now < self.blocked_until:
+                return
+
+            self.rate = max(self.min_rate, self.rate * 0.7)
+            self.slow_start = False
+            self.consecutive_throttles += 1
+
+            if retry_after is None:
+                delay = min(self.max_delay, self.base_delay * 2 ** (self.consecutive_throttles - 1))
+                retry_after = delay * random.uniform(0.5, 1.0)
+            self.blocked_until = now + retry_after
+            self.tokens = 0.0
+
+    def stats(self):
+        """요청/재시도 통계"""
+        with self.lock:
+            return {
+                'requests': self.requests,
+                'retries': self.retries,
+                'throttled': self.throttled,
+                'failures': self.failures,
+                'rate': self.rate
+            }
+
+    def summary(self):
+        """통계 요약 문자열"""
+        stats = self.stats()
+        return (f"번역 요청 - 요청: {stats['requests']}회, 재시도: {stats['retries']}회 (429: {stats['throttled']}회), "
+                f"실패: {stats['failures']}회, 현재 속도: 초당 {stats['rate']:.1f}회")
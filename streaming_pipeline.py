@@ -0,0 +1,114 @@
+"""
+스트리밍 파이프라인 도구
+가져오기/파싱 → 번역 → 쓰기 단계를 크기가 정해진 생성기/큐로 연결하여
+- 앞 단계가 끝나기를 기다리지 않고 결과가 나오는 대로 다음 단계로 넘기고 (첫 행이 빨리 저장됨)
+- 뒤 단계가 느리면 앞 단계가 기다리므로 (배압) URL이 아무리 많아도 메모리에는 정해진 개수만 남음
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+DEFAULT_WINDOW_FACTOR = 2    # 작업자 수 대비 동시에 제출해 두는 작업 수
+DEFAULT_PREFETCH_DEPTH = 2   # 미리 만들어 두는 묶음 수
+
+_ITEM = 'item'
+_END = 'end'
+_ERROR = 'error'
+
+
+def bounded_map(func, items, max_workers, window=None, ordered=True, should_stop=None):
+    """items의 각 항목에 func를 스레드 풀에서 실행하고 (항목, 완료된 Future)를 하나씩 내보내는 생성기
+
+    window: 동시에 제출해 두는 최대 작업 수 (기본값: 작업자 수 x DEFAULT_WINDOW_FACTOR)
+            소비자가 결과를 가져가야 다음 항목을 제출하므로 items는 필요한 만큼만 꺼냄
+    ordered: True면 입력 순서대로, False면 끝난 순서대로 내보냄
+    should_stop: 설정되면 호출하여 참일 때 새 항목을 제출하지 않고 이미 제출한 작업의 결과만 내보냄
+    작업의 예외는 Future.result()를 호출할 때 발생하고, 소비자가 중간에 멈추면 시작하지 않은 작업은 취소
+    """
+    window = max(1, window or max_workers * DEFAULT_WINDOW_FACTOR)
+    items = iter(items)
+    pending = {}  # Future → 항목 (제출 순서 유지)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def fill():
+        while len(pending) < window and not (should_stop and should_stop()):
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            pending[executor.submit(func, item)] = item
+
+    try:
+        fill()
+        while pending:
+            if ordered:
+                future = next(iter(pending))
+                wait([future])
+            else:
+                future = next(iter(wait(pending, return_when=FIRST_COMPLETED).done))
+            item = pending.pop(future)
+            # 소비자가 결과를 처리하는 동안에도 다음 작업이 진행되도록 먼저 채워 둠
+            fill()
+            yield item, future
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def chunked(iterable, size):
+    """iterable을 size개씩 묶은 목록을 하나씩 내보내는 생성기 (마지막 묶음은 더 작을 수 있음)"""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def prefetch(iterable, depth=DEFAULT_PREFETCH_DEPTH):
+    """iterable을 별도 스레드에서 최대 depth개 앞서 꺼내 두는 생성기
+
+    앞 단계(예: 번역)와 뒤 단계(예: 파일 쓰기)가 겹쳐 실행되고, 큐가 차면 앞 단계가 기다림
+    앞 단계의 예외는 소비자 쪽에서 다시 발생하고, 소비자가 중간에 멈추면 앞 단계도 멈춘 뒤 반환
+    """
+    buffer = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+
+    def put(entry):
+        # 소비자가 멈췄으면 큐가 비워지지 않으므로 기다리지 않고 포기
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((_ITEM, item)):
+                    return
+            put((_END, None))
+        except BaseException as e:
+            put((_ERROR, e))
+        finally:
+            close = getattr(iterable, 'close', None)
+            if close:
+                close()
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            kind, value = buffer.get()
+            if kind == _END:
+                return
+            if kind == _ERROR:
+                raise value
+            yield value
+    finally:
+        stop.set()
+        producer.join()
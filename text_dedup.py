@@ -0,0 +1,322 @@
+"""
+추출 텍스트 중복 제거 엔진
+기존의 포함 관계/90% 겹침 규칙을 그대로 유지하면서, 이전 요소 전체와 비교하는 대신
+고정 길이 앵커(k-gram) 색인으로 후보만 찾아 확인하므로 요소 수에 대해 거의 선형으로 동작
+"""
+
+import math
+from collections import defaultdict
+
+# 긴 텍스트 색인용 앵커 길이와 샘플링 간격
+ANCHOR_LENGTH = 8
+ANCHOR_STEP = 4
+# 이 길이 이상이면 앵커 색인, 미만이면 모든 부분 문자열을 색인
+LONG_TEXT_LENGTH = ANCHOR_LENGTH + ANCHOR_STEP - 1
+# 등록 텍스트 전체 또는 (비율 조건이 있는 조회에서) 길이 범위 안의 후보가 이 수 이하면 색인 없이 직접 확인
+WINDOW_SCAN_LIMIT = 64
+
+
+class TextIndex:
+    """포함 관계 조회를 위한 텍스트 색인
+
+    - 긴 텍스트: ANCHOR_STEP 간격 위치의 앵커와 접두 앵커를 색인
+    - 짧은 텍스트: 모든 부분 문자열을 색인 (길이가 짧아 항목 수가 제한됨)
+    - 앵커/부분 문자열 색인은 직접 확인으로 끝나지 않는 조회가 처음 필요할 때 만듦
+      (요소가 적은 페이지나 GUI 규칙처럼 90% 겹침만 보는 경우 후보 몇 개만 확인하면 되므로)
+    """
+
+    def __init__(self):
+        self._texts = {}       # id -> 텍스트 (삭제되지 않은 것만)
+        self._ids = {}         # 텍스트 -> id
+        self._next_id = 0
+
+        self._anchors = defaultdict(list)           # 앵커 -> [(id, 위치)]
+        self._prefixes = defaultdict(list)          # 접두어 (LONG_TEXT_LENGTH 글자) -> [id]
+        self._long_by_length = defaultdict(set)     # 길이 -> {id}
+        self._short_substrings = defaultdict(set)   # 부분 문자열 -> {id}
+        self._short_by_length = defaultdict(dict)   # 길이 -> {텍스트: id}
+        self._by_length = defaultdict(dict)         # 길이 -> {id: 텍스트} (짧은/긴 텍스트 모두)
+        self._pending = []                          # 아직 앵커/부분 문자열 색인에 넣지 않은 id
+
+    def __contains__(self, text):
+        return text in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def add(self, text):
+        """텍스트 등록 (이미 있으면 무시)"""
+        if text in self._ids:
+            return
+
+        text_id = self._next_id
+        self._next_id += 1
+        self._texts[text_id] = text
+        self._ids[text] = text_id
+
+        length = len(text)
+        self._by_length[length][text_id] = text
+        if length >= LONG_TEXT_LENGTH:
+            self._long_by_length[length].add(text_id)
+        else:
+            self._short_by_length[length][text] = text_id
+        self._pending.append(text_id)
+
+    def _index_pending(self):
+        """미뤄 둔 텍스트를 앵커/부분 문자열 색인에 넣음"""
+        for text_id in self._pending:
+            text = self._texts.get(text_id)
+            if text is None:
+                continue
+
+            length = len(text)
+            if length >= LONG_TEXT_LENGTH:
+                for pos in range(0, length - ANCHOR_LENGTH + 1, ANCHOR_STEP):
+                    self._anchors[text[pos:pos + ANCHOR_LENGTH]].append((text_id, pos))
+                self._prefixes[text[:LONG_TEXT_LENGTH]].append(text_id)
+            else:
+                for start in range(length):
+                    for end in range(start + 1, length + 1):
+                        self._short_substrings[text[start:end]].add(text_id)
+        self._pending = []
+
+    def _window(self, lengths=None):
+        """직접 확인할 후보 [(id, 텍스트)] 반환 (WINDOW_SCAN_LIMIT개를 넘으면 None)
+
+        등록 텍스트가 적으면 전체, 아니면 lengths 길이의 등록 텍스트 (lengths가 없으면 None)
+        """
+        if len(self._texts) <= WINDOW_SCAN_LIMIT:
+            return list(self._texts.items())
+        if lengths is None:
+            return None
+
+        candidates = []
+        for length in lengths:
+            texts = self._by_length.get(length)
+            if texts:
+                candidates.extend(texts.items())
+                if len(candidates) > WINDOW_SCAN_LIMIT:
+                    return None
+        return candidates
+
+    def remove(self, text):
+        """텍스트 삭제 (앵커 목록의 오래된 항목은 조회 시 건너뜀)"""
+        text_id = self._ids.pop(text, None)
+        if text_id is None:
+            return
+
+        del self._texts[text_id]
+
+        length = len(text)
+        del self._by_length[length][text_id]
+        if length >= LONG_TEXT_LENGTH:
+            self._long_by_length[length].discard(text_id)
+        elif not (self._pending and text_id >= self._pending[0]):
+            for start in range(length):
+                for end in range(start + 1, length + 1):
+                    self._short_substrings[text[start:end]].discard(text_id)
+            del self._short_by_length[length][text]
+        else:
+            del self._short_by_length[length][text]
+
+    def find_container(self, text, min_ratio=0.0):
+        """text를 포함하는 등록 텍스트 중 하나 반환 (없으면 None)
+
+        min_ratio가 주어지면 len(text) > len(등록 텍스트) * min_ratio 인 것만 대상
+        """
+        if text in self._ids:
+            return text
+
+        length = len(text)
+
+        # 포함하는 텍스트는 length 이상 (min_ratio가 있으면 length / min_ratio 미만) 길이에만 있음
+        if min_ratio > 0:
+            lengths = range(length, math.ceil(length / min_ratio) + 1)
+        elif len(self._by_length) <= length:
+            # 긴 text는 앵커를 길이만큼 찾아보므로 등록된 길이 종류가 그보다 적으면 길이로 먼저 거름
+            lengths = [candidate_length for candidate_length in self._by_length if candidate_length >= length]
+        else:
+            lengths = None
+        candidates = self._window(lengths)
+        if candidates is not None:
+            # 색인 조회와 같은 순서: 짧은 등록 텍스트 먼저, 같은 종류 안에서는 먼저 등록된 것
+            matches = [
+                (len(candidate) >= LONG_TEXT_LENGTH, text_id, candidate)
+                for text_id, candidate in candidates
+                if text in candidate and length > len(candidate) * min_ratio
+            ]
+            return min(matches)[2] if matches else None
+
+        self._index_pending()
+
+        def accept(candidate):
+            return length > len(candidate) * min_ratio
+
+        found = None
+
+        # 짧은 등록 텍스트 안에 포함된 경우
+        for text_id in self._short_substrings.get(text, ()):
+            candidate = self._texts[text_id]
+            if accept(candidate) and (found is None or self._ids[found] > text_id):
+                found = candidate
+        if found is not None:
+            return found
+
+        if length >= LONG_TEXT_LENGTH:
+            # text가 들어있는 위치에는 샘플링된 앵커가 text 내부에 ANCHOR_STEP 간격으로 걸림
+            # 시작 오프셋별로 가장 드문 앵커 하나만 골라 후보를 확인
+            for offset in range(ANCHOR_STEP):
+                postings = None
+                anchor_offset = offset
+                for pos in range(offset, length - ANCHOR_LENGTH + 1, ANCHOR_STEP):
+                    current = self._anchors.get(text[pos:pos + ANCHOR_LENGTH])
+                    if not current:
+                        postings = None
+                        break
+                    if postings is None or len(current) < len(postings):
+                        postings = current
+                        anchor_offset = pos
+
+                for text_id, pos in postings or ():
+                    candidate = self._texts.get(text_id)
+                    start = pos - anchor_offset
+                    if candidate is None or start < 0:
+                        continue
+                    if accept(candidate) and candidate.startswith(text, start):
+                        if found is None or self._ids[found] > text_id:
+                            found = candidate
+            return found
+
+        # 앵커보다 짧은 텍스트가 긴 등록 텍스트에 포함된 경우 (길이 범위 안에서만 확인)
+        max_length = length / min_ratio if min_ratio > 0 else None
+        for candidate_length, text_ids in self._long_by_length.items():
+            if max_length is not None and candidate_length >= max_length:
+                continue
+            for text_id in text_ids:
+                candidate = self._texts[text_id]
+                if text in candidate and (found is None or self._ids[found] > text_id):
+                    found = candidate
+        return found
+
+    def find_contained(self, text, min_ratio=0.0):
+        """text 안에 포함된 등록 텍스트 중 하나 반환 (없으면 None)
+
+        min_ratio가 주어지면 len(등록 텍스트) > len(text) * min_ratio 인 것만 대상
+        """
+        if text in self._ids:
+            return text
+
+        length = len(text)
+        min_length = int(length * min_ratio) + 1 if min_ratio > 0 else 1
+        # 충분히 긴 후보는 앞쪽 일부 위치에서만 시작할 수 있음
+        last_start = length - min_length
+
+        candidates = self._window(range(min_length, length + 1) if min_ratio > 0 else None)
+        if candidates is not None:
+            # 색인 조회와 같은 순서: text 안의 앞쪽 위치, 같은 위치면 긴 등록 텍스트, 먼저 등록된 것
+            matches = []
+            for text_id, candidate in candidates:
+                pos = text.find(candidate) if len(candidate) >= min_length else -1
+                if pos >= 0:
+                    matches.append((pos, len(candidate) < LONG_TEXT_LENGTH, text_id, candidate))
+            return min(matches)[3] if matches else None
+
+        self._index_pending()
+
+        short_lengths = [
+            (short_length, short_texts)
+            for short_length, short_texts in self._short_by_length.items()
+            if short_texts and short_length >= min_length
+        ]
+
+        for pos in range(last_start + 1):
+            for text_id in self._prefixes.get(text[pos:pos + LONG_TEXT_LENGTH], ()):
+                candidate = self._texts.get(text_id)
+                if candidate is not None and len(candidate) >= min_length and text.startswith(candidate, pos):
+                    return candidate
+
+            for short_length, short_texts in short_lengths:
+                candidate = text[pos:pos + short_length]
+                if len(candidate) == short_length and candidate in short_texts:
+                    return candidate
+
+        return None
+
+
+class ElementDeduplicator:
+    """추출 요소 목록과 중복 제거 규칙
+
+    교체로 삭제된 요소는 자리만 비워 두었다가 elements() 호출 시 한 번에 정리
+    """
+
+    def __init__(self, overlap_ratio=0.9):
+        self.overlap_ratio = overlap_ratio
+        self.index = TextIndex()
+        self._elements = []
+        self._positions = defaultdict(list)  # 텍스트 -> 요소 위치 목록
+        self._removed = 0
+
+    def __contains__(self, text):
+        return text in self.index
+
+    def __len__(self):
+        return len(self._elements) - self._removed
+
+    def add(self, element):
+        """중복 확인 없이 추가"""
+        text = element.text
+        self._positions[text].append(len(self._elements))
+        self._elements.append(element)
+        self.index.add(text)
+
+    def add_if_new(self, element):
+        """같은 텍스트가 없을 때만 추가"""
+        if element.text in self.index:
+            return False
+
+        self.add(element)
+        return True
+
+    def add_if_not_overlapping(self, element):
+        """기존 텍스트와 어느 쪽으로든 포함 관계가 없을 때만 추가 (CLI 규칙)"""
+        text = element.text
+        if self.index.find_container(text) is not None or self.index.find_contained(text) is not None:
+            return False
+
+        self.add(element)
+        return True
+
+    def add_or_replace(self, element):
+        """90% 이상 겹치는 기존 텍스트 처리 후 추가 (GUI 규칙)
+
+        - 같거나 더 긴 기존 텍스트에 90% 이상 포함되면 중복으로 간주
+        - 더 짧은 기존 텍스트가 90% 이상 포함되면 기존 요소를 삭제하고 더 긴 텍스트로 교체
+        """
+        text = element.text
+        if self.index.find_container(text, self.overlap_ratio) is not None:
+            return False
+
+        shorter = self.index.find_contained(text, self.overlap_ratio)
+        if shorter is not None:
+            self.remove_text(shorter)
+
+        self.add(element)
+        return True
+
+    def remove_text(self, text):
+        """해당 텍스트를 가진 요소 모두 삭제"""
+        for position in self._positions.pop(text, ()):
+            self._elements[position] = None
+            self._removed += 1
+        self.index.remove(text)
+
+    def elements(self):
+        """현재 요소 목록 (추가 순서 유지)"""
+        if self._removed:
+            self._elements = [element for element in self._elements if element is not None]
+            self._positions = defaultdict(list)
+            for position, element in enumerate(self._elements):
+                self._positions[element.text].append(position)
+            self._removed = 0
+
+        return list(self._elements)
@@ -0,0 +1,51 @@
+"""
+추출한 텍스트 요소 레코드
+요소마다 dict를 만들면 키 해시 테이블 때문에 요소 하나에 200바이트 가까이 들어가므로
+__slots__ 클래스로 필드만 저장하고, 종류가 몇 개 안 되는 유형/태그 문자열은 intern하여 모든 요소가 같은 객체를 공유
+URL은 여러 URL을 합친 결과(GUI)에서만 설정하며 같은 URL 문자열 객체를 참조만 함
+저장(JSON)할 때는 기존과 같은 {'type', 'tag', 'text'} dict 형태로 변환
+"""
+
+import sys
+
+ELEMENT_FIELDS = ('type', 'tag', 'text')
+
+
+class TextElement:
+    __slots__ = ('type', 'tag', 'text', 'url', 'url_index')
+
+    def __init__(self, type, tag, text, url=None, url_index=None):
+        """
+        type: 'heading' 또는 'content'
+        tag: HTML 태그 이름 (DOM 순서 추출의 텍스트 노드는 'text')
+        url, url_index: 여러 URL을 합친 결과에서 요소가 나온 URL과 그 순번 (1부터)
+        """
+        self.type = sys.intern(type)
+        self.tag = sys.intern(tag)
+        self.text = text
+        self.url = url
+        self.url_index = url_index
+
+    def __eq__(self, other):
+        if not isinstance(other, TextElement):
+            return NotImplemented
+        return (self.type == other.type and self.tag == other.tag and self.text == other.text
+                and self.url == other.url and self.url_index == other.url_index)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"TextElement({self.type!r}, {self.tag!r}, {self.text[:30]!r})"
+
+    def to_dict(self):
+        """JSON으로 저장할 dict (URL 정보는 저장하지 않음)"""
+        return {'type': self.type, 'tag': self.tag, 'text': self.text}
+
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict로 저장한 dict에서 복원"""
+        return cls(data['type'], data['tag'], data['text'])
+
+    def to_record(self):
+        """프로세스 간 전달용 튜플 (type, tag, text)"""
+        return self.type, self.tag, self.text
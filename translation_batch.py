@@ -0,0 +1,227 @@
+"""
+다중 텍스트 일괄 번역
+짧은 텍스트 여러 개를 줄마다 번호 표시([1], [2], ...)를 붙여 한 번의 요청으로 번역하고
+결과를 번호 표시로 다시 요소별로 분리 (번호가 하나라도 어긋나면 묶음 결과를 버리고 개별 번역으로 대체)
+번역기가 목록 번역을 지원하면 구분자 없이 목록을 그대로 넘김
+요청 과다(429)로 실패한 묶음은 개별 번역으로 나누지 않고 묶음의 모든 텍스트를 번역 실패로 표시
+(실패 표시는 캐시/요소 상태에 저장되지 않으므로 다시 실행하면 다시 번역하고, 페이지의 나머지 결과는 그대로 저장됨)
+"""
+
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from rate_limiter import is_throttling_error
+
+BATCH_DELIMITER = '\n'
+# 번역 결과 줄의 번호 표시 (번역기가 전각 괄호로 바꿔도 인식)
+BATCH_MARKER_PATTERN = re.compile(r'^[\[［【]\s*(\d+)\s*[\]］】]\s*(.*)$')
+DEFAULT_MAX_BATCH_CHARS = 4000
+DEFAULT_MAX_BATCH_ITEMS = 50
+DEFAULT_WORKERS_PER_LANGUAGE = 4
+
+
+def pack_batches(texts, max_chars=DEFAULT_MAX_BATCH_CHARS, max_items=DEFAULT_MAX_BATCH_ITEMS):
+    """텍스트 목록을 크기 제한에 맞는 묶음으로 분할
+
+    구분자를 포함하거나 혼자서도 제한을 넘는 텍스트는 묶지 않고 별도로 반환
+    반환값: (묶음 목록, 개별 처리할 텍스트 목록)
+    """
+    batches = []
+    singles = []
+
+    current = []
+    current_chars = 0
+
+    for text in texts:
+        if BATCH_DELIMITER in text or len(text) >= max_chars:
+            singles.append(text)
+            continue
+
+        added_chars = len(text) + (len(BATCH_DELIMITER) if current else 0)
+        if current and (current_chars + added_chars > max_chars or len(current) >= max_items):
+            batches.append(current)
+            current = []
+            current_chars = 0
+            added_chars = len(text)
+
+        current.append(text)
+        current_chars += added_chars
+
+    if current:
+        batches.append(current)
+
+    return batches, singles
+
+
+def join_batch(batch):
+    """묶음의 텍스트마다 번호 표시를 붙여 한 줄씩 연결"""
+    return BATCH_DELIMITER.join(f"[{number}] {text}" for number, text in enumerate(batch, 1))
+
+
+def split_batch_result(translated, expected_count):
+    """묶음 번역 결과를 번호 표시로 요소별로 분리
+
+    모든 줄이 번호 표시로 시작하고 번호가 1부터 빠짐없이 순서대로이며 내용이 비어 있지 않을 때만 인정
+    (번역기가 줄을 합치거나 나누면 줄 수가 맞아도 번호가 어긋나므로 None)
+    """
+    parts = []
+    for line in translated.strip().split(BATCH_DELIMITER):
+        line = line.strip()
+        if not line:
+            continue
+        match = BATCH_MARKER_PATTERN.match(line)
+        if match is None or int(match.group(1)) != len(parts) + 1:
+            return None
+        text = match.group(2).strip()
+        if not text:
+            return None
+        parts.append(text)
+
+    if len(parts) != expected_count:
+        return None
+
+    return parts
+
+
+class LanguageExecutors:
+    """언어별 번역 작업 풀
+
+    추출기(또는 작업) 하나가 만들어 두고 모든 묶음의 번역에 재사용하여 묶음마다 스레드 풀을 만들고 닫지 않음
+    (언어마다 별도의 풀이므로 느린 언어가 다른 언어를 막지 않음)
+    """
+
+    def __init__(self, workers_per_language=DEFAULT_WORKERS_PER_LANGUAGE):
+        self.workers_per_language = workers_per_language
+        self.executors = {}
+        self.lock = threading.Lock()
+
+    def get(self, lang):
+        """언어의 작업 풀 (처음 요청할 때 만듦)"""
+        with self.lock:
+            executor = self.executors.get(lang)
+            if executor is None:
+                executor = self.executors[lang] = ThreadPoolExecutor(
+                    max_workers=self.workers_per_language, thread_name_prefix=f"translate-{lang}")
+            return executor
+
+    def close(self):
+        """모든 작업 풀 종료 (진행 중인 번역은 끝날 때까지 대기)"""
+        with self.lock:
+            executors = list(self.executors.values())
+            self.executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class TranslationBatcher:
+    def __init__(self, translate_func, fallback_func, cache=None,
+                 max_chars=DEFAULT_MAX_BATCH_CHARS, max_items=DEFAULT_MAX_BATCH_ITEMS, batch_func=None,
+                 failure_func=None):
+        """
+        translate_func(text, target_lang): 번역 결과 문자열 반환 (실패 시 예외 발생)
+        fallback_func(text, target_lang): 개별 번역 (실패 시에도 대체 문자열 반환)
+        batch_func(texts, target_lang): 텍스트 목록을 한 번에 번역하여 같은 순서의 목록 반환 (선택)
+        failure_func(texts, target_lang, error): 요청 과다로 포기한 묶음의 실패 대체 문자열 목록 반환
+                                               (선택, 없으면 요청 과다도 개별 번역으로 대체)
+        """
+        self.translate_func = translate_func
+        self.fallback_func = fallback_func
+        self.batch_func = batch_func
+        self.failure_func = failure_func
+        self.cache = cache
+        self.max_chars = max_chars
+        self.max_items = max_items
+
+    def plan(self, texts, target_lang):
+        """캐시 조회 후 남은 텍스트를 번역 단위로 분할
+
+        반환값: (캐시에서 찾은 결과, 번역 단위 목록)
+        """
+        results = {}
+        pending = []
+
+        # 중복 제거 및 캐시 조회
+        for text in dict.fromkeys(texts):
+            if self.cache:
+                cached = self.cache.get(text, target_lang)
+                if cached is not None:
+                    results[text] = cached
+                    continue
+            pending.append(text)
+
+        batches, singles = pack_batches(pending, self.max_chars, self.max_items)
+        units = batches + [[text] for text in singles]
+
+        return results, units
+
+    def translate(self, texts, target_lang):
+        """텍스트 목록 번역 (입력 순서대로 결과 반환)"""
+        results, units = self.plan(texts, target_lang)
+
+        for unit in units:
+            results.update(self.translate_batch(unit, target_lang))
+
+        return [results[text] for text in texts]
+
+    def translate_languages(self, texts, languages, workers_per_language=DEFAULT_WORKERS_PER_LANGUAGE,
+                            executors=None):
+        """모든 언어를 동시에 번역
+
+        executors: 재사용할 언어별 작업 풀 (LanguageExecutors, 없으면 이번 호출에만 쓸 풀을 만들고 닫음)
+        반환값: {언어 코드: 입력 순서대로 정렬된 번역 목록}
+        """
+        if executors is None:
+            with LanguageExecutors(workers_per_language) as executors:
+                return self.translate_languages(texts, languages, executors=executors)
+
+        pending = {}
+        for lang in languages:
+            results, units = self.plan(texts, lang)
+            executor = executors.get(lang)
+            futures = [executor.submit(self.translate_batch, unit, lang) for unit in units]
+            pending[lang] = (results, futures)
+
+        translations = {}
+        for lang in languages:
+            results, futures = pending[lang]
+            for future in futures:
+                results.update(future.result())
+            translations[lang] = [results[text] for text in texts]
+
+        return translations
+
+    def translate_batch(self, batch, target_lang):
+        """한 묶음 번역 (번호가 어긋나면 개별 번역으로 대체, 확인된 결과만 캐시에 저장)"""
+        if len(batch) == 1:
+            return {batch[0]: self.fallback_func(batch[0], target_lang)}
+
+        parts = None
+        try:
+            if self.batch_func:
+                parts = list(self.batch_func(batch, target_lang))
+                if len(parts) != len(batch):
+                    parts = None
+            else:
+                translated = self.translate_func(join_batch(batch), target_lang)
+                parts = split_batch_result(translated, len(batch))
+        except Exception as e:
+            # 속도 제한의 재시도로도 풀리지 않은 요청 과다를 개별 요청 수십 개로 늘리지 않고 실패로 표시
+            # (예외를 올려 보내면 페이지 전체의 결과 파일이 저장되지 않음)
+            if self.failure_func and is_throttling_error(e):
+                return dict(zip(batch, self.failure_func(batch, target_lang, e)))
+            parts = None
+
+        if parts is None:
+            return {text: self.fallback_func(text, target_lang) for text in batch}
+
+        if self.cache:
+            for text, translated_text in zip(batch, parts):
+                self.cache.set(text, target_lang, translated_text)
+
+        return dict(zip(batch, parts))
@@ -0,0 +1,181 @@
+"""
+번역 메모리 디스크 캐시
+원본 텍스트, 원본 언어, 대상 언어를 키로 번역 결과를 SQLite 파일에 저장하여
+CLI, GUI, 배치 처리에서 공유
+"""
+
+import os
+import sqlite3
+import hashlib
+import threading
+import time
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.web_text_extractor')
+DEFAULT_CACHE_PATH = os.path.join(DEFAULT_CACHE_DIR, 'translation_cache.db')
+
+# 적중할 때마다 사용 시각을 쓰지 않고 모아 두었다가 한 번에 기록
+TOUCH_FLUSH_SIZE = 1000       # 모아 둔 항목이 이만큼 쌓이면 기록
+TOUCH_FLUSH_INTERVAL = 30     # 마지막 기록 후 이 시간(초)이 지나면 기록
+
+
+class TranslationCache:
+    def __init__(self, db_path=DEFAULT_CACHE_PATH, max_entries=200000, max_age_days=180, namespace=None):
+        """
+        namespace: 번역 엔진이 다른 결과끼리 섞이지 않도록 구분 (None이면 기본 공간)
+        """
+        self.db_path = db_path
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.max_age = max_age_days * 24 * 60 * 60 if max_age_days else None
+        self.hits = 0
+        self.misses = 0
+        self.touched = {}  # 캐시 키 -> 아직 기록하지 않은 마지막 사용 시각
+        self.last_flush = time.time()
+        self.lock = threading.Lock()
+
+        cache_dir = os.path.dirname(db_path)
+        if cache_dir and not os.path.exists(cache_dir):
+            os.makedirs(cache_dir, exist_ok=True)
+
+        # 여러 작업 스레드에서 하나의 연결을 공유 (접근은 lock으로 직렬화)
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS translations (
+                cache_key TEXT PRIMARY KEY,
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                source_text TEXT NOT NULL,
+                translated_text TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations (last_used)")
+        self.conn.commit()
+
+        self.purge_expired()
+
+    def _make_key(self, text, target_lang, source_lang):
+        """캐시 키 생성 (긴 텍스트도 고정 길이 키로 저장)"""
+        raw = f"{source_lang}\x00{target_lang}\x00{text}"
+        if self.namespace:
+            raw = f"{self.namespace}\x00{raw}"
+        raw = raw.encode('utf-8')
+        return hashlib.sha256(raw).hexdigest()
+
+    def get(self, text, target_lang, source_lang='auto'):
+        """캐시된 번역 조회 (없으면 None)"""
+        key = self._make_key(text, target_lang, source_lang)
+        now = time.time()
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT translated_text, created_at FROM translations WHERE cache_key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            translated_text, created_at = row
+
+            # 오래된 번역은 만료 처리
+            if self.max_age and now - created_at > self.max_age:
+                self.conn.execute("DELETE FROM translations WHERE cache_key = ?", (key,))
+                self.conn.commit()
+                self.misses += 1
+                return None
+
+            # 조회마다 쓰기/커밋하지 않도록 사용 시각은 모아 두었다가 기록
+            self.touched[key] = now
+            if len(self.touched) >= TOUCH_FLUSH_SIZE or now - self.last_flush >= TOUCH_FLUSH_INTERVAL:
+                self._flush_touched()
+                self.conn.commit()
+            self.hits += 1
+            return translated_text
+
+    def set(self, text, target_lang, translated_text, source_lang='auto'):
+        """번역 결과 저장"""
+        key = self._make_key(text, target_lang, source_lang)
+        now = time.time()
+
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO translations "
+                "(cache_key, source_lang, target_lang, source_text, translated_text, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, source_lang, target_lang, text, translated_text, now, now)
+            )
+            self.touched.pop(key, None)
+            # 삭제할 항목을 고르기 전에 사용 시각을 반영
+            self._flush_touched()
+            self._evict_if_needed()
+            self.conn.commit()
+
+    def _flush_touched(self):
+        """모아 둔 사용 시각 기록 (lock을 잡은 상태에서 호출, 커밋은 호출한 쪽에서)"""
+        if self.touched:
+            self.conn.executemany("UPDATE translations SET last_used = ? WHERE cache_key = ?",
+                                  [(used, key) for key, used in self.touched.items()])
+            self.touched.clear()
+        self.last_flush = time.time()
+
+    def flush(self):
+        """모아 둔 사용 시각을 바로 기록"""
+        with self.lock:
+            self._flush_touched()
+            self.conn.commit()
+
+    def _evict_if_needed(self):
+        """최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 삭제 (LRU)"""
+        if not self.max_entries:
+            return
+
+        count = self.conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        if count <= self.max_entries:
+            return
+
+        # 매번 삭제가 일어나지 않도록 최대치의 90%까지 줄임
+        remove_count = count - int(self.max_entries * 0.9)
+        self.conn.execute(
+            "DELETE FROM translations WHERE cache_key IN "
+            "(SELECT cache_key FROM translations ORDER BY last_used ASC LIMIT ?)",
+            (remove_count,)
+        )
+
+    def purge_expired(self):
+        """만료된 번역 일괄 삭제"""
+        if not self.max_age:
+            return
+
+        with self.lock:
+            self.conn.execute("DELETE FROM translations WHERE created_at < ?", (time.time() - self.max_age,))
+            self.conn.commit()
+
+    def stats(self):
+        """캐시 적중/미스 통계 (작업이 끝날 때 호출되므로 모아 둔 사용 시각도 기록)"""
+        with self.lock:
+            self._flush_touched()
+            self.conn.commit()
+            size = self.conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / total) if total else 0.0,
+            'size': size
+        }
+
+    def summary(self):
+        """통계 요약 문자열"""
+        stats = self.stats()
+        return (f"번역 캐시 - 적중: {stats['hits']}개, 미스: {stats['misses']}개, "
+                f"적중률: {stats['hit_rate'] * 100:.1f}%, 저장된 항목: {stats['size']}개")
+
+    def close(self):
+        """연결 종료"""
+        with self.lock:
+            self._flush_touched()
+            self.conn.commit()
+            self.conn.close()
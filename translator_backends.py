@@ -0,0 +1,261 @@
+"""
+번역기 백엔드
+CLI, GUI, 배치 처리가 같은 인터페이스로 번역기를 호출하도록 번역 엔진을 감쌈
+- google: googletrans (네트워크 필요, 속도 제한 대상)
+- argos: Argos Translate (CTranslate2 기반 로컬 모델, CPU에서 오프라인 번역, pip install argostranslate)
+- stub: 결정적인 가짜 번역 (네트워크/모델 없이 전체 파이프라인 부하 테스트용)
+
+모든 백엔드는 translate(문자열 반환), translate_batch(목록 반환), translate_async(코루틴)를 제공하고
+호출하는 쪽은 기능 플래그(supports_batch, supports_async, requires_network 등)로 호출 방식을 정함
+"""
+
+import re
+import time
+import asyncio
+import inspect
+import threading
+from rate_limiter import ThrottledError
+
+try:
+    from googletrans import Translator
+except ImportError:
+    Translator = None
+
+try:
+    import argostranslate.translate as argos_translate
+except ImportError:
+    argos_translate = None
+
+DEFAULT_TRANSLATOR = 'google'
+
+# 한 번에 보낼 수 있는 최대 글자 수 (넘으면 문장 단위로 나눠 번역)
+GOOGLE_MAX_TEXT_LENGTH = 4000
+
+# googletrans가 요청 과다 응답을 받았을 때 내는 예외 메시지 (상태 코드 속성이 없음)
+GOOGLE_THROTTLED_PATTERN = re.compile(r'Unexpected status code "429"')
+
+# 이 도구의 언어 코드 -> Argos Translate 언어 코드
+ARGOS_LANGUAGE_CODES = {
+    'zh-cn': 'zh',
+    'zh-tw': 'zt',
+}
+
+
+class TranslatorBackend:
+    """번역기 백엔드 기본 클래스
+
+    supports_batch: translate_batch가 텍스트마다 따로 번역함 (구분자로 묶어 보낼 필요 없음)
+    supports_async: translate_async가 스레드 없이 이벤트 루프에서 바로 실행됨
+    requires_network: 원격 서비스 호출 (속도 제한과 재시도가 필요함)
+    max_text_length: 한 번에 번역할 수 있는 최대 글자 수 (None이면 제한 없음)
+    thread_safe: 인스턴스 하나를 여러 스레드가 동시에 써도 됨 (아니면 작업자마다 인스턴스를 따로 사용)
+    cache_namespace: 번역 캐시/요소 상태를 다른 엔진과 구분하는 이름 (None이면 기본 공간 사용)
+    """
+
+    name = None
+    supports_batch = False
+    supports_async = False
+    requires_network = False
+    max_text_length = None
+    thread_safe = False
+    cache_namespace = None
+
+    def translate(self, text, target_lang):
+        """텍스트 하나 번역 (번역 결과 문자열 반환, 실패 시 예외 발생)"""
+        raise NotImplementedError
+
+    def translate_batch(self, texts, target_lang):
+        """여러 텍스트 번역 (입력 순서대로 결과 목록 반환)"""
+        return [self.translate(text, target_lang) for text in texts]
+
+    async def translate_async(self, text, target_lang):
+        """비동기 번역 (기본 구현은 기본 스레드 풀에서 translate 실행)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.translate, text, target_lang)
+
+    def capabilities(self):
+        """기능 플래그"""
+        return {
+            'name': self.name,
+            'supports_batch': self.supports_batch,
+            'supports_async': self.supports_async,
+            'requires_network': self.requires_network,
+            'max_text_length': self.max_text_length,
+            'thread_safe': self.thread_safe
+        }
+
+    def close(self):
+        """사용한 자원 정리"""
+
+
+class GoogleTranslatorBackend(TranslatorBackend):
+    """googletrans 번역기
+
+    googletrans 4.x의 translate는 코루틴이므로 전용 이벤트 루프 스레드 하나에서 실행하여
+    HTTP 클라이언트를 한 루프에서만 사용하고, 3.x처럼 동기 함수이면 바로 호출
+    """
+
+    name = 'google'
+    requires_network = True
+    max_text_length = GOOGLE_MAX_TEXT_LENGTH
+
+    def __init__(self):
+        if Translator is None:
+            raise ImportError("google 번역기를 사용하려면 googletrans가 필요합니다: pip install googletrans")
+
+        self.translator = Translator()
+        self.supports_async = inspect.iscoroutinefunction(self.translator.translate)
+        self.loop = None
+        self.loop_thread = None
+        self.lock = threading.Lock()
+
+    def _get_loop(self):
+        with self.lock:
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+                self.loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+                self.loop_thread.start()
+            return self.loop
+
+    def translate(self, text, target_lang):
+        try:
+            if self.supports_async:
+                future = asyncio.run_coroutine_threadsafe(self.translator.translate(text, dest=target_lang),
+                                                          self._get_loop())
+                return future.result().text
+            return self.translator.translate(text, dest=target_lang).text
+        except Exception as e:
+            self._raise_typed(e)
+
+    async def translate_async(self, text, target_lang):
+        if not self.supports_async:
+            return await super().translate_async(text, target_lang)
+
+        future = asyncio.run_coroutine_threadsafe(self.translator.translate(text, dest=target_lang),
+                                                  self._get_loop())
+        try:
+            result = await asyncio.wrap_future(future)
+        except Exception as e:
+            self._raise_typed(e)
+        return result.text
+
+    @staticmethod
+    def _raise_typed(error):
+        """상태 코드 없이 메시지로만 알리는 요청 과다 오류는 ThrottledError로 바꿔 발생"""
+        if GOOGLE_THROTTLED_PATTERN.search(str(error)):
+            raise ThrottledError(str(error)) from error
+        raise error
+
+    def close(self):
+        with self.lock:
+            if self.loop is not None:
+                self.loop.call_soon_threadsafe(self.loop.stop)
+                self.loop_thread.join(timeout=5)
+                self.loop.close()
+                self.loop = None
+
+
+class ArgosTranslatorBackend(TranslatorBackend):
+    """Argos Translate 로컬 모델 (설치된 언어 패키지로 CPU에서 오프라인 번역)
+
+    원본 언어를 자동으로 판별하지 않으므로 source_lang으로 지정 (기본값: 한국어)
+    """
+
+    name = 'argos'
+    supports_batch = True
+    thread_safe = True  # CTranslate2 번역기는 동시 호출을 지원하므로 모델을 한 번만 불러 공유
+    cache_namespace = 'argos'
+
+    def __init__(self, source_lang='ko'):
+        if argos_translate is None:
+            raise ImportError("argos 번역기를 사용하려면 argostranslate가 필요합니다: pip install argostranslate")
+
+        self.source_lang = source_lang
+        self.translations = {}  # 대상 언어 코드 -> 불러온 번역 모델
+        self.lock = threading.Lock()
+
+    def _get_translation(self, target_lang):
+        code = ARGOS_LANGUAGE_CODES.get(target_lang, target_lang)
+
+        with self.lock:
+            translation = self.translations.get(code)
+            if translation is None:
+                languages = {language.code: language for language in argos_translate.get_installed_languages()}
+                source = languages.get(self.source_lang)
+                target = languages.get(code)
+                translation = source.get_translation(target) if source and target else None
+                if translation is None:
+                    raise ValueError(f"설치된 Argos 언어 패키지가 없습니다: {self.source_lang} -> {code}")
+                self.translations[code] = translation
+            return translation
+
+    def translate(self, text, target_lang):
+        return self._get_translation(target_lang).translate(text)
+
+    def translate_batch(self, texts, target_lang):
+        translation = self._get_translation(target_lang)
+        return [translation.translate(text) for text in texts]
+
+
+class StubTranslatorBackend(TranslatorBackend):
+    """결정적인 가짜 번역기 ("[언어 코드] 원문" 형태로 줄마다 변환)
+
+    latency를 주면 호출마다 그만큼 대기하여 번역 서비스의 응답 시간을 흉내냄
+    """
+
+    name = 'stub'
+    supports_batch = True
+    supports_async = True
+    thread_safe = True
+    cache_namespace = 'stub'
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def _convert(self, text, target_lang):
+        # 줄 단위로 변환하여 구분자로 묶어 보낸 묶음도 원래대로 나눌 수 있게 함
+        return '\n'.join(f"[{target_lang}] {line}" if line.strip() else line for line in text.split('\n'))
+
+    def translate(self, text, target_lang):
+        with self.lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return self._convert(text, target_lang)
+
+    def translate_batch(self, texts, target_lang):
+        with self.lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return [self._convert(text, target_lang) for text in texts]
+
+    async def translate_async(self, text, target_lang):
+        with self.lock:
+            self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._convert(text, target_lang)
+
+
+TRANSLATOR_BACKENDS = {
+    'google': GoogleTranslatorBackend,
+    'argos': ArgosTranslatorBackend,
+    'stub': StubTranslatorBackend,
+}
+
+
+def available_translators():
+    """현재 환경에서 사용 가능한 번역기 목록"""
+    missing = {'google': Translator is None, 'argos': argos_translate is None}
+    return [name for name in TRANSLATOR_BACKENDS if not missing.get(name)]
+
+
+def create_translator(name=DEFAULT_TRANSLATOR, **options):
+    """이름으로 번역기 백엔드 생성"""
+    backend = TRANSLATOR_BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"지원하지 않는 번역기입니다: {name} (사용 가능: {', '.join(TRANSLATOR_BACKENDS)})")
+    return backend(**options)
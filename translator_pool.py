@@ -0,0 +1,176 @@
+"""
+작업자별 번역기 풀
+번역 클라이언트(HTTP 세션 등)는 여러 스레드가 동시에 쓰면 직렬화되거나 상태가 꼬이므로,
+호출마다 쉬고 있는 인스턴스를 하나 빌려 쓰고 돌려받아 동시에 실행되는 작업자마다 별도의 클라이언트를 사용
+(스레드 안전한 백엔드는 인스턴스 하나를 공유)
+"""
+
+import asyncio
+import threading
+from contextlib import contextmanager
+from translator_backends import TranslatorBackend
+from rate_limiter import is_retryable_error, error_status
+
+
+def corrupts_client(error):
+    """호출이 실패한 인스턴스를 버려야 하는지
+
+    요청 과다(429), 시간 초과, 서버/네트워크 오류처럼 응답을 받았거나 일시적인 오류는 클라이언트가 멀쩡하므로 계속 쓰고,
+    알 수 없는 오류나 요청 도중 취소(KeyboardInterrupt, CancelledError 등)만 상태를 믿을 수 없다고 봄
+    """
+    if not isinstance(error, Exception):
+        return True
+    return not (is_retryable_error(error) or error_status(error) is not None)
+
+
+class TranslatorPool(TranslatorBackend):
+    def __init__(self, factory, max_size=None):
+        """
+        factory(): 새 번역기 백엔드 인스턴스를 만드는 함수
+        max_size: 최대 인스턴스 수 (다 쓰고 있으면 반납되거나 버려질 때까지 대기)
+                  None이면 동시에 필요한 만큼 생성 (번역을 부르는 스레드 수가 언어별 작업 풀로 이미 정해져 있으면
+                  인스턴스도 그 수를 넘지 않으므로, 작업 풀보다 작게 잡으면 작업 스레드가 클라이언트를 기다리게 됨)
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self.idle = []  # 쉬고 있는 인스턴스 (마지막에 반납한 것부터 다시 씀)
+        self.lock = threading.Lock()
+        # 인스턴스가 반납되거나 버려져 새로 만들 수 있게 되면 기다리는 스레드를 깨움
+        self.available = threading.Condition(self.lock)
+
+        self.instances = 0  # 현재 살아 있는 인스턴스 수 (빌려 간 것 포함)
+        self.checkouts = 0
+        self.discarded = 0
+
+        # 첫 인스턴스로 기능 플래그를 확인 (다른 인스턴스도 같은 백엔드)
+        first = self._create()
+        self.name = first.name
+        self.supports_batch = first.supports_batch
+        self.supports_async = first.supports_async
+        self.requires_network = first.requires_network
+        self.max_text_length = first.max_text_length
+        self.cache_namespace = first.cache_namespace
+        self.thread_safe = first.thread_safe
+        self.shared = first if first.thread_safe else None
+        if self.shared is None:
+            self.idle.append(first)
+
+    def _create(self):
+        instance = self.factory()
+        with self.lock:
+            self.instances += 1
+        return instance
+
+    def acquire(self):
+        """쉬고 있는 인스턴스를 빌림 (없으면 새로 만들거나, 최대 개수에 이르렀으면 반납되거나 버려질 때까지 대기)"""
+        return self._try_acquire(wait=True)
+
+    def _try_acquire(self, wait=False):
+        """인스턴스를 빌림 (wait가 아니면 기다리지 않고, 최대 개수에 이르러 빌릴 수 없으면 None)"""
+        with self.available:
+            while True:
+                if self.shared is not None:
+                    self.checkouts += 1
+                    return self.shared
+                if self.idle:
+                    self.checkouts += 1
+                    return self.idle.pop()
+                if self.max_size is None or self.instances < self.max_size:
+                    # 만드는 동안 다른 스레드가 한도를 넘지 않도록 미리 셈
+                    self.instances += 1
+                    self.checkouts += 1
+                    break
+                if not wait:
+                    return None
+                self.available.wait()
+
+        try:
+            return self.factory()
+        except Exception:
+            with self.available:
+                self.instances -= 1
+                self.available.notify()
+            raise
+
+    def release(self, instance, failed=False):
+        """인스턴스 반납 (failed: 상태를 믿을 수 없는 인스턴스이므로 닫고 버림)"""
+        if instance is self.shared:
+            return
+
+        if failed:
+            with self.available:
+                self.instances -= 1
+                self.discarded += 1
+                # 자리가 났으므로 기다리는 스레드가 새 인스턴스를 만들 수 있음
+                self.available.notify()
+            try:
+                instance.close()
+            except Exception:
+                pass
+            return
+
+        with self.available:
+            self.idle.append(instance)
+            self.available.notify()
+
+    @contextmanager
+    def checkout(self):
+        """with 블록 동안 인스턴스 하나를 빌려 씀"""
+        instance = self.acquire()
+        try:
+            yield instance
+        except BaseException as e:
+            self.release(instance, failed=corrupts_client(e))
+            raise
+        self.release(instance)
+
+    def translate(self, text, target_lang):
+        with self.checkout() as translator:
+            return translator.translate(text, target_lang)
+
+    def translate_batch(self, texts, target_lang):
+        with self.checkout() as translator:
+            return translator.translate_batch(texts, target_lang)
+
+    async def translate_async(self, text, target_lang):
+        # 반납을 기다리는 동안 스레드를 막지 않도록 이벤트 루프에서 잠깐씩 쉬며 다시 시도
+        # (쉬고 있는 인스턴스뿐 아니라 버려진 자리에 새로 만드는 것도 다시 확인)
+        translator = self._try_acquire()
+        while translator is None:
+            await asyncio.sleep(0.005)
+            translator = self._try_acquire()
+
+        try:
+            result = await translator.translate_async(text, target_lang)
+        except BaseException as e:
+            self.release(translator, failed=corrupts_client(e))
+            raise
+        self.release(translator)
+        return result
+
+    def stats(self):
+        """인스턴스/대여 통계"""
+        with self.lock:
+            return {
+                'created': self.instances + self.discarded,
+                'live': self.instances,
+                'checkouts': self.checkouts,
+                'discarded': self.discarded
+            }
+
+    def summary(self):
+        """통계 요약 문자열"""
+        stats = self.stats()
+        return (f"번역기 풀 - 인스턴스: {stats['live']}개 (누적 생성 {stats['created']}개, 폐기 {stats['discarded']}개), "
+                f"대여: {stats['checkouts']}회")
+
+    def close(self):
+        """모든 인스턴스 닫기"""
+        if self.shared is not None:
+            self.shared.close()
+            return
+
+        with self.lock:
+            instances, self.idle = self.idle, []
+        for instance in instances:
+            instance.close()
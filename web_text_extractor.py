@@ -1,20 +1,68 @@
 import requests
-from bs4 import BeautifulSoup, Comment
-import openpyxl
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
-from googletrans import Translator
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
 import re
 from urllib.parse import urljoin, urlparse
 import os
+import argparse
 from datetime import datetime
+from functools import partial
+from translation_cache import TranslationCache
+from translation_batch import TranslationBatcher, LanguageExecutors, DEFAULT_WORKERS_PER_LANGUAGE
+from html_extraction import extract_dom_elements, supports_incremental, DEFAULT_PARSER
+from http_fetcher import HttpFetcher
+from boilerplate_index import BoilerplateIndex
+from encoding_detection import EncodingResolver
+from rate_limiter import AdaptiveRateLimiter
+from translator_pool import TranslatorPool
+from translator_backends import create_translator, available_translators, DEFAULT_TRANSLATOR
+from pipeline_profiler import PipelineProfiler, save_report, default_profile_path
+from streaming_pipeline import bounded_map, chunked, prefetch, DEFAULT_PREFETCH_DEPTH
+from gui_events import GuiEventQueue, DEFAULT_POLL_INTERVAL_MS, DEFAULT_LOG_MAX_LINES
+from output_writers import create_output_writer, format_from_path, format_extension, available_formats, DEFAULT_ROW_CHUNK_SIZE
+
+# 번역 실패 시 결과 대신 기록하는 문자열의 시작 부분
+TRANSLATION_FAILED_PREFIX = "[번역 실패:"
+
+# 여러 URL을 동시에 가져오고 파싱하는 작업자 수
+DEFAULT_URL_WORKERS = 4
+MAX_URL_WORKERS = 32
 
 class WebTextExtractor:
-    def __init__(self):
-        self.translator = Translator()
+    def __init__(self, translator=DEFAULT_TRANSLATOR, profile=False, cprofile=False, url_workers=DEFAULT_URL_WORKERS):
+        """
+        profile: 작업마다 단계별 시간을 측정하여 로그에 요약하고 결과 파일 옆에 JSON으로 저장
+        cprofile: 함수별 cProfile 결과도 수집
+        url_workers: 동시에 가져오고 파싱할 URL 수 기본값 (화면에서 바꿀 수 있음)
+        """
+        # 동시에 번역하는 작업자마다 별도의 번역기 인스턴스를 빌려 씀
+        # (번역은 언어별 작업 풀에서만 실행되므로 인스턴스는 언어당 번역 작업자 수 x 언어 수를 넘지 않음)
+        self.translator = TranslatorPool(partial(create_translator, translator))
+        # 언어별 번역 스레드가 공유하는 번역 요청 속도 제한 (429/일시적 오류는 재시도, 네트워크 번역기만 사용)
+        self.rate_limiter = AdaptiveRateLimiter()
+        # 번역 엔진이 다르면 캐시와 이전 추출 결과를 공유하지 않음
+        namespace = self.translator.cache_namespace
+        self.cache = TranslationCache(namespace=namespace)
+        self.translation_workers = DEFAULT_WORKERS_PER_LANGUAGE
+        # 모든 묶음의 번역이 함께 쓰는 언어별 작업 풀 (묶음마다 새로 만들지 않음)
+        self.language_executors = LanguageExecutors(self.translation_workers)
+        self.fetcher = HttpFetcher(namespace=f"gui-{namespace}" if namespace else 'gui')
+        self.html_parser = DEFAULT_PARSER
+        self.encoding_resolver = EncodingResolver()  # 호스트별로 판별한 인코딩을 기억
+        self.row_chunk_size = DEFAULT_ROW_CHUNK_SIZE  # 번역 후 바로 결과 파일로 내보내는 행 수
+        self.pipeline_depth = DEFAULT_PREFETCH_DEPTH  # 쓰기를 기다리며 미리 번역해 두는 최대 묶음 수
+        self.profile = profile or cprofile
+        self.cprofile = cprofile
+        self.profiler = PipelineProfiler(enabled=False)
+        # 작업 스레드는 이 큐에 이벤트만 넣고, 위젯은 메인 루프에서만 갱신
+        self.events = GuiEventQueue(DEFAULT_LOG_MAX_LINES)
+        self.url_workers = url_workers
+        self.cancel_event = threading.Event()  # 설정되면 새 URL은 가져오지 않고 이미 가져온 결과만 저장
+        self.stop_event = threading.Event()  # 설정되면 번역도 멈추고 이미 번역한 행까지만 저장
+        # 작업마다 새로 만듦 (여러 페이지에 반복되는 공통 문구를 세어 선택적으로 출력에서 제외)
+        # 같은 문구의 번역은 번역 캐시가 재사용하므로 색인에는 번역을 기억하지 않음
+        self.boilerplate = BoilerplateIndex()
         self.setup_gui()
         
     def setup_gui(self):
@@ -50,6 +98,20 @@ class WebTextExtractor:
         self.url_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         url_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        # 동시 처리 URL 수
+        workers_frame = ttk.Frame(url_frame)
+        workers_frame.pack(fill=tk.X, pady=(5, 0))
+        
+        ttk.Label(workers_frame, text="동시 처리 URL 수:").pack(side=tk.LEFT)
+        self.url_workers_var = tk.IntVar(value=self.url_workers)
+        ttk.Spinbox(workers_frame, from_=1, to=MAX_URL_WORKERS, textvariable=self.url_workers_var,
+                    width=5).pack(side=tk.LEFT, padx=(5, 0))
+        
+        # 여러 페이지에 반복되는 공통 문구(메뉴, 쿠키 안내, 바닥글 등) 제외
+        self.skip_boilerplate_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(workers_frame, text="여러 페이지에 반복되는 공통 문구 제외",
+                       variable=self.skip_boilerplate_var).pack(side=tk.LEFT, padx=(20, 0))
+        
         # 번역 언어 선택
         lang_frame = ttk.LabelFrame(main_frame, text="번역 언어 선택", padding="10")
         lang_frame.pack(fill=tk.X, pady=(0, 10))
@@ -72,7 +134,7 @@ class WebTextExtractor:
         file_path_frame = ttk.Frame(file_frame)
         file_path_frame.pack(fill=tk.X)
         
-        ttk.Label(file_path_frame, text="엑셀 파일 경로:").pack(anchor=tk.W)
+        ttk.Label(file_path_frame, text="결과 파일 경로 (.xlsx, .jsonl, .parquet, .arrow):").pack(anchor=tk.W)
         path_frame = ttk.Frame(file_path_frame)
         path_frame.pack(fill=tk.X, pady=(5, 0))
         
@@ -90,6 +152,9 @@ class WebTextExtractor:
                                         command=self.start_extraction, style='Accent.TButton')
         self.extract_button.pack(side=tk.LEFT, padx=(0, 10))
         
+        self.cancel_button = ttk.Button(button_frame, text="취소", command=self.cancel_extraction, state='disabled')
+        self.cancel_button.pack(side=tk.LEFT)
+        
         ttk.Button(button_frame, text="종료", command=self.root.quit).pack(side=tk.RIGHT)
         
         # 진행 상황
@@ -99,7 +164,7 @@ class WebTextExtractor:
         self.progress_var = tk.StringVar(value="대기 중...")
         ttk.Label(progress_frame, textvariable=self.progress_var).pack(anchor=tk.W)
         
-        self.progress_bar = ttk.Progressbar(progress_frame, mode='indeterminate')
+        self.progress_bar = ttk.Progressbar(progress_frame, mode='determinate')
         self.progress_bar.pack(fill=tk.X, pady=(10, 0))
         
         # 로그 텍스트 영역
@@ -113,62 +178,96 @@ class WebTextExtractor:
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        self.root.after(DEFAULT_POLL_INTERVAL_MS, self.process_events)
+        
     def browse_file(self):
         """파일 경로 선택 다이얼로그"""
         filename = filedialog.asksaveasfilename(
             defaultextension=".xlsx",
-            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")]
+            filetypes=[(f"{name} files", f"*{format_extension(name)}") for name in available_formats()] + [("All files", "*.*")]
         )
         if filename:
             self.file_path_var.set(filename)
     
     def log_message(self, message):
-        """로그 메시지 추가"""
+        """로그 메시지 추가 (어느 스레드에서나 호출 가능, 화면에는 메인 루프가 모아서 반영)"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
+        self.events.log(f"[{timestamp}] {message}")
+    
+    def set_status(self, text):
+        """진행 상황 문자열 변경 (어느 스레드에서나 호출 가능)"""
+        self.events.status(text)
+    
+    def set_progress(self, value, maximum):
+        """진행 막대 변경 (어느 스레드에서나 호출 가능)"""
+        self.events.progress(value, maximum)
+    
+    def process_events(self):
+        """작업 스레드가 보낸 이벤트를 모아서 위젯에 반영 (메인 루프에서 주기적으로 실행)"""
+        for kind, value in self.events.drain():
+            if kind == 'log':
+                self.append_log(value)
+            elif kind == 'status':
+                self.progress_var.set(value)
+            elif kind == 'progress':
+                current, maximum = value
+                self.progress_bar.configure(maximum=max(maximum, 1), value=current)
+            elif kind == 'dialog':
+                dialog_kind, title, message = value
+                if dialog_kind == 'error':
+                    messagebox.showerror(title, message)
+                else:
+                    messagebox.showinfo(title, message)
+            elif kind == 'finished':
+                self.extract_button.config(state='normal')
+                self.cancel_button.config(state='disabled')
+        
+        # 아직 남은 이벤트가 있으면 바로 이어서 처리
+        delay = 1 if not self.events.empty() else DEFAULT_POLL_INTERVAL_MS
+        self.root.after(delay, self.process_events)
+    
+    def append_log(self, lines):
+        """로그 창에 여러 줄을 한 번에 추가하고 최대 줄 수를 넘으면 오래된 줄부터 삭제"""
+        self.log_text.insert(tk.END, '\n'.join(lines) + '\n')
+        line_count = int(self.log_text.index('end-1c').split('.')[0]) - 1
+        if line_count > DEFAULT_LOG_MAX_LINES:
+            self.log_text.delete('1.0', f"{line_count - DEFAULT_LOG_MAX_LINES + 1}.0")
         self.log_text.see(tk.END)
-        self.root.update()
     
     def extract_text_from_url(self, url):
         """웹페이지에서 텍스트 추출"""
         try:
             self.log_message(f"웹페이지 접속 중: {url}")
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            response.encoding = response.apparent_encoding
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 불필요한 태그 및 주석 제거
-            for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-                tag.decompose()
-                
-            # HTML 주석 제거
-            for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-                comment.extract()
-            
-            # 텍스트 추출 - DOM 순서대로 개별 요소별로
-            text_elements = []
-            seen_texts = set()  # 중복 방지용
+            # 조각 단위로 파싱할 수 있으면 본문을 다 받지 않고 바로 파서에 넣음
+            stream = supports_incremental(self.html_parser)
+            with self.profiler.stage('fetch', url):
+                response = self.fetcher.fetch(url, stream=stream)
             
-            # 메인 컨텐츠 영역 찾기
-            main_content = soup.find('main') or soup.find('article') or soup.find(class_=re.compile(r'content|main|body', re.I)) or soup.find('body')
+            # 변경되지 않은 페이지는 파싱하지 않고 이전 추출 결과 재사용
+            if response.status_code == 304:
+                previous = self.fetcher.get_previous(url)
+                if previous:
+                    self.log_message(f"변경 없음 (304): 이전에 추출한 {len(previous['elements'])}개의 텍스트 요소를 재사용합니다.")
+                    return previous['elements']
             
-            if main_content:
-                # DOM을 순회하면서 개별 텍스트 요소 추출
-                self._extract_text_recursively(main_content, text_elements, seen_texts)
+            response.raise_for_status()
+            content_type = response.headers.get('Content-Type')
+            if stream:
+                chunks = self.fetcher.iter_body(response, partial(self.profiler.count, 'bytes_fetched', url=url))
+                html = self.encoding_resolver.decode_chunks(url, chunks, content_type)
             else:
-                # main_content를 찾지 못한 경우 전체 body에서 추출
-                body = soup.find('body')
-                if body:
-                    self._extract_text_recursively(body, text_elements, seen_texts)
+                self.profiler.count('bytes_fetched', len(response.content), url)
+                with self.profiler.stage('decode', url):
+                    html = self.encoding_resolver.decode(url, response.content, content_type)
+            
+            # 텍스트 추출 - DOM 순서대로 개별 요소별로 (트리를 한 번만 순회)
+            # 조각 단위로 받으면 본문 받기와 디코딩도 이 단계에서 일어남
+            with self.profiler.stage('parse', url):
+                text_elements = extract_dom_elements(html, self.html_parser)
             
             self.log_message(f"총 {len(text_elements)}개의 텍스트 요소를 순차적으로 추출했습니다.")
+            self.fetcher.remember(url, response.headers, text_elements)
             return text_elements
             
         except requests.RequestException as e:
@@ -178,208 +277,153 @@ class WebTextExtractor:
             self.log_message(f"텍스트 추출 오류: {str(e)}")
             return []
     
-    def _extract_text_recursively(self, element, text_elements, seen_texts):
-        """재귀적으로 텍스트 추출"""
-        for child in element.children:
-            # 텍스트 노드인 경우 (순수 텍스트) - 주석 제외
-            if child.name is None:
-                # HTML 주석인지 확인
-                if isinstance(child, Comment):
-                    continue
-                    
-                text = str(child).strip()
-                if text and len(text) > 2 and not text.startswith('<'):
-                    text_clean = text.replace('\n', ' ').replace('\t', ' ').strip()
-                    # 공백만 있거나 특수문자만 있는 경우 제외
-                    if text_clean and text_clean not in seen_texts and len(text_clean.replace(' ', '')) > 1:
-                        text_elements.append({
-                            'type': 'content',
-                            'tag': 'text',
-                            'text': text_clean
-                        })
-                        seen_texts.add(text_clean)
-            
-            # HTML 요소인 경우
-            elif child.name:
-                # 제목 태그들은 개별적으로 처리
-                if child.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                    text = child.get_text(strip=True)
-                    if text and len(text) > 1:
-                        text_clean = text.replace('\n', ' ').replace('\t', ' ').strip()
-                        if text_clean and text_clean not in seen_texts:
-                            text_elements.append({
-                                'type': 'heading',
-                                'tag': child.name,
-                                'text': text_clean
-                            })
-                            seen_texts.add(text_clean)
-                
-                # 단락, 리스트 항목 등은 개별적으로 처리
-                elif child.name in ['p', 'li', 'td', 'th', 'blockquote', 'pre']:
-                    text = child.get_text(strip=True)
-                    if text and len(text) > 2:
-                        text_clean = text.replace('\n', ' ').replace('\t', ' ').strip()
-                        # 중복 체크
-                        is_duplicate = False
-                        for seen_text in seen_texts:
-                            if text_clean == seen_text:
-                                is_duplicate = True
-                                break
-                            # 포함 관계 체크 (90% 이상 겹치면 중복으로 간주)
-                            if text_clean in seen_text and len(text_clean) > len(seen_text) * 0.9:
-                                is_duplicate = True
-                                break
-                            if seen_text in text_clean and len(seen_text) > len(text_clean) * 0.9:
-                                # 더 긴 텍스트로 교체
-                                text_elements[:] = [elem for elem in text_elements if elem['text'] != seen_text]
-                                seen_texts.discard(seen_text)
-                                break
-                        
-                        if not is_duplicate and text_clean:
-                            text_elements.append({
-                                'type': 'content',
-                                'tag': child.name,
-                                'text': text_clean
-                            })
-                            seen_texts.add(text_clean)
-                
-                # 인라인 요소들 - 텍스트가 의미있는 경우만
-                elif child.name in ['span', 'a', 'strong', 'b', 'em', 'i', 'code', 'label']:
-                    text = child.get_text(strip=True)
-                    if text and len(text) > 1:
-                        text_clean = text.replace('\n', ' ').replace('\t', ' ').strip()
-                        if text_clean and text_clean not in seen_texts:
-                            # 너무 짧거나 의미없는 텍스트 제외
-                            if len(text_clean) > 2 and not text_clean.isdigit():
-                                text_elements.append({
-                                    'type': 'content',
-                                    'tag': child.name,
-                                    'text': text_clean
-                                })
-                                seen_texts.add(text_clean)
-                
-                # div, section 등 컨테이너 요소는 재귀적으로 처리
-                elif child.name in ['div', 'section', 'article', 'ul', 'ol', 'table', 'tbody', 'thead', 'tr']:
-                    # 하위 요소들을 재귀적으로 처리
-                    self._extract_text_recursively(child, text_elements, seen_texts)
-    
     def translate_text(self, text, target_lang):
-        """텍스트 번역"""
+        """텍스트 번역 (번역 캐시 우선 조회)"""
+        cached = self.cache.get(text, target_lang)
+        if cached is not None:
+            return cached
+        
+        return self._translate_uncached(text, target_lang)
+    
+    def translate_texts(self, texts, target_lang):
+        """여러 텍스트를 묶음 단위로 번역 (입력 순서대로 결과 반환)"""
+        return self._create_batcher().translate(texts, target_lang)
+    
+    def translate_languages(self, texts, languages):
+        """모든 언어를 동시에 번역 ({언어 코드: 번역 목록} 반환)"""
+        return self._create_batcher().translate_languages(texts, languages, executors=self.language_executors)
+    
+    def _create_batcher(self):
+        batch_func = self._translate_batch_raw if self.translator.supports_batch else None
+        return TranslationBatcher(self._translate_raw, self._translate_uncached, cache=self.cache, batch_func=batch_func,
+                                  failure_func=self._translation_failed)
+    
+    def _translate_uncached(self, text, target_lang):
+        """캐시 조회 없이 번역하고 성공한 결과만 캐시에 저장"""
         try:
-            # 번역할 텍스트가 너무 길면 분할
-            if len(text) > 4000:
-                # 문장 단위로 분할
-                sentences = re.split(r'[.!?。！？]', text)
-                translated_sentences = []
-                
-                current_chunk = ""
-                for sentence in sentences:
-                    if len(current_chunk + sentence) < 4000:
-                        current_chunk += sentence + "."
-                    else:
-                        if current_chunk:
-                            result = self.translator.translate(current_chunk, dest=target_lang)
-                            translated_sentences.append(result.text)
-                        current_chunk = sentence + "."
-                
-                if current_chunk:
-                    result = self.translator.translate(current_chunk, dest=target_lang)
-                    translated_sentences.append(result.text)
-                
-                return " ".join(translated_sentences)
-            else:
-                result = self.translator.translate(text, dest=target_lang)
-                return result.text
+            translated_text = self._translate_raw(text, target_lang)
+            self.cache.set(text, target_lang, translated_text)
+            return translated_text
                 
         except Exception as e:
-            self.log_message(f"번역 오류 ({target_lang}): {str(e)}")
-            return f"[번역 실패: {text[:50]}...]"
+            return self._translation_failed([text], target_lang, e)[0]
     
-    def create_excel_file(self, text_elements, file_path):
-        """엑셀 파일 생성"""
-        try:
-            self.log_message("엑셀 파일 생성 중...")
-            
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "웹 텍스트 추출 결과"
+    def _translation_failed(self, texts, target_lang, error):
+        """번역하지 못한 텍스트의 대체 문자열 목록 (캐시에 저장되지 않아 다음 작업에서 다시 번역)"""
+        count = f", {len(texts)}개 텍스트" if len(texts) > 1 else ""
+        self.log_message(f"번역 오류 ({target_lang}{count}): {str(error)}")
+        return [f"{TRANSLATION_FAILED_PREFIX} {text[:50]}...]" for text in texts]
+    
+    def _translate_raw(self, text, target_lang):
+        """번역기 호출 (실패 시 예외 발생)"""
+        # 번역할 텍스트가 너무 길면 분할
+        max_length = self.translator.max_text_length
+        if max_length and len(text) > max_length:
+            # 문장 단위로 분할
+            sentences = re.split(r'[.!?。！？]', text)
+            translated_sentences = []
             
-            # 헤더 설정
-            headers = ["번호", "URL", "유형", "태그", "원본 텍스트(한국어)"]
+            current_chunk = ""
+            for sentence in sentences:
+                if len(current_chunk + sentence) < max_length:
+                    current_chunk += sentence + "."
+                else:
+                    if current_chunk:
+                        translated_sentences.append(self._call_translator(self.translator.translate, current_chunk, target_lang))
+                    current_chunk = sentence + "."
             
-            if self.translate_english.get():
-                headers.append("영어 번역")
-            if self.translate_chinese.get():
-                headers.append("중국어 번역")
-            if self.translate_vietnamese.get():
-                headers.append("베트남어 번역")
+            if current_chunk:
+                translated_sentences.append(self._call_translator(self.translator.translate, current_chunk, target_lang))
             
-            # 헤더 스타일 설정
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+            return " ".join(translated_sentences)
+        
+        return self._call_translator(self.translator.translate, text, target_lang)
+    
+    def _translate_batch_raw(self, texts, target_lang):
+        """목록 번역을 지원하는 번역기로 여러 텍스트를 한 번에 번역 (실패 시 예외 발생)"""
+        return self._call_translator(self.translator.translate_batch, texts, target_lang)
+    
+    def _call_translator(self, func, payload, target_lang):
+        """네트워크 번역기는 공유 속도 제한을 거쳐 호출 (payload: 텍스트 또는 텍스트 목록)"""
+        chars = len(payload) if isinstance(payload, str) else sum(len(text) for text in payload)
+        self.profiler.count('chars_sent', chars)
+        self.profiler.count(f'chars_sent:{target_lang}', chars)
+        
+        with self.profiler.stage(f'translate:{target_lang}'):
+            if self.translator.requires_network:
+                return self.rate_limiter.call(func, payload, target_lang)
+            return func(payload, target_lang)
+    
+    def get_selected_languages(self):
+        """선택된 번역 언어 목록 (언어 코드, 헤더 이름)"""
+        languages = []
+        if self.translate_english.get():
+            languages.append(('en', "영어 번역"))
+        if self.translate_chinese.get():
+            languages.append(('zh-cn', "중국어 번역"))
+        if self.translate_vietnamese.get():
+            languages.append(('vi', "베트남어 번역"))
+        return languages
+    
+    def create_output_file(self, text_elements, file_path):
+        """결과 파일 생성 (파일 확장자로 형식 판단: .xlsx, .jsonl, .parquet, .arrow)
+        
+        text_elements: 텍스트 요소를 차례로 내보내는 iterable (생성기면 나오는 대로 번역하여 바로 저장)
+        반환값: 저장한 행 수 (저장할 행이 없으면 0, 오류가 나면 None)
+        """
+        try:
+            output_format = format_from_path(file_path)
+            self.log_message(f"결과 파일 생성 중 ({output_format})...")
             
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = Alignment(horizontal='center')
+            languages = self.get_selected_languages()
+            codes = [lang for lang, header in languages]
+            self.log_message(f"번역 언어: {len(languages)}개")
             
-            # 데이터 입력 및 번역
-            total_elements = len(text_elements)
+            def translated_chunks():
+                # 묶음 단위로 모든 언어를 동시에 번역 (번역 중단을 요청하면 더 번역하지 않음)
+                for chunk in chunked(text_elements, self.row_chunk_size):
+                    if self.stop_event.is_set():
+                        return
+                    texts = [element.text for element in chunk]
+                    self.profiler.count('chars_translated', sum(len(text) for text in texts) * len(codes))
+                    with self.profiler.stage('translate'):
+                        translations = self.translate_languages(texts, codes)
+                    yield chunk, translations
             
-            for idx, element in enumerate(text_elements, 1):
-                self.progress_var.set(f"처리 중... ({idx}/{total_elements})")
-                self.log_message(f"처리 중: {idx}/{total_elements} - {element['text'][:50]}...")
-                
-                row = idx + 1
-                ws.cell(row=row, column=1, value=idx)
-                ws.cell(row=row, column=2, value=element.get('url', ''))
-                ws.cell(row=row, column=3, value=element['type'])
-                ws.cell(row=row, column=4, value=element['tag'])
-                ws.cell(row=row, column=5, value=element['text'])
-                
-                col = 6
+            rows = 0
+            with create_output_writer(output_format, file_path, codes,
+                                      language_headers=[header for lang, header in languages],
+                                      include_url=True) as writer:
+                # 다음 묶음을 가져오고 번역하는 동안 번역이 끝난 행은 바로 내보냄
+                for chunk, translations in prefetch(translated_chunks(), self.pipeline_depth):
+                    with self.profiler.stage('write'):
+                        for offset, element in enumerate(chunk):
+                            # 선택된 언어의 번역 결과
+                            writer.write(element, [translations[lang][offset] for lang in codes])
+                    # 로그는 행마다가 아니라 묶음마다 한 줄만 남김 (행이 많아도 로그 이벤트가 쌓이지 않음)
+                    self.log_message(f"처리 중: {rows + 1}-{rows + len(chunk)} - {chunk[0].text[:50]}...")
+                    rows += len(chunk)
+                    self.set_status(f"처리 중... ({rows}개 텍스트 저장)")
                 
-                # 영어 번역
-                if self.translate_english.get():
-                    english_text = self.translate_text(element['text'], 'en')
-                    ws.cell(row=row, column=col, value=english_text)
-                    col += 1
+                if self.stop_event.is_set():
+                    self.log_message(f"번역 중단됨: {rows}개 행까지 저장합니다.")
+                if not rows:
+                    return 0
                 
-                # 중국어 번역
-                if self.translate_chinese.get():
-                    chinese_text = self.translate_text(element['text'], 'zh-cn')
-                    ws.cell(row=row, column=col, value=chinese_text)
-                    col += 1
-                
-                # 베트남어 번역
-                if self.translate_vietnamese.get():
-                    vietnamese_text = self.translate_text(element['text'], 'vi')
-                    ws.cell(row=row, column=col, value=vietnamese_text)
-                    col += 1
-            
-            # 열 너비 자동 조정
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)  # 최대 50자로 제한
-                ws.column_dimensions[column_letter].width = adjusted_width
+                # 파일 저장
+                with self.profiler.stage('write'):
+                    writer.save()
+            self.log_message(f"결과 파일이 저장되었습니다: {file_path}")
+            self.log_message(self.cache.summary())
+            self.log_message(self.boilerplate.summary())
+            if self.translator.requires_network:
+                self.log_message(self.rate_limiter.summary())
             
-            # 파일 저장
-            wb.save(file_path)
-            self.log_message(f"엑셀 파일이 저장되었습니다: {file_path}")
-            
-            return True
+            return rows
             
         except Exception as e:
-            self.log_message(f"엑셀 파일 생성 오류: {str(e)}")
-            return False
+            self.log_message(f"결과 파일 생성 오류: {str(e)}")
+            return None
     
     def start_extraction(self):
         """텍스트 추출 및 번역 시작"""
@@ -406,65 +450,137 @@ class WebTextExtractor:
             messagebox.showerror("오류", "출력 파일 경로를 설정해주세요.")
             return
         
+        try:
+            url_workers = int(self.url_workers_var.get())
+        except (tk.TclError, ValueError):
+            url_workers = 0
+        if not 1 <= url_workers <= MAX_URL_WORKERS:
+            messagebox.showerror("오류", f"동시 처리 URL 수는 1~{MAX_URL_WORKERS} 사이로 입력해주세요.")
+            return
+        
         # 별도 스레드에서 실행
+        self.cancel_event.clear()
+        self.stop_event.clear()
         self.extract_button.config(state='disabled')
-        self.progress_bar.start()
+        self.cancel_button.config(state='normal')
+        self.progress_bar.configure(value=0)
         
-        thread = threading.Thread(target=self.extract_and_translate, args=(urls, file_path))
+        thread = threading.Thread(target=self.extract_and_translate,
+                                  args=(urls, file_path, url_workers, self.skip_boilerplate_var.get()))
         thread.daemon = True
         thread.start()
     
-    def extract_and_translate(self, urls, file_path):
-        """실제 추출 및 번역 작업 수행"""
-        try:
-            all_results = []
-            total_urls = len(urls)
-            
-            # 각 URL별로 텍스트 추출
-            for idx, url in enumerate(urls, 1):
-                self.progress_var.set(f"URL 처리 중... ({idx}/{total_urls}): {url}")
-                self.log_message(f"=== URL {idx}/{total_urls} 처리 시작: {url} ===")
-                
-                text_elements = self.extract_text_from_url(url)
-                
-                if text_elements:
-                    # URL 정보를 각 텍스트 요소에 추가
-                    for element in text_elements:
-                        element['url'] = url
-                        element['url_index'] = idx
-                    all_results.extend(text_elements)
-                    self.log_message(f"URL {idx} 처리 완료: {len(text_elements)}개 텍스트 추출")
-                else:
-                    self.log_message(f"URL {idx} 처리 실패: 텍스트를 추출할 수 없습니다.")
+    def cancel_extraction(self):
+        """진행 중인 작업 취소
+
+        처음 누르면 새 URL은 가져오지 않고 이미 가져온 URL의 결과만 번역하여 저장하고,
+        한 번 더 누르면 번역도 멈추고 이미 번역한 행까지만 저장
+        """
+        if not self.cancel_event.is_set():
+            self.cancel_event.set()
+            self.log_message("취소 요청: 새 URL은 가져오지 않고 이미 가져온 결과만 저장합니다. (한 번 더 누르면 번역도 중단)")
+        else:
+            self.stop_event.set()
+            self.log_message("번역 중단 요청: 이미 번역한 행까지만 저장합니다.")
+    
+    def extract_urls(self, urls, max_workers):
+        """여러 URL을 동시에 가져오고 파싱하여 텍스트 요소를 URL 순서(url_index)대로 하나씩 내보내는 생성기
+        
+        동시에 처리하거나 번역을 기다리는 URL은 작업자 수의 몇 배까지만 두므로
+        번역/쓰기가 밀리면 가져오기도 기다리고, URL이 많아도 그만큼의 결과만 메모리에 남음
+        """
+        total_urls = len(urls)
+        completed = 0
+        extracted = 0
+        
+        self.set_status(f"URL 처리 중... (0/{total_urls})")
+        self.set_progress(0, total_urls)
+        
+        def extract(item):
+            idx, url = item
+            self.log_message(f"=== URL {idx}/{total_urls} 처리 시작: {url} ===")
+            text_elements = self.extract_text_from_url(url)
+            if not text_elements:
+                return text_elements, 0
+            # 번역 단계가 요소를 꺼내 가기 전에 추출한 작업 스레드에서 바로 공통 문구를 셈
+            # (제외하도록 선택했으면 뺀 요소만 번역)
+            return self.boilerplate.observe(url, text_elements), len(text_elements)
+        
+        # 취소하면 새 URL은 제출하지 않고 이미 제출한 URL의 결과만 내보냄
+        for (idx, url), future in bounded_map(extract, enumerate(urls, 1), max_workers,
+                                              should_stop=self.cancel_event.is_set):
+            text_elements, extracted_count = future.result()
+            completed += 1
             
-            if not all_results:
-                self.progress_var.set("모든 URL에서 텍스트 추출 실패")
-                messagebox.showerror("오류", "모든 웹페이지에서 텍스트를 추출할 수 없습니다.")
-                return
+            if extracted_count:
+                extracted += 1
+                self.log_message(f"URL {idx} 처리 완료: {extracted_count}개 텍스트 추출")
+                # URL 정보를 각 텍스트 요소에 추가
+                for element in text_elements:
+                    element.url = url
+                    element.url_index = idx
+                    yield element
+            else:
+                self.log_message(f"URL {idx} 처리 실패: 텍스트를 추출할 수 없습니다.")
             
-            # 엑셀 파일 생성
-            success = self.create_excel_file(all_results, file_path)
+            self.set_progress(completed, total_urls)
+        
+        if completed < total_urls:
+            self.log_message(f"취소됨: {extracted}/{total_urls}개 URL의 결과만 저장합니다.")
+    
+    def extract_and_translate(self, urls, file_path, max_workers=None, skip_boilerplate=False):
+        """실제 추출 및 번역 작업 수행 (가져오기/파싱 → 번역 → 쓰기를 동시에 진행)"""
+        # 작업마다 새로 측정
+        self.profiler = PipelineProfiler(enabled=self.profile, cprofile=self.cprofile)
+        self.boilerplate = BoilerplateIndex(skip=skip_boilerplate)
+        try:
+            total_urls = len(urls)
+            rows = self.create_output_file(self.extract_urls(urls, max_workers or self.url_workers), file_path)
+            save_report(self.profiler, default_profile_path(file_path), log=self.log_message)
             
-            if success:
-                self.progress_var.set("작업 완료!")
-                messagebox.showinfo("완료", f"작업이 완료되었습니다!\n처리된 URL: {total_urls}개\n추출된 텍스트: {len(all_results)}개\n파일 경로: {file_path}")
+            if rows is None:
+                self.set_status("작업 실패")
+                self.events.dialog('error', "오류", "결과 파일 생성 중 오류가 발생했습니다.")
+            elif rows and self.cancel_event.is_set():
+                self.set_status("작업 취소됨 (완료된 결과 저장)")
+                self.events.dialog('info', "취소", f"작업이 취소되었습니다.\n완료된 결과를 저장했습니다.\n파일 경로: {file_path}")
+            elif rows:
+                self.set_status("작업 완료!")
+                self.events.dialog('info', "완료", f"작업이 완료되었습니다!\n처리된 URL: {total_urls}개\n추출된 텍스트: {rows}개\n파일 경로: {file_path}")
+            elif self.cancel_event.is_set():
+                self.set_status("작업 취소됨")
+                self.events.dialog('info', "취소", "작업이 취소되었습니다.\n저장된 결과가 없습니다.")
             else:
-                self.progress_var.set("작업 실패")
-                messagebox.showerror("오류", "엑셀 파일 생성 중 오류가 발생했습니다.")
+                self.set_status("모든 URL에서 텍스트 추출 실패")
+                self.events.dialog('error', "오류", "모든 웹페이지에서 텍스트를 추출할 수 없습니다.")
                 
         except Exception as e:
-            self.progress_var.set("오류 발생")
+            self.set_status("오류 발생")
             self.log_message(f"전체 작업 오류: {str(e)}")
-            messagebox.showerror("오류", f"작업 중 오류가 발생했습니다: {str(e)}")
+            self.events.dialog('error', "오류", f"작업 중 오류가 발생했습니다: {str(e)}")
         
         finally:
-            self.extract_button.config(state='normal')
-            self.progress_bar.stop()
+            self.events.finished()
     
     def run(self):
         """GUI 실행"""
         self.root.mainloop()
 
+def main():
+    parser = argparse.ArgumentParser(description="웹 텍스트 추출 및 번역 자동화 도구 (GUI)")
+    parser.add_argument('--translator', default=DEFAULT_TRANSLATOR, choices=available_translators(),
+                       help=f'번역기 백엔드 (기본값: {DEFAULT_TRANSLATOR})')
+    parser.add_argument('--profile', action='store_true',
+                       help='작업마다 단계별 시간을 측정하여 로그에 요약하고 <결과 파일 이름>_profile.json으로 저장')
+    parser.add_argument('--cprofile', action='store_true',
+                       help='--profile과 함께 함수별 cProfile 결과도 수집')
+    parser.add_argument('-w', '--url-workers', type=int, default=DEFAULT_URL_WORKERS,
+                       help=f'동시에 가져오고 파싱할 URL 수 기본값 (기본값: {DEFAULT_URL_WORKERS})')
+    args = parser.parse_args()
+    
+    app = WebTextExtractor(translator=args.translator, profile=args.profile, cprofile=args.cprofile,
+                           url_workers=args.url_workers)
+    app.run()
+
 if __name__ == "__main__":
-    app = WebTextExtractor()
-    app.run() 
\ No newline at end of file
+    main() 
\ No newline at end of file